@@ -0,0 +1,42 @@
+# Multi-currency benchmark
+#
+# Converts the same amounts with wordify_many_currency() as an all-dollar batch, an all-pound batch and
+# a batch mixing every registered currency, and compares them with wordify_many() on the dollars.
+# A mixed batch should run as fast as a single-currency one.
+#
+# Usage: python benchmarks/bench_currency.py [amounts]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wordify import wordify_many  # noqa: E402
+from wordify.currency import plans, wordify_many_currency  # noqa: E402
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(2023)
+    # Whole units, so every amount is valid in every currency, and all different, so the batches' dedupe
+    # helps none of them more than the others
+    amounts = [f"{amount:,}" for amount in rng.sample(range(10 ** 6, 10 ** 12), count)]
+    codes = sorted(plans)
+
+    batches = {
+        "USD": [(amount, "USD") for amount in amounts],
+        "GBP": [(amount, "GBP") for amount in amounts],
+        "mixed": [(amount, rng.choice(codes)) for amount in amounts],
+    }
+
+    start = time.perf_counter()
+    wordify_many(amounts)
+    print(f"{'wordify_many':<28} {count / (time.perf_counter() - start):>12,.0f} amounts/sec")
+    for name, rows in batches.items():
+        start = time.perf_counter()
+        wordify_many_currency(rows)
+        print(f"{'wordify_many_currency ' + name:<28} {count / (time.perf_counter() - start):>12,.0f} amounts/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Cold-start import benchmark
+#
+# Short-lived workers pay for importing wordify every time they start.  This imports it in fresh
+# interpreters under "python -X importtime" and reports the cumulative import time of the package,
+# next to the old way of getting wordify() (through the pytest-laden test module).
+#
+# Usage: python benchmarks/bench_import.py [runs]
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# label: statement
+IMPORTS = {
+    "import wordify": "import wordify",
+    "wordify + cache": "from wordify import WordifyCache",
+    "wordify + reference": "from wordify import wordify_reference",
+    "import test_wordify": "import test_wordify",
+}
+
+
+def import_us(statement):
+    """ Microseconds of top-level imports while running `statement` in a fresh interpreter """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package", top-level imports aren't indented
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    print(f"{'import':<22} {'median ms':>10} {'min ms':>8}")
+    for label, statement in IMPORTS.items():
+        # Less whatever the interpreter imports on its own at startup
+        times = [(import_us(statement) - import_us("pass")) / 1000 for _ in range(runs)]
+        print(f"{label:<22} {statistics.median(times):>10.1f} {min(times):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
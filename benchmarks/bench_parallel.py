@@ -0,0 +1,50 @@
+# python -m wordify --workers benchmark
+#
+# Writes a file of random amounts, then converts it with 1, 2, 4, ... worker processes (up to the
+# core count) and reports rows/sec and the speedup over a single worker.
+#
+# Usage: python benchmarks/bench_parallel.py [rows] [max workers]
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wordify.parallel import convert_file  # noqa: E402
+
+
+def write_amounts(path, rows, rng):
+    with open(path, "w") as file:
+        for _ in range(rows):
+            file.write(f"${rng.randrange(100_000_000_000) / 100:,.2f}\n")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != max_workers:
+        worker_counts.append(max_workers)
+
+    with tempfile.TemporaryDirectory() as directory:
+        amounts = os.path.join(directory, "amounts.txt")
+        write_amounts(amounts, rows, random.Random(2023))
+
+        single = None
+        print(f"{rows} rows, {os.cpu_count()} cores")
+        for workers in worker_counts:
+            with open(os.devnull, "w") as output, open(os.devnull, "w") as rejects:
+                start = time.perf_counter()
+                convert_file(amounts, output, rejects, workers=workers)
+                rate = rows / (time.perf_counter() - start)
+            single = single or rate
+            print(f"{workers:>4} workers: {rate:12,.0f} rows/sec  ({rate / single:.2f}x, "
+                  f"{rate / single / workers:.0%} of linear)")
+
+
+if __name__ == "__main__":
+    main()
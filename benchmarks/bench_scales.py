@@ -0,0 +1,33 @@
+# Big-number wordify() benchmark
+#
+# Times wordify() on random amounts with 1 to 22 three-digit groups of dollars (up to 66 digits) and
+# reports the cost per call and per group.  The per-group cost should stay flat as amounts get longer.
+#
+# Usage: python benchmarks/bench_scales.py [amounts per size]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wordify import scales, wordify  # noqa: E402
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(2023)
+
+    print(f"{'digits':>6} {'groups':>6} {'us/call':>9} {'us/group':>9}")
+    for groups in range(1, len(scales) + 2):
+        digits = groups * 3
+        amounts = [f"{rng.randrange(10 ** (digits - 1), 10 ** digits)}.{rng.randrange(100):02}" for _ in range(count)]
+
+        start = time.perf_counter()
+        for amount in amounts:
+            wordify(amount)
+        per_call = (time.perf_counter() - start) / count * 1e6
+        print(f"{digits:>6} {groups:>6} {per_call:>9.2f} {per_call / groups:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# wordify_cents() benchmark
+#
+# Converts a NumPy int64 array of random cents with wordify_cents(), and compares it against the
+# per-element loop it replaces: wordify(str(x / 100)) for every element.  The loop is timed on a slice
+# of the array and scaled up, since it takes minutes at 10M elements.
+#
+# Usage: python benchmarks/bench_vectorized.py [elements] [loop sample]
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wordify import wordify  # noqa: E402
+from wordify.vectorized import wordify_cents  # noqa: E402
+
+
+def main():
+    elements = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    sample = min(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000, elements)
+    cents = numpy.random.default_rng(2023).integers(0, 100_000_000_000, elements, dtype=numpy.int64)
+
+    start = time.perf_counter()
+    words = wordify_cents(cents)
+    vectorized = elements / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    looped = [wordify(str(number / 100)) for number in cents[:sample]]
+    loop = sample / (time.perf_counter() - start)
+
+    assert looped == words[:sample], "wordify_cents() disagrees with wordify()"
+    print(f"{elements} elements (loop timed on {sample})")
+    print(f"{'wordify(str(x / 100)) loop':>28}: {loop:12,.0f} elements/sec")
+    print(f"{'wordify_cents':>28}: {vectorized:12,.0f} elements/sec  ({vectorized / loop:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# wordify_many() benchmark
+#
+# Converts the same 1M-row batch three ways and reports rows/sec for each:
+#   - a plain loop over wordify_reference() (the original Decimal implementation)
+#   - a plain loop over wordify()
+#   - a single wordify_many() call
+#
+# Two batches are timed: uniform random amounts (every row distinct) and a skewed, invoice-like
+# batch where a few thousand common amounts make up most of the rows.
+#
+# Usage: python benchmarks/bench_wordify_many.py [rows]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wordify import wordify, wordify_many, wordify_reference  # noqa: E402
+
+
+def uniform_batch(rows, rng):
+    return [f"${rng.randrange(100_000_000_000) / 100:,.2f}" for _ in range(rows)]
+
+
+def skewed_batch(rows, rng):
+    common = [f"${rng.randrange(1_000_000) / 100:,.2f}" for _ in range(5000)]
+    return [
+        rng.choice(common) if rng.random() < 0.9 else f"${rng.randrange(100_000_000_000) / 100:,.2f}"
+        for _ in range(rows)
+    ]
+
+
+def rows_per_second(convert, batch):
+    start = time.perf_counter()
+    convert(batch)
+    return len(batch) / (time.perf_counter() - start)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(2023)
+
+    for name, batch in (("uniform", uniform_batch(rows, rng)), ("skewed", skewed_batch(rows, rng))):
+        reference = rows_per_second(lambda b: [wordify_reference(n) for n in b], batch)
+        loop = rows_per_second(lambda b: [wordify(n) for n in b], batch)
+        many = rows_per_second(wordify_many, batch)
+        print(f"{name:>8} ({rows} rows)")
+        print(f"{'wordify_reference loop':>26}: {reference:12,.0f} rows/sec")
+        print(f"{'wordify loop':>26}: {loop:12,.0f} rows/sec")
+        print(f"{'wordify_many':>26}: {many:12,.0f} rows/sec  "
+              f"({many / reference:.1f}x reference, {many / loop:.1f}x wordify)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# wordify_into() benchmark
+#
+# Writes the words for a batch of amounts into an in-memory output, one line per amount, three ways:
+# wordify() and a write per line, wordify_into() straight into an io.StringIO, and the bulk exporter's
+# bytes path (wordify().encode() against wordify_bytes_into() a bytearray).
+#
+# Usage: python benchmarks/bench_writer.py [amounts]
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wordify import wordify  # noqa: E402
+from wordify.writer import wordify_bytes_into, wordify_into  # noqa: E402
+
+
+def join_text(amounts):
+    output = io.StringIO()
+    for amount in amounts:
+        output.write(wordify(amount) + "\n")
+    return output
+
+
+def into_text(amounts):
+    output = io.StringIO()
+    for amount in amounts:
+        wordify_into(output, amount)
+        output.write("\n")
+    return output
+
+
+def join_bytes(amounts):
+    output = bytearray()
+    for amount in amounts:
+        output += wordify(amount).encode("ascii")
+        output += b"\n"
+    return output
+
+
+def into_bytes(amounts):
+    output = bytearray()
+    for amount in amounts:
+        wordify_bytes_into(output, amount)
+        output += b"\n"
+    return output
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(2023)
+    amounts = [f"${rng.randrange(10 ** rng.randint(1, 15)):,}.{rng.randrange(100):02}" for _ in range(count)]
+
+    for name, convert in (("wordify + write", join_text), ("wordify_into", into_text),
+                          ("wordify + encode", join_bytes), ("wordify_bytes_into", into_bytes)):
+        start = time.perf_counter()
+        convert(amounts)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20} {count / elapsed:>12,.0f} amounts/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# Load generator for the wordify service
+#
+# Sends GET /wordify requests at a fixed rate over keep-alive connections and reports the latency
+# percentiles.  Requests are sent on a schedule whether or not earlier ones have been answered (pipelined on
+# each connection, while a separate reader collects the responses), and each one's latency is counted from
+# when it was due to be sent, so a slow server can't hide its queueing behind a slower request rate.
+#
+# Usage:
+#   python benchmarks/loadgen.py                                  # start a service on a free port and load it
+#   python benchmarks/loadgen.py --port 8080 --rate 10000 --duration 10 --connections 64
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+from urllib.parse import quote
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+async def read_response(reader):
+    """ (status, body) of one HTTP response """
+
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    length = 0
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return int(status_line.split(" ")[1]), await reader.readexactly(length)
+
+
+async def connection(host, port, requests, start, interval, latencies, statuses):
+    """ Send `requests` (pre-encoded) one every `interval` seconds from `start`, on one keep-alive connection
+
+        Sending never waits for responses; they come back in order, and are matched to when each was due.
+    """
+
+    loop = asyncio.get_running_loop()
+    reader, writer = await asyncio.open_connection(host, port)
+    due_times = deque()
+
+    async def send():
+        for number, request in enumerate(requests):
+            due = start + number * interval
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            due_times.append(due)
+            writer.write(request)
+
+    sender = asyncio.create_task(send())
+    try:
+        for _ in requests:
+            status, _ = await read_response(reader)
+            latencies.append(loop.time() - due_times.popleft())
+            statuses[status] = statuses.get(status, 0) + 1
+        await sender
+    finally:
+        sender.cancel()
+        writer.close()
+
+
+async def fetch_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /stats HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+    _, body = await read_response(reader)
+    writer.close()
+    return json.loads(body)
+
+
+async def run(host, port, rate, duration, connections, seed):
+    rng = random.Random(seed)
+    total = int(rate * duration)
+    requests = [
+        f"GET /wordify?amount={quote(f'${rng.randrange(10 ** 9):,}.{rng.randrange(100):02}')} HTTP/1.1\r\n"
+        f"Host: {host}\r\n\r\n".encode("latin-1")
+        for _ in range(total)
+    ]
+
+    # Connection n sends requests n, n + connections, n + 2 * connections, ... so together they keep the rate
+    latencies, statuses = [], {}
+    start = asyncio.get_running_loop().time() + 0.1
+    began = time.perf_counter()
+    await asyncio.gather(*(
+        connection(host, port, requests[n::connections], start + n / rate, connections / rate, latencies, statuses)
+        for n in range(connections)
+    ))
+    elapsed = time.perf_counter() - began - 0.1
+    return latencies, statuses, elapsed, await fetch_stats(host, port)
+
+
+def start_service(args):
+    """ Start "python -m wordify.service" on a free port; returns (process, port) """
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "wordify.service", "--port", "0", "--batch-size", str(args.batch_size),
+         "--batch-delay", str(args.batch_delay)],
+        cwd=ROOT, stderr=subprocess.PIPE, text=True,
+    )
+    line = process.stderr.readline()   # "wordify service listening on host:port"
+    return process, int(line.rsplit(":", 1)[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load the wordify service at a fixed request rate.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="an already running service (default: start one)")
+    parser.add_argument("--rate", type=float, default=10000, help="requests per second (default: 10000)")
+    parser.add_argument("--duration", type=float, default=5, help="seconds to send for (default: 5)")
+    parser.add_argument("--connections", type=int, default=64, help="keep-alive connections (default: 64)")
+    parser.add_argument("--batch-size", type=int, default=256, help="for the started service (default: 256)")
+    parser.add_argument("--batch-delay", type=float, default=0.002, help="for the started service (default: 0.002)")
+    parser.add_argument("--seed", type=int, default=2023)
+    args = parser.parse_args()
+
+    process = None
+    port = args.port
+    if port is None:
+        process, port = start_service(args)
+    try:
+        latencies, statuses, elapsed, stats = asyncio.run(
+            run(args.host, port, args.rate, args.duration, args.connections, args.seed))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+
+    def ms(fraction):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+    print(f"target {args.rate:,.0f} req/s, sent {len(latencies):,} in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} req/s) over {args.connections} connections")
+    print(f"status codes: {dict(sorted(statuses.items()))}")
+    print(f"latency ms: p50 {ms(0.50):.2f}  p90 {ms(0.90):.2f}  p99 {ms(0.99):.2f}  max {latencies[-1] * 1000:.2f}")
+    if stats["batches"]:
+        print(f"server: {stats['batches']:,} batches, {stats['amounts'] / stats['batches']:.1f} amounts per batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+# wordify benchmark suite and regression gate
+#
+# Runs wordify() and intToWord() over fixed-seed generated workloads and measures, for each:
+#   - ops/sec over the whole workload
+#   - p50 / p99 latency of a single call, in nanoseconds
+#   - peak memory allocated while converting the workload, in KiB
+#
+# Timings are the median of --repeats passes, taken round-robin over the workloads so a slow patch of the
+# machine doesn't land on just one of them.  Each timing's "noise" is the passes' median absolute deviation,
+# as a fraction of their median.
+#
+# Results are written as JSON.  Given a stored baseline, the suite fails (exit status 1) when any
+# workload's ops/sec drops, or its p50 / p99 latency or peak memory grows, by more than the threshold.
+# A noisy timing (in this run or the baseline) gets three times its noise on top, up to the threshold
+# again; p99 gets twice the threshold to start with, since a tail moves more than a median does.
+# A baseline recorded with a different --rows or --seed measured different workloads, so the suite
+# refuses to compare against it (exit status 2).
+#
+# Usage:
+#   python benchmarks/suite.py                                  # compare against benchmarks/baseline.json
+#   python benchmarks/suite.py --output results.json --threshold 0.10
+#   python benchmarks/suite.py --save-baseline                  # record this machine's numbers as the baseline
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wordify import cent_limit, intToWord, wordify  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def amount(cents):
+    return f"${cents // 100:,}.{cents % 100:02}"
+
+
+def uniform(rng, rows):
+    """ Amounts spread evenly up to a billion dollars """
+    return [amount(rng.randrange(100_000_000_000)) for _ in range(rows)]
+
+
+def skewed(rng, rows):
+    """ Invoice-like: a few thousand common amounts make up 90% of the rows """
+    common = [amount(rng.randrange(1_000_000)) for _ in range(5000)]
+    return [rng.choice(common) if rng.random() < 0.9 else amount(rng.randrange(100_000_000_000)) for _ in range(rows)]
+
+
+def all_cents(rng, rows):
+    """ Less than a dollar """
+    return [f".{rng.randrange(1, 100):02}" for _ in range(rows)]
+
+
+def near_limit(rng, rows):
+    """ Just below the largest amount wordify() can convert """
+    return [amount(cent_limit - 1 - rng.randrange(100_000)) for _ in range(rows)]
+
+
+def malformed(rng, rows):
+    """ Rows wordify() refuses: not numbers, negative, too precise or too large """
+    spoilers = ("3-fiddy", "-{}", "{}.123", "{}x", "", "{}" + "0" * 66, "1.2.3")
+    return [rng.choice(spoilers).format(rng.randrange(1_000_000)) for _ in range(rows)]
+
+
+def numbers(rng, rows):
+    """ intToWord() input: 0 - 999 """
+    return [rng.randrange(1000) for _ in range(rows)]
+
+
+def convert_or_fail(numberstring):
+    try:
+        return wordify(numberstring)
+    except (ValueError, ArithmeticError) as error:
+        return error
+
+
+# name: (function, workload)
+BENCHMARKS = {
+    "wordify/uniform": (wordify, uniform),
+    "wordify/skewed": (wordify, skewed),
+    "wordify/all_cents": (wordify, all_cents),
+    "wordify/near_limit": (wordify, near_limit),
+    "wordify/malformed": (convert_or_fail, malformed),
+    "intToWord/uniform": (intToWord, numbers),
+}
+
+
+TIMINGS = ("ops_per_sec", "p50_ns", "p99_ns")
+
+
+def measure(function, inputs):
+    """ ops/sec and p50/p99 latency for calling `function` on every input, in one pass """
+
+    # Throughput: one tight loop over the whole workload
+    start = time.perf_counter()
+    for value in inputs:
+        function(value)
+    ops_per_sec = len(inputs) / (time.perf_counter() - start)
+
+    # Latency: every call timed on its own
+    clock = time.perf_counter_ns
+    latencies = []
+    for value in inputs:
+        begin = clock()
+        function(value)
+        latencies.append(clock() - begin)
+    latencies.sort()
+
+    return {
+        "ops_per_sec": round(ops_per_sec),
+        "p50_ns": latencies[len(latencies) // 2],
+        "p99_ns": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)],
+    }
+
+
+def peak_kib(function, inputs):
+    """ Everything the workload's results (and the work to make them) allocate at their peak, in KiB """
+
+    tracemalloc.start()
+    results = [function(value) for value in inputs]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del results
+    return round(peak / 1024, 1)
+
+
+def run(rows, seed, selected=None, repeats=5):
+    """ The median of `repeats` passes of every benchmark, with how much the passes vary as "noise" """
+
+    workloads = {}
+    for name, (function, workload) in BENCHMARKS.items():
+        if selected and name not in selected:
+            continue
+        workloads[name] = (function, workload(random.Random(seed), rows))
+        function(workloads[name][1][0])  # warm up
+
+    passes = {name: [] for name in workloads}
+    for _ in range(repeats):
+        for name, (function, inputs) in workloads.items():
+            passes[name].append(measure(function, inputs))
+
+    results = {}
+    for name, measured in passes.items():
+        result = {key: round(statistics.median(one[key] for one in measured)) for key in TIMINGS}
+        result["peak_kib"] = peak_kib(*workloads[name])
+        result["noise"] = {key: round(statistics.median(abs(one[key] - result[key]) for one in measured)
+                                      / result[key], 3) if result[key] else 0.0 for key in TIMINGS}
+        results[name] = result
+    return results
+
+
+def regressions(results, baseline, threshold):
+    """ Every way `results` is more than `threshold` (a fraction), plus its noise allowance, worse than `baseline` """
+
+    found = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        allowed = {key: min(3 * max(result.get("noise", {}).get(key, 0.0), before.get("noise", {}).get(key, 0.0)),
+                            threshold) for key in TIMINGS}
+        if result["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold - allowed["ops_per_sec"]):
+            found.append(f"{name}: {result['ops_per_sec']:,} ops/sec, baseline {before['ops_per_sec']:,}")
+        for key, label, unit, limit in (("p50_ns", "p50", "ns", threshold + allowed["p50_ns"]),
+                                        ("p99_ns", "p99", "ns", 2 * threshold + allowed["p99_ns"]),
+                                        ("peak_kib", "peak", " KiB", threshold)):
+            if result[key] > before[key] * (1 + limit):
+                found.append(f"{name}: {label} {result[key]:,}{unit}, baseline {before[key]:,}{unit}")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark wordify() and intToWord(), and gate on regressions.")
+    parser.add_argument("--rows", type=int, default=20000, help="calls per workload (default: 20000)")
+    parser.add_argument("--seed", type=int, default=2023, help="random seed for the workloads (default: 2023)")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="passes per benchmark; timings are their median (default: 5)")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS),
+                        help="run just this benchmark (may be repeated)")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE, help=f"baseline JSON to compare against (default: {BASELINE})")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="fail when ops/sec drops, or p50 latency or peak memory grows, by more than this "
+                             "fraction, plus up to as much again for noisy timings; p99 gets twice this "
+                             "(default: 0.20)")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    results = run(args.rows, args.seed, args.only, args.repeats)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "rows": args.rows,
+        "seed": args.seed,
+        "results": results,
+    }
+
+    print(f"{'benchmark':<20} {'ops/sec':>12} {'p50 ns':>9} {'p99 ns':>9} {'peak KiB':>10} {'noise':>6}")
+    for name, result in results.items():
+        print(f"{name:<20} {result['ops_per_sec']:>12,} {result['p50_ns']:>9,} {result['p99_ns']:>9,} "
+              f"{result['peak_kib']:>10,} {max(result['noise'].values()):>6.0%}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    for setting in ("rows", "seed"):
+        if baseline.get(setting) != report[setting]:
+            print(f"Not comparing: {args.baseline} was recorded with --{setting} {baseline.get(setting)}, "
+                  f"this run used {report[setting]}")
+            return 2
+
+    found = regressions(results, baseline["results"], args.threshold)
+    for regression in found:
+        print(f"REGRESSION {regression}")
+    if not found:
+        print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,177 +1,15 @@
 # wordify exercise
 #
-# Demonstrates a function which turns a numeric currency string into english words
+# Tests for the wordify package, which turns a numeric currency string into english words
 #
 # E.g., "$207.32" is converted to "two hundred seven dollars and thirty-two cents"
-
-# Let's give our money the respect of a proper Decimal, instead of stinky fluctuating floats
-from decimal import Decimal, InvalidOperation
+from decimal import InvalidOperation
 import pytest
 
-# Ranges define how large a number we can convert, and how each portion of the number is treated during conversion
-#   Name = what these are called
-#   Upper = the maximum value
-#   Lower = the minimum value
-#   Plural = is the name pluralized when not "1"?
-#   Mandatory = is this name mandatory even when value is 0?
-ranges = [
-    {
-        "name": "million",
-        "upper": Decimal("1000000000"),
-        "lower": Decimal("1000000"),
-        "plural": False,
-        "mandatory": False,
-    },
-    {
-        "name": "thousand",
-        "upper": Decimal("1000000"),
-        "lower": Decimal("1000"),
-        "plural": False,
-        "mandatory": False,
-    },
-    {
-        "name": "dollar",
-        "upper": Decimal("1000"),
-        "lower": Decimal("1"),
-        "plural": True,
-        "mandatory": True,
-    },
-    {
-        "name": "cent",
-        "upper": Decimal("1"),
-        "lower": Decimal("0.01"),
-        "plural": True,
-        "mandatory": False,
-    },
-]
-
-# Word Dictionaries tell us which words go with which numbers!
-words_dicts = {
-    "singles": {
-        1: "one",
-        2: "two",
-        3: "three",
-        4: "four",
-        5: "five",
-        6: "six",
-        7: "seven",
-        8: "eight",
-        9: "nine",
-        0: "zero",
-    },
-    "tens": {
-        2: "twenty",
-        3: "thirty",
-        4: "forty",
-        5: "fifty",
-        6: "sixty",
-        7: "seventy",
-        8: "eighty",
-        9: "ninety",
-    },
-    "teens": {
-        0: "ten",
-        1: "eleven",
-        2: "twelve",
-        3: "thirteen",
-        4: "fourteen",
-        5: "fifteen",
-        6: "sixteen",
-        7: "seventeen",
-        8: "eighteen",
-        9: "nineteen",
-    },
-}
-
-# Accepts an integer between 0 - 999
-#
-# Returns the english words for that number
-def intToWord(number):
-    if (number < 0) or (number > 999):
-        raise ValueError(f"Cannot convert {number} to English; only 0-999 is allowed!")
-
-    words = ""
-
-    if number == 0:
-        return words_dicts["singles"][number]
-
-    # Get digits
-    hundreds = number // 100
-    tens = (number%100) // 10
-    singles = number%10
-
-    if hundreds > 0:
-        words = " ".join((words, words_dicts["singles"][hundreds], "hundred"))
-    # If we have teens:
-    if tens == 1:
-        words = " ".join((words, words_dicts["teens"][singles]))
-    elif tens > 1:
-            words = " ".join((words, words_dicts["tens"][tens]))
-            if singles > 0:
-                words = "-".join((words, words_dicts["singles"][singles]))
-    elif singles > 0:
-        words = " ".join((words, words_dicts["singles"][singles]))
-
-    words = words.strip()
-    return str(words)
-
-# Accepts a string representing a positive number, up to 2 decimal precision, and no larger than the largest range.
-# Input is restricted as:
-# - Number must be positive
-# - Number must be smaller than the largest defined Range
-# - Optional "." denotes fractional dollars
-# - Cents precision of 0 to 2 places is permitted
-# - No non-numeric characters besides "$" and "," characters are permitted
-#
-# Returns a string describing the entire number
-def wordify(numberstring):
-    # Turn the string into a malleable decimal
-    numberstring = numberstring.replace('$', '')
-    numberstring = numberstring.replace(',', '')
-    numberstring = numberstring.strip()
-
-    num = Decimal(numberstring)
-    if num >= ranges[0]["upper"]:
-        raise ValueError(f"{numberstring} is too large for me to handle, sorry!")
-    if num < 0:
-        raise ValueError(f"{numberstring} must be positive, sorry!")
-    if num.as_tuple().exponent < -2:
-        raise ValueError(f"{numberstring} has too much precision; in 'Murka we only use 2-decimal place cents!")
-
-    # prep wordstring
-    wordstring = ""
-
-    for r in ranges:
-        # find the piece for this range
-        piece = (num % r["upper"])//r["lower"]
-
-        # If this piece is nothing, and it's not mandatory, ignore it and go to the next
-        if not (piece or r["mandatory"]):
-            continue
-
-        # Include "and" if:
-        # - we already have at least 1 piece,
-        # - the amount is > 0
-        # - and this is the last piece
-        if (len(wordstring)>0) and (num % r["lower"] == 0) and (piece):
-            wordstring = " ".join([wordstring, "and"])
-
-        # prepare the piece name
-        if r["plural"] and piece != 1:
-            piece_label = r["name"] + "s"
-        else:
-            piece_label = r["name"]
-
-        # add the piece if:
-        # - The value is >0, or
-        # - this is the first piece
-        if piece or (len(wordstring) < 1):
-            words = intToWord(piece)
-            wordstring = " ".join([wordstring, words, piece_label]).strip()
-        # Otherwise, we only need the label
-        else:
-            wordstring = " ".join([wordstring, piece_label]).strip()
-    return wordstring
+from wordify import (
+    cent_limit, ParseError, scales, WordifyCache, parse_amount, unwordify, wordify, wordify_bytes_into, wordify_into,
+    wordify_many, wordify_reference,
+)
 
 
 # Brilliant comprehensive tests
@@ -183,7 +21,7 @@ def test_3():
     assert wordify('0.33') == "zero dollars and thirty-three cents"
 def test_4():
     assert wordify('.01') == "zero dollars and one cent"
-def test_4():
+def test_4b():
     assert wordify('1.00') == "one dollar"
 def test_5():
     assert wordify('15') == "fifteen dollars"
@@ -206,8 +44,378 @@ def test_e2():
 # Too expensive for this demo
 def test_e3():
     with pytest.raises(ValueError):
-        wordify("$1000000000")
+        wordify("$1" + ",000" * 22)
 # Nobody has time for bankers precision these days.
 def test_e4():
     with pytest.raises(ValueError):
         wordify('10.123')
+# The fast path and the original must agree, word for word
+@pytest.mark.parametrize("numberstring", [
+    "0", "0.01", "1", "1.00", "1.1", "15", "20.20", "100", "101", "999.99", "1000", "1001",
+    "1234", "$1,234.56", "10000.10", "100000", "1000000", "1000000.01", "1001000", "1000005",
+    "1234567.89", "999999999.99", "-0", "-0.00",
+])
+def test_reference_matches(numberstring):
+    assert wordify(numberstring) == wordify_reference(numberstring)
+def test_reference_matches_sweep():
+    # every mix of empty, singular and plural pieces across all four ranges
+    pieces = (0, 1, 7, 999)
+    for millions in pieces:
+        for thousands in pieces:
+            for dollars in pieces:
+                for cents in (0, 1, 7, 99):
+                    numberstring = f"{millions}{thousands:03}{dollars:03}.{cents:02}"
+                    assert wordify(numberstring) == wordify_reference(numberstring)
+@pytest.mark.parametrize("numberstring, expected", [
+    ("$1,234.56", 123456), ("0", 0), (".5", 50), ("12.", 1200), ("-0", 0), (" 007.1 ", 710),
+    ("$999,999,999.99", 99999999999), ("0001000000000", 100000000000), ("9" * 66, int("9" * 66) * 100),
+    ("1" + "0" * 66, ParseError.TOO_LARGE), ("1" + "0" * 5000, ParseError.TOO_LARGE),
+    ("-3", ParseError.NEGATIVE), ("-0.001", ParseError.NEGATIVE), ("1" + "0" * 66 + ".123", ParseError.TOO_LARGE),
+    ("10.123", ParseError.TOO_PRECISE), ("0.000", ParseError.TOO_PRECISE),
+    ("3-fiddy", ParseError.NOT_A_NUMBER), ("", ParseError.NOT_A_NUMBER), (".", ParseError.NOT_A_NUMBER),
+    ("1.2.3", ParseError.NOT_A_NUMBER), ("1e3", ParseError.NOT_A_NUMBER), ("+5", ParseError.NOT_A_NUMBER),
+    ("1_000", ParseError.NOT_A_NUMBER), ("NaN", ParseError.NOT_A_NUMBER), ("Infinity", ParseError.NOT_A_NUMBER),
+    ("\u0661", ParseError.NOT_A_NUMBER), ("- 1", ParseError.NOT_A_NUMBER),
+])
+def test_parse_amount(numberstring, expected):
+    assert parse_amount(numberstring) == expected
+@pytest.mark.parametrize("numberstring, expected", [
+    ("1000000000", "one billion dollars"),
+    ("$1,001,000,000.05", "one billion one million dollars and five cents"),
+    ("2000000001000", "two trillion and one thousand dollars"),
+    ("1000000000001", "one trillion and one dollar"),
+    ("$123,456,789,012,345,678,901,234,567,890.12",
+     "one hundred twenty-three octillion four hundred fifty-six septillion seven hundred eighty-nine sextillion "
+     "twelve quintillion three hundred forty-five quadrillion six hundred seventy-eight trillion nine hundred one "
+     "billion two hundred thirty-four million five hundred sixty-seven thousand eight hundred ninety dollars "
+     "and twelve cents"),
+    ("9" * 66, " ".join(f"nine hundred ninety-nine {scale}" for scale in reversed(scales))
+     + " and nine hundred ninety-nine dollars"),
+])
+def test_big(numberstring, expected):
+    assert wordify(numberstring) == expected
+def test_many():
+    assert wordify_many(["$1,234.56", "0", "1.1", "15", "1.1", "$520.19"]) == [
+        "one thousand two hundred thirty-four dollars and fifty-six cents",
+        "zero dollars",
+        "one dollar and ten cents",
+        "fifteen dollars",
+        "one dollar and ten cents",
+        "five hundred twenty dollars and nineteen cents",
+    ]
+def test_many_errors():
+    results = wordify_many(["-3", "3-fiddy", "1" + "0" * 66, "10.123", ".", "", "7"])
+    assert isinstance(results[0], ValueError)
+    assert isinstance(results[1], InvalidOperation)
+    assert isinstance(results[2], ValueError)
+    assert isinstance(results[3], ValueError)
+    assert isinstance(results[4], InvalidOperation)
+    assert isinstance(results[5], InvalidOperation)
+    assert results[6] == "seven dollars"
+def test_many_matches_wordify():
+    numberstrings = [f"${cents / 100:,.2f}" for cents in range(0, 100_000_000_000, 9_999_991)]
+    numberstrings += ["12.", ".5", "007.10", " 42 ", "1,0,0", "999999999.99", "0000999999999"]
+    assert wordify_many(numberstrings) == [wordify_reference(n) for n in numberstrings]
+def test_many_memo():
+    numberstrings = ["$1.50", "12.34", "$1.50", "\u0661.00", "1" + "0" * 66 + ".00", "12.34"]
+    expected = [wordify_many([n])[0] for n in numberstrings[:3]]
+    for memo in (0, 1, 4096):
+        results = wordify_many(numberstrings, memo=memo)
+        assert results[:3] + results[5:] == expected + [expected[1]]
+        assert isinstance(results[3], InvalidOperation)
+        assert isinstance(results[4], ValueError)
+def test_many_not_strings():
+    results = wordify_many(["1", None, 5, ["2"], b"3", "4"])
+    assert results[0] == "one dollar" and results[5] == "four dollars"
+    assert all(isinstance(result, TypeError) for result in results[1:5])
+def test_cli_lines(tmp_path):
+    from wordify.cli import main
+    (tmp_path / "amounts.txt").write_text("$1,234.56\n3-fiddy\n1.1\r\n-3\n")
+    for mmap in ([], ["--mmap"]):
+        main([str(tmp_path / "amounts.txt"), "-o", str(tmp_path / "words.txt"),
+              "--rejects", str(tmp_path / "rejects.txt"), "--chunk-rows", "2", "-q"] + mmap)
+        assert (tmp_path / "words.txt").read_text() == (
+            "one thousand two hundred thirty-four dollars and fifty-six cents\none dollar and ten cents\n")
+        assert (tmp_path / "rejects.txt").read_text() == (
+            "2\t3-fiddy\tnot a number\n4\t-3\t-3 must be positive, sorry!\n")
+def test_cli_csv(tmp_path):
+    from wordify.cli import main
+    (tmp_path / "payments.csv").write_text('id,amount\n1,$5.00\n2,"$1,000"\n3,lots\n')
+    main([str(tmp_path / "payments.csv"), "--csv-column", "amount", "-o", str(tmp_path / "words.csv"),
+          "--rejects", str(tmp_path / "rejects.txt"), "-q"])
+    assert (tmp_path / "words.csv").read_text() == (
+        'id,amount,amount_words\n1,$5.00,five dollars\n2,"$1,000",one thousand dollars\n')
+    assert (tmp_path / "rejects.txt").read_text() == "4\tlots\tnot a number\n"
+def test_cli_csv_multiline(tmp_path):
+    from wordify.cli import main
+    # A quoted field keeps its line breaks, and a row is numbered by the line it starts on
+    (tmp_path / "payments.csv").write_bytes(b'id,note,amount\r\n1,"two\nlines",$5.00\r\n2,"a\r\nb",lots\n3,x,7\n')
+    for mmap in ([], ["--mmap"]):
+        main([str(tmp_path / "payments.csv"), "--csv-column", "amount", "-o", str(tmp_path / "words.csv"),
+              "--rejects", str(tmp_path / "rejects.txt"), "-q"] + mmap)
+        assert (tmp_path / "words.csv").read_bytes() == (
+            b'id,note,amount,amount_words\n1,"two\nlines",$5.00,five dollars\n3,x,7,seven dollars\n')
+        assert (tmp_path / "rejects.txt").read_text() == "4\tlots\tnot a number\n"
+def test_cli_workers(tmp_path):
+    from wordify.cli import main
+    amounts = [f"${cents / 100:,.2f}" for cents in range(0, 100_000_000_000, 99_999_989)]
+    (tmp_path / "amounts.txt").write_text("\n".join(amounts[:500] + ["3-fiddy", "-3"] + amounts[500:]) + "\n")
+    for workers in ("1", "2"):
+        main([str(tmp_path / "amounts.txt"), "-o", str(tmp_path / f"words{workers}.txt"), "--workers", workers,
+              "--chunk-bytes", "1000", "--rejects", str(tmp_path / f"rejects{workers}.txt"), "-q"])
+    assert (tmp_path / "words1.txt").read_text() == (tmp_path / "words2.txt").read_text()
+    assert (tmp_path / "rejects2.txt").read_text() == (
+        "501\t3-fiddy\tnot a number\n502\t-3\t-3 must be positive, sorry!\n")
+def test_cli_workers_plain_only(tmp_path):
+    from wordify.cli import main
+    (tmp_path / "payments.csv").write_text('id,amount\n1,"$5.00\n"\n')
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "payments.csv"), "--csv-column", "amount", "--workers", "2", "-q"])
+def test_cli_line_breaks(tmp_path):
+    from wordify.cli import main
+    # Only "\n" ends a line: a bare "\r", "\x0c" or "\u2028" stays in its row, in every mode
+    (tmp_path / "amounts.txt").write_bytes("1\n2\x0c3\n4\r5\n6\u20287\n8\r\n".encode("utf-8"))
+    for mode in ([], ["--mmap"], ["--workers", "2", "--chunk-bytes", "1"]):
+        main([str(tmp_path / "amounts.txt"), "-o", str(tmp_path / "words.txt"),
+              "--rejects", str(tmp_path / "rejects.txt"), "-q"] + mode)
+        assert (tmp_path / "words.txt").read_text() == "one dollar\neight dollars\n"
+        assert (tmp_path / "rejects.txt").read_bytes().decode("utf-8") == (
+            "2\t2\x0c3\tnot a number\n3\t4\r5\tnot a number\n4\t6\u20287\tnot a number\n")
+def test_cache():
+    convert = WordifyCache(maxsize=2)
+    assert convert("$1,000") == "one thousand dollars"
+    assert convert("1000") == "one thousand dollars"
+    assert convert("5") == "five dollars"
+    assert convert("6") == "six dollars"
+    assert convert("1000") == "one thousand dollars"
+    stats = convert.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 4, 2, 2)
+    assert stats.hit_rate == 0.2
+def test_cache_errors():
+    convert = WordifyCache()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            convert("-3")
+        with pytest.raises(InvalidOperation):
+            convert("3-fiddy")
+    assert convert.stats().size == 0
+def test_cents_array():
+    from wordify.vectorized import wordify_cents
+    numpy = pytest.importorskip("numpy")
+    pieces = (0, 1, 7, 999)
+    cents = [m * 100_000_000 + t * 100_000 + d * 100 + c for m in pieces for t in pieces for d in pieces for c in (0, 1, 7, 99)]
+    expected = [wordify(f"{number // 100}.{number % 100:02}") for number in cents]
+    assert wordify_cents(numpy.array(cents, dtype=numpy.int64)) == expected
+    assert wordify_cents(numpy.array(cents, dtype=numpy.uint64).reshape(16, -1)) == expected
+    big = [10 ** 16 + 1, 10 ** 17 - 1, 123_456_789_012_345_678]
+    assert wordify_cents(numpy.array(big[:2])) == [wordify(f"{number // 100}.{number % 100:02}") for number in big[:2]]
+    with pytest.raises(ValueError):
+        wordify_cents(numpy.array([5, -1]))
+    with pytest.raises(ValueError):
+        wordify_cents(numpy.array(big))
+def test_cents_sequence():
+    from wordify.vectorized import wordify_cents
+    assert wordify_cents([5, 100, 123456]) == ["zero dollars and five cents", "one dollar",
+                                                "one thousand two hundred thirty-four dollars and fifty-six cents"]
+    with pytest.raises(ValueError):
+        wordify_cents([cent_limit])
+@pytest.mark.parametrize("numberstring", [
+    "0", ".01", "1", "1.1", "15", "1001", "$1,234.56", "1000000.01", "1001000", "$123,456,789,012,345,678,901.99",
+])
+def test_unwordify(numberstring):
+    assert unwordify(wordify(numberstring), strict=True) == parse_amount(numberstring)
+def test_unwordify_lenient():
+    assert unwordify("one thousand five dollars") == 100500
+    with pytest.raises(ValueError):
+        unwordify("one thousand five dollars", strict=True)
+@pytest.mark.parametrize("text", [
+    "", "dollars", "one", "bob dollars", "one dollars", "two dollar", "one hundred hundred dollars",
+    "zero thousand dollars", "five zero dollars", "one thousand million dollars", "eleven hundred dollars",
+    "one dollar and", "one dollar and one cents", "one dollar and zero cents", "one dollar one cent",
+    "and one dollar", "one million and dollars", "fifty-six cents",
+])
+def test_unwordify_errors(text):
+    with pytest.raises(ValueError):
+        unwordify(text)
+def test_roundtrip():
+    from wordify.unwordify import roundtrip
+    failures, _ = roundtrip(2000)
+    assert failures == []
+def test_import_is_light():
+    import subprocess, sys
+    code = "import sys, wordify; print(sorted({'decimal', 'pytest', 'argparse', 'enum'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+def test_lazy_names():
+    import wordify
+    assert wordify.wordify_reference("$1,001") == wordify.wordify("$1,001")
+    assert [r["name"] for r in wordify.ranges[-2:]] == ["dollar", "cent"]
+    assert "WordifyCache" in dir(wordify)
+    with pytest.raises(AttributeError):
+        wordify.not_a_name
+@pytest.mark.parametrize("amount", ["0", ".05", "1", "1001", "$1,000,000", "1000000.01", "$207.32", "1" + "0" * 30,
+                                    "$999" + ",999" * 21 + ".99"])
+def test_into(amount):
+    import io
+    text = io.StringIO()
+    text.write("> ")
+    wordify_into(text, amount)
+    assert text.getvalue() == "> " + wordify(amount)
+    out = bytearray(b"> ")
+    wordify_bytes_into(out, amount)
+    assert out == b"> " + wordify(amount).encode("ascii")
+    binary = io.BytesIO()
+    wordify_bytes_into(binary, amount)
+    assert binary.getvalue() == wordify(amount).encode("ascii")
+    out = bytearray()
+    wordify_into(out, amount)
+    assert out.decode("ascii") == wordify(amount)
+def test_into_errors():
+    import io
+    text = io.StringIO()
+    with pytest.raises(InvalidOperation):
+        wordify_into(text, "3-fiddy")
+    with pytest.raises(ValueError):
+        wordify_into(text, "1.234")
+    out = bytearray()
+    with pytest.raises(ValueError):
+        wordify_bytes_into(out, "-5")
+    assert text.getvalue() == "" and out == b""
+def test_service():
+    import asyncio, json
+    from wordify.service import serve
+
+    async def request(reader, writer, text):
+        writer.write(text.encode("latin-1"))
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+        return int(head.split(b" ")[1]), (await reader.readexactly(length)).decode("utf-8")
+
+    async def scenario():
+        ready = asyncio.get_running_loop().create_future()
+        server = asyncio.ensure_future(serve(port=0, batch_delay=0.01, ready=ready.set_result))
+        port = await ready
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        # Several requests on one kept-alive connection
+        assert await request(reader, writer, "GET /wordify?amount=%241%2C001 HTTP/1.1\r\n\r\n") == \
+            (200, "one thousand and one dollar")
+        assert await request(reader, writer, "GET /wordify?amount=-5 HTTP/1.1\r\n\r\n") == \
+            (400, "-5 must be positive, sorry!")
+        status, body = await request(reader, writer, "POST /wordify HTTP/1.1\r\nContent-Length: 8\r\n\r\n1\nx\n.05\n")
+        assert status == 200
+        assert json.loads(body) == [{"words": "one dollar"}, {"error": "not a number"},
+                                    {"words": "zero dollars and five cents"}]
+        # Lines end at "\n" only, as they do for the command line
+        status, body = await request(reader, writer,
+                                     "POST /wordify HTTP/1.1\r\nContent-Length: 9\r\n\r\n1\r\n2\x0b3\r4\n")
+        assert json.loads(body) == [{"words": "one dollar"}, {"error": "not a number"}]
+        assert (await request(reader, writer, "GET /nope HTTP/1.1\r\n\r\n"))[0] == 404
+        status, body = await request(reader, writer, "GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n")
+        stats = json.loads(body)
+        assert stats["endpoints"]["GET /wordify"]["requests"] == 2
+        assert stats["endpoints"]["GET /wordify"]["errors"] == 1
+        assert stats["amounts"] == 7
+        assert await reader.read() == b""
+        writer.close()
+        server.cancel()
+
+    asyncio.run(scenario())
+def test_batcher_backpressure():
+    import asyncio
+    from wordify.service import MicroBatcher
+
+    async def scenario():
+        batcher = MicroBatcher(max_batch=3, max_delay=0.01, max_queue=4)
+        futures = [batcher.submit([str(n)]) for n in range(4)]
+        with pytest.raises(asyncio.QueueFull):
+            batcher.submit(["5"])
+        running = asyncio.ensure_future(batcher.run())
+        assert [(await future)[0] for future in futures] == ["zero dollars", "one dollar", "two dollars",
+                                                           "three dollars"]
+        assert batcher.batches == 2
+        running.cancel()
+
+    asyncio.run(scenario())
+def test_batcher_error(monkeypatch):
+    import asyncio
+    import wordify.service
+    from wordify.service import MicroBatcher
+
+    def broken(amounts):
+        raise RuntimeError("broken")
+
+    async def scenario():
+        batcher = MicroBatcher(max_delay=0.01)
+        running = asyncio.ensure_future(batcher.run())
+        monkeypatch.setattr(wordify.service, "wordify_many", broken)
+        with pytest.raises(RuntimeError):
+            await batcher.submit(["1"])
+        monkeypatch.undo()
+        assert await batcher.submit(["2"]) == ["two dollars"]
+        running.cancel()
+
+    asyncio.run(scenario())
+@pytest.mark.parametrize("amount, currency, words", [
+    ("$1,234.56", "USD", "one thousand two hundred thirty-four dollars and fifty-six cents"),
+    ("1001", "EUR", "one thousand and one euro"),
+    ("1.01", "GBP", "one pound and one penny"),
+    ("0.02", "GBP", "zero pounds and two pence"),
+    ("1000000", "JPY", "one million yen"),
+    ("1", "JPY", "one yen"),
+    ("3.141", "KWD", "three dinars and one hundred forty-one fils"),
+    ("1.2", "KWD", "one dinar and two hundred fils"),
+])
+def test_currency(amount, currency, words):
+    from wordify import wordify_currency
+    assert wordify_currency(amount, currency) == words
+def test_currency_matches_wordify():
+    from wordify.currency import named_words, wordify_currency
+    from wordify import cent_words, dollar_words
+    assert named_words("dollar", "dollars") == dollar_words
+    assert named_words("cent", "cents")[:100] == cent_words
+    for amount in ("0", ".05", "1", "$1,000,000.01", "999" * 22 + ".99"):
+        assert wordify_currency(amount) == wordify(amount)
+def test_currency_errors():
+    from wordify import register_currency, wordify_currency, wordify_many_currency
+    with pytest.raises(ValueError):
+        wordify_currency("1.5", "JPY")
+    with pytest.raises(ValueError):
+        wordify_currency("1.2345", "KWD")
+    with pytest.raises(KeyError):
+        wordify_currency("1", "XXX")
+    with pytest.raises(ValueError):
+        register_currency("XXX", "thing", "things", precision=2)
+    results = wordify_many_currency([("1", "XXX"), ("2", "EUR"), ("x", "GBP"), ("2", "EUR"), ("2", "GBP")])
+    assert isinstance(results[0], KeyError) and isinstance(results[2], InvalidOperation)
+    assert results[1::2] == ["two euros", "two euros"] and results[4] == "two pounds"
+    with pytest.raises(ValueError, match="JPY amounts are whole yen"):
+        wordify_currency("1.5", "JPY")
+    with pytest.raises(ValueError, match="KWD only has 3 decimal places"):
+        wordify_currency("1.2345", "KWD")
+    results = wordify_many_currency([["2", "EUR"], ("2", "EUR", "x"), None, (2, "EUR"), ("2", ["EUR"])])
+    assert results[0] == "two euros"
+    assert all(isinstance(result, TypeError) for result in results[1:])
+def test_currency_symbols():
+    from wordify import wordify_currency
+    assert wordify_currency("€1,001", "EUR") == "one thousand and one euro"
+    assert wordify_currency("£0.02", "GBP") == "zero pounds and two pence"
+    assert wordify_currency("¥5", "JPY") == "five yen"
+    assert wordify_currency("KD1.5", "KWD") == "one dinar and five hundred fils"
+    with pytest.raises(InvalidOperation, match="only digits, one '.', ',' and '€' are allowed"):
+        wordify_currency("£5", "EUR")
+    for amount, currency in (("$5", "EUR"), ("5$", "JPY"), ("€$5", "EUR")):
+        with pytest.raises(InvalidOperation, match=f"is not an amount in {currency}"):
+            wordify_currency(amount, currency)
+    assert wordify_currency("$5", "USD") == "five dollars"
+def test_currency_memo():
+    from wordify import wordify_many_currency
+    rows = [("1", "EUR"), ("2", "GBP"), ("1", "EUR"), ("$1", "EUR"), ("2", "GBP")]
+    expected = ["one euro", "two pounds", "one euro"]
+    for memo in (0, 1, 4096):
+        results = wordify_many_currency(rows, memo=memo)
+        assert results[:3] + results[4:] == expected + ["two pounds"]
+        assert isinstance(results[3], InvalidOperation)
+def test_register_currency():
+    from wordify import register_currency, wordify_currency
+    register_currency("CHF", "franc", "francs", "centime", "centimes")
+    assert wordify_currency("1.01", "CHF") == "one franc and one centime"
@@ -0,0 +1,207 @@
+import asyncio
+import random
+import logging
+from classes_simple import INITIALIZING, TESTING, ProgressDots, TestLogger, TestRunner
+
+
+class AsyncTestLogger(TestLogger):
+    """ This is the equivalent of our TestRail API interface class, for asyncio!
+
+        Same as TestLogger, but waiting on our imaginary Testrail server is an `await asyncio.sleep()`,
+        so thousands of runners can share one thread while they wait.
+    """
+
+    async def get_testrun(self, testrunner: str):
+        """ Obtain a new Testrun ID from our imaginary Testrail server """
+
+        logging.info("Getting a new TestRun ID for '%s'", testrunner, extra=self.d)
+
+        # We don't need to create more than 1 test run ID
+        if self.testrun_id:
+            logging.info("Exsqueeze me %s, but test run '%s' was already created; i'm not making another!",
+                         testrunner, self.testrun_id, extra=self.d)
+        else:
+            logging.info("Making a new run will take some time, give me a %s seconds...",
+                         self.testrun_initialize_time, extra=self.d)
+
+            # Getting a Testrun ID from our imaginary Testrail server takes time
+            for tick in range(1, self.testrun_initialize_time + 1):
+                logging.info(INITIALIZING, testrunner, ProgressDots(" initializing...", tick), extra=self.d)
+                await asyncio.sleep(self.tick)
+
+            new_id = str(int(random.random() * 1000))
+            self.testrun_id = testrunner + "_" + new_id  # Let's remember which runner's request actually make this ID
+            logging.info("Test run '%s' has been created.", self.testrun_id, extra=self.d)
+
+    async def log_results(self, testrunner: str, test_id: int, result: str):
+        """ Transmit test results to our imaginary Testrail server """
+
+        logging.info("Transmitting test results, this  will take %s second(s).", self.results_transmit_time,
+                     extra=self.d)
+        await asyncio.sleep(self.results_transmit_time * self.tick)
+        self.transmits += 1
+        self.results.append(testrunner, test_id, result)
+        logging.info("Test result '%s' for test id %s has been logged.", result, test_id, extra=self.d)
+
+
+class AsyncSafeMutexLogger(AsyncTestLogger):
+    """ The asyncio equivalent of SafeMutexLogger: only 1 runner at a time can attempt to build the testrun
+
+        The lock belongs to the logger (not the class), since an asyncio.Lock can only be used by one event loop.
+    """
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+
+    async def get_testrun(self, testrunner: str):
+        """ The wrapper will now lock "build my testrun" function so only 1 runner can attempt it at a time. """
+
+        logging.info("'%s' has requested a new test run, but will it get it?", testrunner, extra=self.d)
+
+        async with self.lock:
+            await super().get_testrun(testrunner)
+
+
+class AsyncSemaphoreLogger(AsyncSafeMutexLogger):
+    """ The asyncio equivalent of SemaphoreLogger: only 2 results are transmitted at a time """
+
+    def __init__(self):
+        super().__init__()
+        self.results_semaphore = asyncio.Semaphore(2)   # Only log 2 results at a time
+        self.results_transmit_time = 4                  # Takes a long time to transmit
+
+    async def log_results(self, testrunner: str, test_id: int, result: str):
+        """ A wrapper for transmitting test results, holding one of the semaphores while it does """
+
+        logging.info("runner '%s' wants to save test results, but first it needs a semaphore.", testrunner,
+                     extra=self.d)
+        async with self.results_semaphore:
+            await super().log_results(testrunner, test_id, result)
+        logging.info("Finished saving test results, release the semaphore kracken!", extra=self.d)
+
+
+class AsyncTestRunner(TestRunner):
+    """ This is the equivalent of a PyTest instance, for asyncio! """
+
+    async def initialize_log(self, logger: AsyncTestLogger):
+        """ Connect to the AsyncTestLogger object, and tell it to provide a Testrun ID """
+
+        self.results_logger = logger
+        logging.info("I am asking for a new Testrun ID", extra=self.d)
+        await self.results_logger.get_testrun(testrunner=self.name)
+
+    async def run_tests(self, number_of_tests: int):
+        """ Run imaginary tests, and log the results to our AsyncTestLogger """
+
+        logging.info("Starting to run %s tests", number_of_tests, extra=self.d)
+
+        for test_num in range(1, number_of_tests+1):
+            logging.info("Starting test number %s, this will take %s seconds.", test_num, self.test_time, extra=self.d)
+
+            # Running the test takes time
+            for tick in range(1, self.test_time + 1):
+                logging.info(TESTING, test_num, ProgressDots(" testing...", tick), extra=self.d)
+                await asyncio.sleep(self.tick)
+
+            # There's a lot of different possible results!
+            result = random.choice(["pass", "fail", "skip", "xfail", "timeout"])
+            logging.info("I have a test result of %s", result, extra=self.d)
+            await self.send_results_to_logger(self.name, test_num, result)
+
+    async def send_results_to_logger(self, name: str, test_num: int, result: str):
+        """ Sends test results to our imaginary Testrail server.  This is separate because it could take some time. """
+
+        await self.results_logger.log_results(name, test_num, result)
+
+
+class AsyncBatchedLogger(AsyncSafeMutexLogger):
+    """ The asyncio equivalent of BatchedLogger: results are queued, and an uploader task transmits them in batches
+
+        The uploader task starts with the first result.  `await close()` before report_results(), so everything
+        still queued gets transmitted.
+
+        If a transmit fails, the uploader keeps the error and drops every result from then on, so nobody waits
+        for it forever; close() raises the error, and log_results() refuses any more results.
+    """
+
+    def __init__(self, batch_size: int = 10, linger: float = 0.5, max_queue: int = 100):
+        super().__init__()
+        self.batch_size = batch_size
+        self.linger = linger
+        self.queue = asyncio.Queue(max_queue)
+        self.closed = False
+        self.error = None       # Why the uploader gave up, if it did
+        self.uploader = None
+
+    async def log_results(self, testrunner: str, test_id: int, result: str):
+        """ Queue test results for the uploader; only waits if the queue is full """
+
+        if self.closed:
+            raise RuntimeError("This logger has been closed; it can't log any more results!")
+        if self.error is not None:
+            raise RuntimeError("The uploader has failed; it can't log any more results!") from self.error
+        if self.uploader is None:
+            self.uploader = asyncio.create_task(self.upload_batches())
+        await self.queue.put((testrunner, test_id, result))
+        logging.info("Test result '%s' for test id %s is queued for upload.", result, test_id, extra=self.d)
+
+    async def next_batch(self):
+        """ Wait for a result, then take more until the batch is full or has lingered long enough """
+
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.linger
+        while len(batch) < self.batch_size and batch[-1] is not None:
+            try:
+                batch.append(self.queue.get_nowait())   # Don't set a timer for what's already queued
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def transmit(self, results: list):
+        """ Transmit one batch of test results to our imaginary Testrail server """
+
+        logging.info("Transmitting %s test results in one go, this will take %s second(s).", len(results),
+                     self.results_transmit_time, extra=self.d)
+        await asyncio.sleep(self.results_transmit_time * self.tick)
+        self.results.extend(results)
+        self.transmits += 1
+        logging.info("%s test results have been logged.", len(results), extra=self.d)
+
+    async def upload_batches(self):
+        """ The uploader task: transmit batches of results until closed """
+
+        while True:
+            batch = await self.next_batch()
+            stop = batch[-1] is None
+            results = batch[:-1] if stop else batch
+
+            if results and self.error is None:
+                try:
+                    await self.transmit(results)
+                except Exception as error:
+                    self.error = error
+                    logging.error("Transmitting failed, dropping every result from now on: %r", error, extra=self.d)
+            if stop:
+                return
+
+    async def close(self):
+        """ Transmit everything still queued, then stop the uploader; raises the uploader's error, if any """
+
+        if not self.closed:
+            self.closed = True
+            if self.uploader is not None:
+                stopping = asyncio.create_task(self.queue.put(None))
+                await asyncio.wait((stopping, self.uploader), return_when=asyncio.FIRST_COMPLETED)
+                stopping.cancel()       # No use waiting for room in the queue once the uploader is gone
+                await asyncio.wait((self.uploader,))
+        if self.error is not None:
+            raise self.error
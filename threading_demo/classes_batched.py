@@ -0,0 +1,111 @@
+import logging
+import queue
+import threading
+import time
+from classes_mutex import SafeMutexLogger
+
+
+class BatchedLogger(SafeMutexLogger):
+    """ This is the equivalent of our TestRail reporting class, now without making runners wait!
+
+        log_results() just puts the result on a queue and returns.  A background uploader thread takes results
+        off the queue and transmits them in batches: one transmit time covers up to `batch_size` results, and
+        a batch is sent once it is full or `linger` seconds after its first result, whichever comes first.
+
+        The queue only holds `max_queue` results; when it's full, log_results() waits for room (backpressure),
+        so a slow server can't make us use up all our memory.
+
+        If a transmit fails, the uploader keeps the error and drops every result from then on, so nobody waits
+        for it forever; flush() and close() raise the error, and log_results() refuses any more results.
+    """
+
+    def __init__(self, batch_size: int = 10, linger: float = 0.5, max_queue: int = 100):
+        self.batch_size = batch_size
+        self.linger = linger
+        self.queue = queue.Queue(max_queue)
+        self.closed = False
+        self.error = None       # Why the uploader gave up, if it did
+        self.closing = threading.Lock()     # so no result can be queued after close() has queued its None
+
+        self.uploader = threading.Thread(target=self.upload_batches, name="Uploader", daemon=True)
+        self.uploader.start()
+
+    def log_results(self, testrunner: str, test_id: int, result: str):
+        """ Queue test results for the uploader; only waits if the queue is full """
+
+        with self.closing:
+            if self.closed:
+                raise RuntimeError("This logger has been closed; it can't log any more results!")
+            if self.error is not None:
+                raise RuntimeError("The uploader has failed; it can't log any more results!") from self.error
+            self.queue.put((testrunner, test_id, result))
+        logging.info("Test result '%s' for test id %s is queued for upload.", result, test_id, extra=self.d)
+
+    def next_batch(self):
+        """ Wait for a result, then take more until the batch is full or has lingered long enough """
+
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size and batch[-1] is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def transmit(self, results: list):
+        """ Send one batch of results to our imaginary Testrail server """
+
+        logging.info("Transmitting %s test results in one go, this will take %s second(s).", len(results),
+                     self.results_transmit_time, extra=self.d)
+        time.sleep(self.results_transmit_time * self.tick)
+        self.results.extend(results)
+        self.transmits += 1
+        logging.info("%s test results have been logged.", len(results), extra=self.d)
+
+    def upload_batches(self):
+        """ The uploader thread: transmit batches of results until closed """
+
+        while True:
+            batch = self.next_batch()
+            stop = batch[-1] is None
+            results = batch[:-1] if stop else batch
+
+            if results and self.error is None:
+                try:
+                    self.transmit(results)
+                except Exception as error:
+                    self.error = error
+                    logging.error("Transmitting failed, dropping every result from now on: %r", error, extra=self.d)
+
+            for _ in batch:
+                self.queue.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        """ Wait until every result queued so far has been transmitted; raises the uploader's error, if any """
+
+        self.queue.join()
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        """ Transmit everything still queued, then stop the uploader; raises the uploader's error, if any """
+
+        with self.closing:
+            if not self.closed:
+                self.closed = True
+                self.queue.put(None)
+        self.uploader.join()
+        if self.error is not None:
+            raise self.error
+
+    def report_results(self):
+        """ Display a list of all the test results, once they've all been transmitted """
+
+        self.close()
+        super().report_results()
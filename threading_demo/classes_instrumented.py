@@ -0,0 +1,126 @@
+import logging
+import threading
+from time import perf_counter_ns
+from threading import BoundedSemaphore, Lock
+from classes_mutex import MutexLogger, SafeMutexLogger
+from classes_semaphore import SemaphoreLogger
+
+
+class InstrumentedLock:
+    """ A drop-in Lock that keeps count of how it's used, per thread
+
+        For every thread: how many times it acquired the lock, how many of those it had to wait (contention),
+        and how many nanoseconds it spent waiting for and holding the lock.  Also remembers the longest anyone
+        held it, and who.  It's all integer counters from perf_counter_ns(), cheap enough to leave on.
+    """
+
+    def __init__(self, name: str, lock=None):
+        self.name = name
+        self.lock = Lock() if lock is None else lock
+        # Keyed by the Thread itself, not its ident: a new thread can get the ident of one that has finished
+        self.threads = {}           # thread: [thread name, acquires, contended, wait ns, hold ns]
+        self.held_since = {}        # thread: when it got hold of the lock (each time), in perf_counter_ns()
+        self.longest_hold_ns = 0
+        self.longest_holder = None
+
+    def acquire(self, blocking: bool = True, timeout: float = -1):
+        thread = threading.current_thread()
+        start = perf_counter_ns()
+        acquired = self.lock.acquire(False)
+        contended = not acquired
+        if contended and blocking:
+            acquired = self.wait(timeout)
+        now = perf_counter_ns()
+
+        stats = self.threads.get(thread)
+        if stats is None:
+            stats = self.threads[thread] = [thread.name, 0, 0, 0, 0]
+        stats[2] += contended
+        stats[3] += now - start
+        if acquired:
+            stats[1] += 1
+            self.held_since.setdefault(thread, []).append(now)
+        return acquired
+
+    def wait(self, timeout: float):
+        """ Wait for the lock, for `timeout` seconds (forever if it's negative or None, as Lock.acquire() does) """
+
+        return self.lock.acquire(True, -1 if timeout is None else timeout)
+
+    def release(self):
+        now = perf_counter_ns()
+        thread = threading.current_thread()
+        starts = self.held_since.get(thread)
+        if not starts:
+            # Released by a thread that didn't acquire it; charge the hold to whoever has held it longest
+            thread, starts = min(((t, s) for t, s in self.held_since.items() if s), key=lambda item: item[1][0])
+        held = now - starts.pop()
+
+        stats = self.threads[thread]
+        stats[4] += held
+        if held > self.longest_hold_ns:
+            self.longest_hold_ns, self.longest_holder = held, stats[0]
+        self.lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def report(self):
+        """ Log how long every thread spent waiting for, and holding, this lock """
+
+        d = {'src': 'Contention'.ljust(14)}
+        logging.info("Contention on %s:", self.name, extra=d)
+        logging.info("%12s %9s %10s %8s %8s", "thread", "acquires", "contended", "wait s", "hold s", extra=d)
+        for name, acquires, contended, wait_ns, hold_ns in self.threads.values():
+            logging.info("%12s %9s %10s %8.3f %8.3f", name, acquires, contended, wait_ns / 1e9, hold_ns / 1e9,
+                         extra=d)
+        if self.longest_holder:
+            logging.info("Longest hold: %.3fs by %s", self.longest_hold_ns / 1e9, self.longest_holder, extra=d)
+
+
+class InstrumentedSemaphore(InstrumentedLock):
+    """ A drop-in BoundedSemaphore that keeps count of how it's used, per thread, like InstrumentedLock """
+
+    def __init__(self, name: str, value: int = 1):
+        super().__init__(name, BoundedSemaphore(value))
+
+    def wait(self, timeout: float):
+        """ A Semaphore takes a negative timeout as "give up now", not "wait forever" like a Lock does """
+
+        return self.lock.acquire(True, None if timeout is None or timeout < 0 else timeout)
+
+
+class InstrumentedMutexLogger(MutexLogger):
+    """ MutexLogger, keeping count of who waits for its lock """
+
+    lock = InstrumentedLock("MutexLogger.lock")
+
+    def report_results(self):
+        super().report_results()
+        self.lock.report()
+
+
+class InstrumentedSafeMutexLogger(SafeMutexLogger):
+    """ SafeMutexLogger, keeping count of who waits for its lock """
+
+    lock = InstrumentedLock("SafeMutexLogger.lock")
+
+    def report_results(self):
+        super().report_results()
+        self.lock.report()
+
+
+class InstrumentedSemaphoreLogger(SemaphoreLogger):
+    """ SemaphoreLogger, keeping count of who waits for its lock and its semaphore """
+
+    lock = InstrumentedLock("SemaphoreLogger.lock")
+    results_semaphore = InstrumentedSemaphore("SemaphoreLogger.results_semaphore", 2)
+
+    def report_results(self):
+        super().report_results()
+        self.lock.report()
+        self.results_semaphore.report()
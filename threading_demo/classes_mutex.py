@@ -14,15 +14,15 @@ class MutexLogger(TestLogger):
     def get_testrun(self, testrunner: str):
         """ The wrapper will now lock "build my testrun" function so only 1 thread can attempt it at a time. """
 
-        logging.info(f"'{testrunner}' has requested a new test run, but will it get it?", extra=self.d)
+        logging.info("'%s' has requested a new test run, but will it get it?", testrunner, extra=self.d)
 
         self.lock.acquire()
-        logging.info(f"'{testrunner}' Now has a lock on 'get_testrun''", extra=self.d)
+        logging.info("'%s' Now has a lock on 'get_testrun''", testrunner, extra=self.d)
 
         super().get_testrun(testrunner)
 
         self.lock.release()
-        logging.info(f"'{testrunner}' Has released its lock on 'get_testrun''", extra=self.d)
+        logging.info("'%s' Has released its lock on 'get_testrun''", testrunner, extra=self.d)
 
 
 class DeadlockLogger(TestLogger):
@@ -36,19 +36,19 @@ class DeadlockLogger(TestLogger):
     def get_testrun(self, testrunner: str):
         """ The wrapper will now lock "build my testrun" function so only 1 thread can attempt it at a time. """
 
-        logging.info(f"'{testrunner}' has requested a new test run, but will it get it?", extra=self.d)
+        logging.info("'%s' has requested a new test run, but will it get it?", testrunner, extra=self.d)
 
         self.lock.acquire()
-        logging.info(f"'{testrunner}' Now has a lock on 'get_testrun''", extra=self.d)
+        logging.info("'%s' Now has a lock on 'get_testrun''", testrunner, extra=self.d)
 
         if "Alpha" in testrunner:
-            logging.info(f"We crashed trying to get a test run for Alpha!", extra=self.d)
+            logging.info("We crashed trying to get a test run for Alpha!", extra=self.d)
             raise Exception("'get_testrun' ran into an error!")
 
         super().get_testrun(testrunner)
 
         self.lock.release()
-        logging.info(f"'{testrunner}' Has released its lock on 'get_testrun''", extra=self.d)
+        logging.info("'%s' Has released its lock on 'get_testrun''", testrunner, extra=self.d)
 
 
 class CrashingSafeMutexLogger(TestLogger):
@@ -64,11 +64,11 @@ class CrashingSafeMutexLogger(TestLogger):
     def get_testrun(self, testrunner: str):
         """ The wrapper will now lock "build my testrun" function so only 1 thread can attempt it at a time. """
 
-        logging.info(f"'{testrunner}' has requested a new test run, but will it get it?", extra=self.d)
+        logging.info("'%s' has requested a new test run, but will it get it?", testrunner, extra=self.d)
 
         with self.lock:
             if "Alpha" in testrunner:
-                logging.info(f"We crashed trying to get a test run for Alpha!", extra=self.d)
+                logging.info("We crashed trying to get a test run for Alpha!", extra=self.d)
                 raise Exception("'get_testrun' ran into an error!")
             super().get_testrun(testrunner)
 
@@ -86,7 +86,7 @@ class SafeMutexLogger(TestLogger):
     def get_testrun(self, testrunner: str):
         """ The wrapper will now lock "build my testrun" function so only 1 thread can attempt it at a time. """
 
-        logging.info(f"'{testrunner}' has requested a new test run, but will it get it?", extra=self.d)
+        logging.info("'%s' has requested a new test run, but will it get it?", testrunner, extra=self.d)
 
         with self.lock:
             super().get_testrun(testrunner)
@@ -0,0 +1,266 @@
+import logging
+import random
+import socket
+import socketserver
+import threading
+import time
+from contextlib import contextmanager
+from classes_mutex import SafeMutexLogger
+
+
+class StandInServer(socketserver.ThreadingTCPServer):
+    """ This is the equivalent of our Testrail server, running locally so we don't need a network
+
+        Speaks one line at a time: "RESULT <result>" is answered with "OK" after `transmit_time` seconds,
+        and "PING" with "PONG" straight away.  With `drop_chance`, it hangs up instead of answering a result
+        that often, so we can watch broken sessions get replaced.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, transmit_time: float = 1, drop_chance: float = 0.0):
+        self.transmit_time = transmit_time
+        self.drop_chance = drop_chance
+        self.d = {'src': 'Server'.ljust(14)}     # used for local logging
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.address = self.server_address
+
+    def start(self):
+        """ Serve from a background thread; returns self """
+
+        threading.Thread(target=self.serve_forever, name="Server", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class StandInHandler(socketserver.StreamRequestHandler):
+    """ One connection to the StandInServer """
+
+    def handle(self):
+        server = self.server
+        for line in self.rfile:
+            command = line.decode("utf-8").rstrip("\n")
+            if command == "PING":
+                self.wfile.write(b"PONG\n")
+            elif command.startswith("RESULT "):
+                if random.random() < server.drop_chance:
+                    logging.info("Hanging up on a session, how rude!", extra=server.d)
+                    return
+                time.sleep(server.transmit_time)
+                self.wfile.write(b"OK\n")
+            else:
+                self.wfile.write(b"ERROR\n")
+
+
+class Session:
+    """ One reusable connection to the server """
+
+    def __init__(self, address: tuple, number: int):
+        self.number = number
+        self.broken = False
+        self.checked_out = None     # when the pool last handed this session out
+        self.sock = socket.create_connection(address)
+        self.reader = self.sock.makefile("rb")
+
+    def request(self, line: str):
+        """ Send one line and return the answer; a session that fails, or gets "ERROR" back, is broken for good """
+
+        try:
+            self.sock.sendall(line.encode("utf-8") + b"\n")
+            answer = self.reader.readline().decode("utf-8").rstrip("\n")
+        except OSError as error:
+            self.broken = True
+            raise ConnectionError(f"Session {self.number} failed: {error}") from error
+        if not answer:
+            self.broken = True
+            raise ConnectionError(f"Session {self.number} was hung up on")
+        if answer == "ERROR":
+            self.broken = True
+            raise ConnectionError(f"Session {self.number} got an error back for {line.split()[0]!r}")
+        return answer
+
+    def healthy(self):
+        """ Is this session still usable?  Asks the server, if it isn't already known to be broken """
+
+        if self.broken:
+            return False
+        try:
+            return self.request("PING") == "PONG"
+        except ConnectionError:
+            return False
+
+    def close(self):
+        self.broken = True
+        self.reader.close()
+        self.sock.close()
+
+
+class PoolTimeout(TimeoutError):
+    """ No session came free in time """
+
+
+class SessionPool:
+    """ A fixed number of reusable sessions to the server, checked out one at a time with a `with` block
+
+        Replaces SemaphoreLogger's bare BoundedSemaphore: a session is always given back when the `with` block
+        ends, even if it ends with an exception, so a crash can't leak one.  Broken sessions are closed and
+        replaced instead of being handed out again.
+    """
+
+    def __init__(self, address: tuple, size: int = 2, acquire_timeout: float = None, check_health: bool = False):
+        self.address = address
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.check_health = check_health      # ping every session before handing it out?
+        self.d = {'src': 'Pool'.ljust(14)}     # used for local logging
+
+        self.condition = threading.Condition()
+        self.idle = []                         # sessions nobody has checked out
+        self.opened = 0                        # sessions open right now, idle or not
+        self.made = 0                          # sessions ever made, to number them
+        self.in_use = 0
+
+        # Metrics
+        self.started = time.monotonic()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.replaced = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.busy_seconds = 0.0
+
+    def acquire(self, timeout: float = None):
+        """ Check a session out, waiting up to `timeout` (default: the pool's acquire_timeout) for one """
+
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start = time.monotonic()
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.idle or self.opened < self.size, timeout):
+                self.timeouts += 1
+                raise PoolTimeout(f"No session came free within {timeout} second(s)")
+            self.in_use += 1
+            session = self.idle.pop() if self.idle else None
+            if session is None:
+                self.opened += 1
+
+        waited = time.monotonic() - start
+        try:
+            if session is not None and self.check_health and not session.healthy():
+                logging.info("Session %s failed its health check; replacing it", session.number, extra=self.d)
+                session.close()     # the new session below takes its place
+                with self.condition:
+                    self.replaced += 1
+                session = None
+            if session is None:
+                with self.condition:
+                    self.made += 1
+                    number = self.made
+                session = Session(self.address, number)
+        except BaseException:
+            with self.condition:   # couldn't make a session; give its place back
+                self.in_use -= 1
+                self.opened -= 1
+                self.condition.notify()
+            raise
+
+        with self.condition:
+            self.checkouts += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        session.checked_out = time.monotonic()
+        return session
+
+    def release(self, session: Session):
+        """ Give a session back; a broken one is closed, and a new one gets made when it's next needed """
+
+        busy = time.monotonic() - session.checked_out
+        if session.broken:
+            logging.info("Session %s is broken; it will be replaced", session.number, extra=self.d)
+            self.replace(session)
+        with self.condition:
+            self.in_use -= 1
+            self.busy_seconds += busy
+            if not session.broken:
+                self.idle.append(session)
+            self.condition.notify()
+
+    def replace(self, session: Session):
+        """ Close a session, making room for a new one """
+
+        session.close()
+        with self.condition:
+            self.opened -= 1
+            self.replaced += 1
+
+    @contextmanager
+    def checkout(self, timeout: float = None):
+        """ with pool.checkout() as session: ...  -- the session always comes back, whatever happens """
+
+        session = self.acquire(timeout)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def metrics(self):
+        """ How the pool has been used so far """
+
+        with self.condition:
+            uptime = time.monotonic() - self.started
+            return {
+                "size": self.size,
+                "in_use": self.in_use,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "replaced": self.replaced,
+                "mean_wait_s": self.wait_seconds / self.checkouts if self.checkouts else 0.0,
+                "max_wait_s": self.max_wait_seconds,
+                "utilization": self.busy_seconds / (self.size * uptime) if uptime else 0.0,
+            }
+
+    def close(self):
+        """ Close every idle session """
+
+        with self.condition:
+            idle, self.idle = self.idle, []
+            self.opened -= len(idle)
+        for session in idle:
+            session.close()
+
+
+class PooledLogger(SafeMutexLogger):
+    """ This is the equivalent of our TestRail reporting class, with a pool of sessions to the server!
+
+        Every result is transmitted over a session checked out of the pool, so only `pool.size` results are
+        transmitted at a time, like SemaphoreLogger, but nothing can leak a session.  A result whose session
+        breaks is tried again on another one.
+    """
+
+    attempts = 3    # How many sessions a result gets tried on
+
+    def __init__(self, pool: SessionPool):
+        self.pool = pool
+
+    def log_results(self, testrunner: str, test_id: int, result: str):
+        """ Transmit test results to our stand-in Testrail server, over a pooled session """
+
+        line = f"{testrunner.rjust(7)} {test_id}: {result}"
+        for attempt in range(1, self.attempts + 1):
+            logging.info("runner '%s' wants to save test results, so it needs a session.", testrunner, extra=self.d)
+            try:
+                with self.pool.checkout() as session:
+                    logging.info("Got session %s, transmitting...", session.number, extra=self.d)
+                    session.request(f"RESULT {line}")
+            except ConnectionError as error:
+                logging.info("%s; attempt %s of %s", error, attempt, self.attempts, extra=self.d)
+                if attempt == self.attempts:
+                    raise
+                continue
+            self.transmits += 1
+            self.results.append(testrunner, test_id, result)
+            logging.info("Test result '%s' for test id %s has been logged.", result, test_id, extra=self.d)
+            return
@@ -0,0 +1,76 @@
+import logging
+import random
+from classes_simple import TestLogger, TestRunner, local_log_setup
+
+
+class CpuTestRunner(TestRunner):
+    """ This is the equivalent of a PyTest instance whose tests keep the CPU busy, like our real ones
+
+        Sleeping doesn't hold the GIL, so sleeping tests look fine in threads; busy ones take turns.
+    """
+
+    test_work = 3_000_000   # How many sums a test does instead of sleeping
+
+    def run_tests(self, number_of_tests: int):
+        """ Run imaginary (busy) tests, and log the results to our TestLogger """
+
+        logging.info("Starting to run %s busy tests", number_of_tests, extra=self.d)
+
+        for test_num in range(1, number_of_tests+1):
+            logging.info("Starting test number %s, this will do %s sums.", test_num, self.test_work, extra=self.d)
+            total = 0
+            for number in range(self.test_work):
+                total += number
+
+            result = random.choice(["pass", "fail", "skip", "xfail", "timeout"])
+            logging.info("I have a test result of %s", result, extra=self.d)
+            self.send_results_to_logger(self.name, test_num, result)
+
+
+class QueueLogger(TestLogger):
+    """ This stands in for the TestLogger inside a worker process
+
+        The real logger lives in the parent process, which made the test run before any worker started.
+        Every worker uses that same test run ID, and sends its results to the parent through a queue.
+    """
+
+    def __init__(self, results_queue, testrun_id: str):
+        self.results_queue = results_queue
+        self.testrun_id = testrun_id
+
+    def get_testrun(self, testrunner: str):
+        """ The test run already exists; the parent made it """
+
+        logging.info("'%s' is using the shared test run '%s'", testrunner, self.testrun_id, extra=self.d)
+
+    def log_results(self, testrunner: str, test_id: int, result: str):
+        """ Hand the results to the parent's logger, which does the transmitting """
+
+        self.results_queue.put((testrunner, test_id, result))
+
+
+def collect_results(results_queue, logger: TestLogger):
+    """ Runs in a thread in the parent: passes every result from the workers to the real logger, until None """
+
+    for item in iter(results_queue.get, None):
+        logger.log_results(*item)
+
+
+worker_logger = None    # Each worker process's QueueLogger, made once when the worker starts
+
+
+def start_worker(results_queue, testrun_id: str):
+    """ Runs once in every worker process """
+
+    global worker_logger
+    local_log_setup()
+    worker_logger = QueueLogger(results_queue, testrun_id)
+
+
+def run_runner(name: str, number_of_tests: int):
+    """ Runs in a worker process: one test runner, start to finish """
+
+    testrun = CpuTestRunner(name)           # Start a new test run
+    testrun.initialize_log(worker_logger)   # connect to the worker's logger object
+    testrun.run_tests(number_of_tests)      # run tests
+    return name
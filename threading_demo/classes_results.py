@@ -0,0 +1,107 @@
+import json
+import re
+import sqlite3
+from array import array
+from threading import Lock
+
+# Every result a test can have, in the order they're numbered
+STATUSES = ("pass", "fail", "skip", "xfail", "timeout")
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+# What export_sqlite() accepts as a table name; it goes into the SQL itself, so nothing else gets through
+TABLE_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+class ResultsStore:
+    """ All the test results one TestLogger has logged, kept as columns instead of a list of strings
+
+        Runner names and test IDs are each stored once, in a table, and every result only keeps their numbers:
+        one array each for runners, tests and statuses (one byte each).  The count of every status is kept up
+        to date as results come in, so totals never need a pass over the results.  Appending is thread-safe.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.runner_names = []      # runner number: name
+        self.runner_numbers = {}    # name: runner number
+        self.test_ids = []          # test number: test ID
+        self.test_numbers = {}      # test ID: test number
+        self.runners = array("I")
+        self.tests = array("I")
+        self.statuses = array("B")
+        self.status_counts = [0] * len(STATUSES)
+
+    def append(self, testrunner: str, test_id, result: str):
+        """ Store one test result """
+
+        status = STATUS_CODES[result]   # KeyError for a result we don't know
+        with self.lock:
+            runner = self.runner_numbers.get(testrunner)
+            if runner is None:
+                runner = self.runner_numbers[testrunner] = len(self.runner_names)
+                self.runner_names.append(testrunner)
+            test = self.test_numbers.get(test_id)
+            if test is None:
+                test = self.test_numbers[test_id] = len(self.test_ids)
+                self.test_ids.append(test_id)
+
+            self.runners.append(runner)
+            self.tests.append(test)
+            self.statuses.append(status)
+            self.status_counts[status] += 1
+
+    def extend(self, rows):
+        """ Store many (testrunner, test ID, result) results """
+
+        for testrunner, test_id, result in rows:
+            self.append(testrunner, test_id, result)
+
+    def __len__(self):
+        return len(self.statuses)
+
+    def __iter__(self):
+        """ Every (testrunner, test ID, result), in the order they were logged """
+
+        with self.lock:
+            count = len(self.statuses)
+        runner_names, test_ids = self.runner_names, self.test_ids
+        for index in range(count):
+            yield runner_names[self.runners[index]], test_ids[self.tests[index]], STATUSES[self.statuses[index]]
+
+    def counts(self):
+        """ How many of each result there are: {"pass": ..., "fail": ..., ...} """
+
+        return dict(zip(STATUSES, self.status_counts))
+
+    def lines(self):
+        """ Every result, written out for a person to read """
+
+        for testrunner, test_id, result in self:
+            yield f"{testrunner.rjust(7)} {test_id}: {result}"
+
+    def export_jsonl(self, file):
+        """ Write every result as a line of JSON to an open text file; returns how many were written """
+
+        written = 0
+        for testrunner, test_id, result in self:
+            file.write(json.dumps({"runner": testrunner, "test": test_id, "result": result}) + "\n")
+            written += 1
+        return written
+
+    def export_sqlite(self, path: str, table: str = "results"):
+        """ Add every result to a table in an SQLite database, in one transaction; returns how many were added
+
+            Raises ValueError for a table name that isn't letters, digits and underscores.
+        """
+
+        if not TABLE_NAME.fullmatch(table):
+            raise ValueError(f"{table!r} isn't a table name we can use: letters, digits and underscores only!")
+        connection = sqlite3.connect(path)
+        try:
+            with connection:
+                connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (runner TEXT, test TEXT, result TEXT)")
+                cursor = connection.executemany(f"INSERT INTO {table} VALUES (?, ?, ?)",
+                                                ((runner, str(test), result) for runner, test, result in self))
+            return cursor.rowcount
+        finally:
+            connection.close()
@@ -0,0 +1,114 @@
+import json
+import logging
+import os
+import random
+import time
+from collections import deque
+from threading import Lock
+from classes_simple import TestRunner
+
+
+class DurationHistory:
+    """ How long every test took before, kept in a small JSON file between runs
+
+        Each test's duration is a moving average, so one odd run doesn't throw the schedule off for good.
+        Tests we've never seen are guessed at the average of the ones we have.
+    """
+
+    weight = 0.5    # How much the newest duration counts in the average
+
+    def __init__(self, path: str = "test_durations.json"):
+        self.path = path
+        self.lock = Lock()
+        self.durations = {}
+        if os.path.exists(path):
+            with open(path) as file:
+                self.durations = json.load(file)
+        self.total = sum(self.durations.values())   # kept up to date, so guessing a new test doesn't add them up
+
+    def estimate(self, test: str):
+        if test in self.durations:
+            return self.durations[test]
+        return self.total / len(self.durations) if self.durations else 1.0
+
+    def record(self, test: str, seconds: float):
+        with self.lock:
+            before = self.durations.get(test)
+            after = seconds if before is None else before + self.weight * (seconds - before)
+            self.durations[test] = after
+            self.total += after - (before or 0.0)
+
+    def save(self):
+        with self.lock:
+            with open(self.path, "w") as file:
+                json.dump(self.durations, file, indent=1, sort_keys=True)
+
+
+class WorkStealingScheduler:
+    """ Hands tests out to runners: longest first, and an idle runner takes work from the busiest one
+
+        Tests are dealt out up front, longest (by history) first, each to the runner with the least work so far.
+        Every runner works through its own queue from the longest end; when it runs dry, it steals the shortest
+        test from whichever runner has the most (estimated) work left.
+    """
+
+    def __init__(self, tests: list, runners: list, history: DurationHistory):
+        self.history = history
+        self.lock = Lock()
+        self.queues = {runner: deque() for runner in runners}
+        self.remaining = {runner: 0.0 for runner in runners}     # estimated seconds of work left in each queue
+        self.steals = 0
+
+        # Estimated once, so the bookkeeping holds up while the history learns new durations
+        self.estimates = {test: history.estimate(test) for test in tests}
+        for test in sorted(tests, key=self.estimates.get, reverse=True):
+            runner = min(self.remaining, key=self.remaining.get)
+            self.queues[runner].append(test)
+            self.remaining[runner] += self.estimates[test]
+
+    def next_test(self, runner: str):
+        """ The next test for `runner` to run, or None when there's nothing left anywhere """
+
+        with self.lock:
+            queue = self.queues[runner]
+            if queue:
+                test = queue.popleft()
+                self.remaining[runner] -= self.estimates[test]
+                return test
+
+            victim = max(self.remaining, key=lambda other: self.remaining[other] if self.queues[other] else -1)
+            if not self.queues[victim]:
+                return None
+            test = self.queues[victim].pop()
+            self.remaining[victim] -= self.estimates[test]
+            self.steals += 1
+        logging.info("'%s' stole test %s from '%s'", runner, test, victim, extra={'src': 'Scheduler'.ljust(14)})
+        return test
+
+
+class StealingRunner(TestRunner):
+    """ This is the equivalent of a PyTest instance that asks the scheduler for its tests, instead of a fixed count
+
+        `durations` are how long each test really takes (in seconds, each `tick` long), which the runner
+        only finds out by running them.
+    """
+
+    def run_scheduled(self, scheduler: WorkStealingScheduler, durations: dict):
+        """ Run tests from the scheduler until there are none left, recording how long each one took """
+
+        logging.info("Asking the scheduler for tests", extra=self.d)
+        while True:
+            test = scheduler.next_test(self.name)
+            if test is None:
+                return
+
+            logging.info("Starting test %s", test, extra=self.d)
+            start = time.perf_counter()
+            time.sleep(durations[test] * self.tick)
+            # With a tick of 0 nothing really sleeps, so there's nothing to time: the test took as long as it says
+            seconds = (time.perf_counter() - start) / self.tick if self.tick else durations[test]
+            scheduler.history.record(test, seconds)
+
+            result = random.choice(["pass", "fail", "skip", "xfail", "timeout"])
+            logging.info("I have a test result of %s", result, extra=self.d)
+            self.send_results_to_logger(self.name, test, result)
@@ -17,10 +17,10 @@ class SemaphoreLogger(SafeMutexLogger):
 
     def log_results(self, testrunner: str, test_id: int, result: str):
         """ A wrapper for transmitting test results, so we can add threading code later """
-        logging.info(f"runner '{testrunner}' wants to save test results, "
-                     f"this  will take {self.results_transmit_time} second(s).", extra=self.d)
+        logging.info("runner '%s' wants to save test results, this  will take %s second(s).", testrunner,
+                     self.results_transmit_time, extra=self.d)
         super().log_results(testrunner, test_id, result)
-        logging.info(f"Finished saving test results, release the semaphore kracken!", extra=self.d)
+        logging.info("Finished saving test results, release the semaphore kracken!", extra=self.d)
         self.results_semaphore.release()
 
 
@@ -35,7 +35,7 @@ class SemaphoreRunner(TestRunner):
         super().initialize_log(logger)
 
     def send_results_to_logger(self, name: str, test_num: int, result: str):
-        logging.info(f"I want to log test results, but first I need to acquire a semaphore.", extra=self.d)
+        logging.info("I want to log test results, but first I need to acquire a semaphore.", extra=self.d)
         self.results_logger.results_semaphore.acquire()
-        logging.info(f"I was given a semaphore, let's log this puppy!", extra=self.d)
+        logging.info("I was given a semaphore, let's log this puppy!", extra=self.d)
         super().send_results_to_logger(name, test_num, result)
@@ -1,6 +1,25 @@
 import random
 import time
 import logging
+import logging.handlers
+import queue
+from classes_results import ResultsStore
+
+
+# The per-second progress lines; queued_log_setup() only lets some of them through
+INITIALIZING = "Run initialization for '%s'%s"
+TESTING = "Test %s%s"
+
+
+class ProgressDots:
+    """ " testing... testing... testing...", only put together if the log line actually gets written """
+
+    def __init__(self, dots: str, count: int):
+        self.dots = dots
+        self.count = count
+
+    def __str__(self):
+        return self.dots * self.count
 
 
 class TestLogger:
@@ -10,47 +29,58 @@ class TestLogger:
     testrun_id = None                   # A new TestLogger doesn't have any run ID
     testrun_initialize_time = 4         # How long does it take to get a testrun ID?
     results_transmit_time = 1           # How long does it take to transmit a test result?
-    results = []                        # All the test results we've logged
+    transmits = 0                       # How many times we've talked to our imaginary Testrail server
+    tick = 1                            # How long is a second, while initializing or transmitting?
+
+    @property
+    def results(self):
+        """ All the test results this logger has logged; every logger has its own """
+
+        results = self.__dict__.get("_results")
+        if results is None:
+            results = self.__dict__.setdefault("_results", ResultsStore())
+        return results
 
     def get_testrun(self, testrunner: str):
         """ Obtain a new Testrun ID from our imaginary Testrail server """
 
-        logging.info(f"Getting a new TestRun ID for '{testrunner}'", extra=self.d)
+        logging.info("Getting a new TestRun ID for '%s'", testrunner, extra=self.d)
 
         # We don't need to create more than 1 test run ID
         if self.testrun_id:
-            logging.info(f"Exsqueeze me {testrunner}, but test run '{self.testrun_id}' "
-                         f"was already created; i'm not making another!", extra=self.d)
+            logging.info("Exsqueeze me %s, but test run '%s' was already created; i'm not making another!",
+                         testrunner, self.testrun_id, extra=self.d)
         else:
-            logging.info(f"Making a new run will take some time, "
-                         f"give me a {self.testrun_initialize_time} seconds...", extra=self.d)
-            progress = f"Run initialization for '{testrunner}'"
+            logging.info("Making a new run will take some time, give me a %s seconds...",
+                         self.testrun_initialize_time, extra=self.d)
 
             # Getting a Testrun ID from our imaginary Testrail server takes time
-            for _ in range(self.testrun_initialize_time):
-                progress += " initializing..."
-                logging.info(f"{progress}", extra=self.d)
-                time.sleep(1)
+            for tick in range(1, self.testrun_initialize_time + 1):
+                logging.info(INITIALIZING, testrunner, ProgressDots(" initializing...", tick), extra=self.d)
+                time.sleep(self.tick)
 
             new_id = str(int(random.random() * 1000))
             self.testrun_id = testrunner + "_" + new_id  # Let's remember which runner's request actually make this ID
-            logging.info(f"Test run '{self.testrun_id}' has been created.", extra=self.d)
+            logging.info("Test run '%s' has been created.", self.testrun_id, extra=self.d)
 
     def log_results(self, testrunner: str, test_id: int, result: str):
         """ Transmit test results to our imaginary Testrail server """
 
-        logging.info(f"Transmitting test results, "
-                     f"this  will take {self.results_transmit_time} second(s).", extra=self.d)
-        time.sleep(self.results_transmit_time)
-        self.results.append(f"{testrunner.rjust(7)} {test_id}: {result}")
-        logging.info(f"Test result '{result}' for test id {test_id} has been logged.", extra=self.d)
+        logging.info("Transmitting test results, this  will take %s second(s).", self.results_transmit_time,
+                     extra=self.d)
+        time.sleep(self.results_transmit_time * self.tick)
+        self.transmits += 1
+        self.results.append(testrunner, test_id, result)
+        logging.info("Test result '%s' for test id %s has been logged.", result, test_id, extra=self.d)
 
     def report_results(self):
         """ Display a list of all the test results """
 
-        logging.info(f"Showing Test results for run {self.testrun_id}:", extra=self.d)
-        for result in self.results:
-            logging.info(f"{result}", extra=self.d)
+        logging.info("Showing Test results for run %s:", self.testrun_id, extra=self.d)
+        for line in self.results.lines():
+            logging.info("%s", line, extra=self.d)
+        logging.info("Totals: %s", ", ".join(f"{count} {status}" for status, count in self.results.counts().items()),
+                     extra=self.d)
 
 
 class TestRunner:
@@ -58,39 +88,37 @@ class TestRunner:
 
     results_logger = None
     test_time = 3
+    tick = 1        # How long is a second, while testing?
 
     def __init__(self, name: str):
         self.d = {'src': name.rjust(14)}     # used for local logging
         self.name = name.strip()             # remember who I am!
 
-        logging.info(f"I exist!  My tests will take {self.test_time} seconds to run", extra=self.d)
+        logging.info("I exist!  My tests will take %s seconds to run", self.test_time, extra=self.d)
 
     def initialize_log(self, logger: TestLogger):
         """ Connect to the TestLogger object, and tell it to provide a Testrun ID """
 
         self.results_logger = logger
-        logging.info(f"I am asking for a new Testrun ID", extra=self.d)
+        logging.info("I am asking for a new Testrun ID", extra=self.d)
         self.results_logger.get_testrun(testrunner=self.name)
 
     def run_tests(self, number_of_tests: int):
         """ Run imaginary tests, and log the results to our TestLogger """
 
-        logging.info(f"Starting to run {number_of_tests} tests", extra=self.d)
+        logging.info("Starting to run %s tests", number_of_tests, extra=self.d)
 
         for test_num in range(1, number_of_tests+1):
-            logging.info(f"Starting test number {test_num}, this will take "
-                         f"{self.test_time} seconds.", extra=self.d)
-            progress = f"Test {test_num}"
+            logging.info("Starting test number %s, this will take %s seconds.", test_num, self.test_time, extra=self.d)
 
             # Running the test takes time
-            for _ in range(self.test_time):
-                progress += " testing..."
-                logging.info(f"{progress}", extra=self.d)
-                time.sleep(1)
+            for tick in range(1, self.test_time + 1):
+                logging.info(TESTING, test_num, ProgressDots(" testing...", tick), extra=self.d)
+                time.sleep(self.tick)
 
             # There's a lot of different possible results!
             result = random.choice(["pass", "fail", "skip", "xfail", "timeout"])
-            logging.info(f"I have a test result of {result}", extra=self.d)
+            logging.info("I have a test result of %s", result, extra=self.d)
             self.send_results_to_logger(self.name, test_num, result)
 
     def send_results_to_logger(self, name: str, test_num: int, result: str):
@@ -101,3 +129,49 @@ class TestRunner:
 
 def local_log_setup():
     logging.basicConfig(format='%(asctime)s (%(threadName)-10s) [object: %(src)14s] %(message)s', level=logging.INFO, datefmt='%I:%M:%S')
+
+
+class ProgressSampler(logging.Filter):
+    """ Lets only one progress line per `interval` seconds through for each object; everything else passes """
+
+    def __init__(self, interval: float):
+        super().__init__()
+        self.interval = interval
+        self.last = {}      # (thread, object): when it last had a progress line let through
+
+    def filter(self, record):
+        if record.msg is not INITIALIZING and record.msg is not TESTING:
+            return True
+        key = (record.thread, record.src)
+        if record.created - self.last.get(key, 0) >= self.interval:
+            self.last[key] = record.created
+            return True
+        return False
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """ A QueueHandler that leaves the formatting to the writer thread, instead of doing it in the caller's """
+
+    def prepare(self, record):
+        return record
+
+
+def queued_log_setup(progress_interval: float = 5):
+    """ Like local_log_setup(), but runner threads only put log records on a queue; one writer thread formats
+        and writes them.  Progress lines are sampled to one per `progress_interval` seconds per object.
+
+        Returns the QueueListener: call its stop() when finished to write out whatever is still queued.
+    """
+
+    records = queue.SimpleQueue()
+    writer = logging.StreamHandler()
+    writer.setFormatter(logging.Formatter('%(asctime)s (%(threadName)-10s) [object: %(src)14s] %(message)s',
+                                          datefmt='%I:%M:%S'))
+    listener = logging.handlers.QueueListener(records, writer)
+
+    handler = LazyQueueHandler(records)
+    if progress_interval:
+        handler.addFilter(ProgressSampler(progress_interval))
+    logging.basicConfig(handlers=[handler], level=logging.INFO)
+    listener.start()
+    return listener
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import random
+import selectors
+from classes_async import AsyncBatchedLogger, AsyncSafeMutexLogger, AsyncSemaphoreLogger, AsyncTestRunner
+from classes_results import STATUSES
+
+
+class VirtualSelector(selectors.DefaultSelector):
+    """ A selector that never waits: when its loop would sleep until the next timer, it moves the clock there
+
+        Simulations only wait on timers, never on real sockets, so it doesn't even ask the OS.
+    """
+
+    loop = None
+
+    def select(self, timeout=None):
+        if timeout is None:
+            raise RuntimeError("Every task is waiting on another and no timer is due: the simulation is deadlocked")
+        self.loop.now += timeout
+        return []
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """ An event loop on simulated time, for the asyncio classes
+
+        Its clock starts at 0, and only moves when every task is waiting on a timer: then it jumps straight to
+        the next one.  So `await asyncio.sleep(4)` takes no real time at all, and thousands of runners that
+        would take hours finish in a moment, in the same order they would have on a real clock.
+    """
+
+    def __init__(self):
+        selector = VirtualSelector()
+        selector.loop = self
+        self.now = 0.0
+        super().__init__(selector)
+
+    def time(self):
+        return self.now
+
+
+def simulate(main, seed: int = 0):
+    """ Run the coroutine `main` to the end on simulated time, with `random` seeded; returns what it returns
+
+        Everything runs on one thread in an order set by the clock, so the same seed always gives the same run.
+    """
+
+    random.seed(seed)
+    loop = VirtualClockLoop()
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        loop.close()
+
+
+class MeteredSemaphore(asyncio.Semaphore):
+    """ An asyncio.Semaphore (or, with a value of 1, a Lock) that keeps count of how it's used
+
+        How many times it was acquired, how many of those had to wait, how long they waited, and how busy it
+        was: the time its places were held, over all of them.
+    """
+
+    def __init__(self, name: str, value: int = 1):
+        super().__init__(value)
+        self.name = name
+        self.capacity = value
+        self.acquires = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.held = 0               # places held right now
+        self.held_seconds = 0.0     # place-seconds held, up to `changed`
+        self.changed = 0.0          # when `held` last changed
+
+    def settle(self, now: float):
+        self.held_seconds += self.held * (now - self.changed)
+        self.changed = now
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self.contended += self.locked()
+        await super().acquire()
+        now = loop.time()
+        self.settle(now)
+        self.held += 1
+        self.acquires += 1
+        self.wait_seconds += now - start
+        self.max_wait_seconds = max(self.max_wait_seconds, now - start)
+        return True
+
+    def release(self):
+        self.settle(asyncio.get_running_loop().time())
+        self.held -= 1
+        super().release()
+
+    def metrics(self, makespan: float):
+        """ How it was used over a run `makespan` seconds long """
+
+        self.settle(makespan)
+        return {
+            "acquires": self.acquires,
+            "contended": self.contended,
+            "mean_wait_s": self.wait_seconds / self.acquires if self.acquires else 0.0,
+            "max_wait_s": self.max_wait_seconds,
+            "utilization": self.held_seconds / (self.capacity * makespan) if makespan else 0.0,
+        }
+
+
+class SimulatedMutexLogger(AsyncSafeMutexLogger):
+    """ AsyncSafeMutexLogger, metering its lock; every result is transmitted at once, however many there are """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = MeteredSemaphore("lock")
+        self.resources = [self.lock]
+
+
+class SimulatedSemaphoreLogger(AsyncSemaphoreLogger):
+    """ AsyncSemaphoreLogger, metering its lock and its 2 transmit slots """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = MeteredSemaphore("lock")
+        self.results_semaphore = MeteredSemaphore("transmit slots", 2)
+        self.resources = [self.lock, self.results_semaphore]
+
+
+class SimulatedBatchedLogger(AsyncBatchedLogger):
+    """ AsyncBatchedLogger, metering its lock and its uploader """
+
+    def __init__(self, batch_size: int = 10, linger: float = 0.5, max_queue: int = 100):
+        super().__init__(batch_size, linger, max_queue)
+        self.lock = MeteredSemaphore("lock")
+        self.uploading = MeteredSemaphore("uploader")
+        self.resources = [self.lock, self.uploading]
+
+    async def transmit(self, results: list):
+        async with self.uploading:
+            await super().transmit(results)
+
+
+class SimulatedRunner(AsyncTestRunner):
+    """ AsyncTestRunner for simulations: each test is one sleep, lasting `test_time` give or take `jitter` of it
+
+        No progress lines, since nobody watches a simulation go by.  Keeps count of the time it spent testing,
+        so we can tell how much of it went on waiting for the logger.
+    """
+
+    jitter = 0.5
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.testing_seconds = 0.0
+
+    async def run_tests(self, number_of_tests: int):
+        """ Run imaginary tests, and log the results to our AsyncTestLogger """
+
+        logging.info("Starting to run %s tests", number_of_tests, extra=self.d)
+
+        for test_num in range(1, number_of_tests+1):
+            duration = self.test_time * random.uniform(1 - self.jitter, 1 + self.jitter)
+            await asyncio.sleep(duration)
+            self.testing_seconds += duration
+
+            result = random.choice(STATUSES)
+            logging.info("I have a test result of %s", result, extra=self.d)
+            await self.send_results_to_logger(self.name, test_num, result)
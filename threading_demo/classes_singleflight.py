@@ -0,0 +1,68 @@
+import logging
+import time
+from concurrent.futures import Future
+from threading import Lock
+from classes_simple import TestLogger
+
+
+class SingleFlightLogger(TestLogger):
+    """ This is the equivalent of our TestRail reporting class, now threadsafe without making runners queue up!
+
+        Single-flight: the first runner to ask starts making the test run, every runner asking while it's
+        being made waits on that same "flight" (a Future), and every runner asking after it's made just reads
+        the ID; no locking at all.
+    """
+
+    def __init__(self):
+        self.flight_lock = Lock()   # Only held for a moment, to decide who makes the test run
+        self.flight = None          # The Future for the test run being made, if any
+
+    def get_testrun(self, testrunner: str):
+        """ Get the test run made exactly once, no matter how many runners ask at the same time """
+
+        # Already made?  Then there's nothing to wait for
+        if self.testrun_id:
+            logging.info("'%s' is using test run '%s'", testrunner, self.testrun_id, extra=self.d)
+            return self.testrun_id
+
+        with self.flight_lock:
+            flight = self.flight
+            making_it = flight is None
+            if making_it:
+                flight = self.flight = Future()
+
+        if making_it:
+            try:
+                self.make_testrun(testrunner)
+            except BaseException as error:
+                # Everyone waiting on this flight fails with the same error, and the next runner to ask can try again
+                logging.info("'%s' failed to make a test run; telling everyone waiting", testrunner, extra=self.d)
+                with self.flight_lock:
+                    self.flight = None
+                flight.set_exception(error)
+                raise
+            flight.set_result(self.testrun_id)
+            return self.testrun_id
+
+        logging.info("'%s' is waiting for the test run that's already being made", testrunner, extra=self.d)
+        return flight.result()     # raises the maker's exception, if it had one
+
+    def make_testrun(self, testrunner: str):
+        """ Actually make the test run; only ever called by one runner at a time """
+
+        super().get_testrun(testrunner)
+
+
+class CrashingSingleFlightLogger(SingleFlightLogger):
+    """ This is the equivalent of our TestRail reporting class, now threadsafe without making runners queue up!
+
+        This will crash when "Alpha" testrunner is halfway through creating the testrun; everyone waiting
+        for it fails too, instead of deadlocking like DeadlockLogger.
+    """
+
+    def make_testrun(self, testrunner: str):
+        if "Alpha" in testrunner:
+            time.sleep(self.testrun_initialize_time / 2 * self.tick)
+            logging.info("We crashed trying to get a test run for Alpha!", extra=self.d)
+            raise Exception("'get_testrun' ran into an error!")
+        super().make_testrun(testrunner)
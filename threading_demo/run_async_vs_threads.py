@@ -0,0 +1,79 @@
+from classes_simple import TestLogger, TestRunner
+from classes_mutex import SafeMutexLogger
+from classes_async import AsyncSafeMutexLogger, AsyncTestRunner
+import asyncio
+import logging
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+# Every runner: 1 second to get the test run (only the first one waits), 1 test of 1 second, 1 second to transmit
+TestLogger.testrun_initialize_time = 1
+TestRunner.test_time = 1
+
+
+def threaded_tests(name: str, logger: SafeMutexLogger):
+    testrun = TestRunner(name)
+    testrun.initialize_log(logger)
+    testrun.run_tests(1)
+
+
+def run_threads(runners: int):
+    """ One thread per test runner, like run_parallel_mutex_safe """
+
+    logger = SafeMutexLogger()
+    threads = [threading.Thread(target=threaded_tests, args=(f"Runner{n}", logger)) for n in range(runners)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+async def async_tests(name: str, logger: AsyncSafeMutexLogger):
+    testrun = AsyncTestRunner(name)
+    await testrun.initialize_log(logger)
+    await testrun.run_tests(1)
+
+
+async def run_tasks(runners: int):
+    """ One task per test runner, all on one event loop, like run_parallel_async """
+
+    logger = AsyncSafeMutexLogger()
+    await asyncio.gather(*(async_tests(f"Runner{n}", logger) for n in range(runners)))
+
+
+def measure(mode: str, runners: int):
+    """ Runs in its own process, so each measurement gets a clean peak memory """
+
+    logging.disable(logging.INFO)   # thousands of runners make a lot of log lines; we're here for the timing
+    start = time.perf_counter()
+    if mode == "threads":
+        run_threads(runners)
+    else:
+        asyncio.run(run_tasks(runners))
+    elapsed = time.perf_counter() - start
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024   # Linux reports KiB
+    print(f"{elapsed:.2f} {peak_mib:.1f}")
+
+
+def compare():
+    """ Wall time and peak memory for threads and asyncio, at 1k and 10k runners """
+
+    print(f"{'runners':>8} {'driver':>8} {'wall s':>8} {'peak MiB':>9}")
+    for runners in (1000, 10000):
+        for mode in ("threads", "asyncio"):
+            result = subprocess.run([sys.executable, __file__, mode, str(runners)], capture_output=True, text=True)
+            if result.returncode:
+                print(f"{runners:>8} {mode:>8}   failed: {result.stderr.strip().splitlines()[-1]}")
+                continue
+            elapsed, peak_mib = result.stdout.split()
+            print(f"{runners:>8} {mode:>8} {elapsed:>8} {peak_mib:>9}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        measure(sys.argv[1], int(sys.argv[2]))
+    else:
+        compare()
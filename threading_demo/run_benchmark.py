@@ -0,0 +1,171 @@
+from classes_simple import TestLogger, TestRunner
+from classes_mutex import CrashingSafeMutexLogger, DeadlockLogger, MutexLogger
+from classes_semaphore import SemaphoreLogger, SemaphoreRunner
+from classes_instrumented import InstrumentedLock, InstrumentedSemaphore
+import argparse
+import json
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+
+# Every strategy, as its driver script runs it: (logger, runner, one thread per runner?)
+SCENARIOS = {
+    "sequential": (TestLogger, TestRunner, False),
+    "parallel": (TestLogger, TestRunner, True),
+    "mutex": (MutexLogger, TestRunner, True),
+    "mutex_deadlock": (DeadlockLogger, TestRunner, True),
+    "mutex_safe": (CrashingSafeMutexLogger, TestRunner, True),
+    "semaphor": (SemaphoreLogger, SemaphoreRunner, True),
+}
+
+
+class CreatedCounter(logging.Handler):
+    """ Counts the test runs created, by the log line saying so; writes nothing """
+
+    def __init__(self):
+        super().__init__()
+        self.created = 0
+
+    def emit(self, record):
+        if record.msg == "Test run '%s' has been created.":
+            self.created += 1
+
+
+def runner_tests(name: str, logger: TestLogger, runner_class, config: dict):
+    testrun = runner_class(name)                # Start a new test run
+    if config["test_time"] is not None:         # otherwise, however long the runner class makes its tests take
+        testrun.test_time = config["test_time"]
+    testrun.initialize_log(logger)              # connect to logger object
+    testrun.run_tests(config["tests"])          # run tests
+
+
+def new_logger(logger_class, config: dict) -> TestLogger:
+    logger = logger_class()
+    if config["transmit_time"] is not None:     # otherwise, however long the logger class takes to transmit
+        logger.results_transmit_time = config["transmit_time"]
+    return logger
+
+
+def run_scenario(scenario: str, config: dict, answers: multiprocessing.Queue):
+    """ Runs in its own process, so one that deadlocks can be killed """
+
+    counter = CreatedCounter()
+    logging.basicConfig(handlers=[counter], level=logging.INFO, force=True)
+    crashed = []
+    threading.excepthook = lambda args: crashed.append(args.thread.name)
+
+    # A simulated second is `tick` long, everywhere
+    TestLogger.testrun_initialize_time = config["initialize_time"]
+    TestLogger.tick = TestRunner.tick = config["tick"]
+
+    logger_class, runner_class, threaded = SCENARIOS[scenario]
+    logger = new_logger(logger_class, config)
+    instrumented = []
+    if hasattr(logger, "lock"):
+        logger.lock = InstrumentedLock("lock")
+        instrumented.append(logger.lock)
+    if hasattr(logger, "results_semaphore"):
+        logger.results_semaphore = InstrumentedSemaphore("results_semaphore", 2)
+        instrumented.append(logger.results_semaphore)
+
+    names = ["Alpha"] + [f"Runner{n}" for n in range(1, config["runners"])]     # Alpha is the one that crashes
+    start = time.perf_counter()
+    if threaded:
+        threads = [threading.Thread(target=runner_tests, name=f"Thread-{name}",
+                                    args=(name, logger, runner_class, config)) for name in names]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    else:
+        for name in names:
+            runner_tests(name, logger, runner_class, config)
+    makespan = time.perf_counter() - start
+
+    waited = sum(stats[3] for primitive in instrumented for stats in primitive.threads.values()) / 1e9
+    answers.put({
+        "makespan_s": makespan,
+        "results": len(logger.results),
+        "results_per_s": len(logger.results) / makespan,
+        "lock_wait_share": waited / (config["runners"] * makespan),
+        "testruns_created": counter.created,
+        "duplicate_testruns": max(counter.created - 1, 0),
+        "crashed_runners": len(crashed),
+    })
+
+
+def benchmark(scenario: str, config: dict):
+    """ One scenario in a process of its own, killed if it hasn't finished within `timeout` seconds
+
+        A process that dies without answering is reported as crashed as soon as it's gone.
+    """
+
+    answers = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run_scenario, args=(scenario, config, answers), daemon=True)
+    process.start()
+    deadline = time.monotonic() + config["timeout"]
+    while True:
+        exited = process.exitcode is not None   # checked first: an answer is on the queue before the process exits
+        try:
+            row = answers.get(timeout=0.1)
+            row["status"] = "ok"
+            break
+        except queue.Empty:
+            if exited:
+                row = {"status": f"crashed with exit code {process.exitcode}"}
+                break
+            if time.monotonic() >= deadline:
+                process.terminate()
+                row = {"status": f"timed out after {config['timeout']}s"}
+                break
+    process.join()
+    return {"scenario": scenario, **row}
+
+
+def print_table(rows: list):
+    print(f"{'scenario':<15} {'makespan s':>10} {'results':>8} {'results/s':>10} {'lock wait':>10} "
+          f"{'dup runs':>9} {'crashed':>8}  status")
+    for row in rows:
+        if row["status"] != "ok":
+            print(f"{row['scenario']:<15} {'-':>10} {'-':>8} {'-':>10} {'-':>10} {'-':>9} {'-':>8}  {row['status']}")
+            continue
+        print(f"{row['scenario']:<15} {row['makespan_s']:>10.3f} {row['results']:>8} {row['results_per_s']:>10.1f} "
+              f"{row['lock_wait_share']:>10.1%} {row['duplicate_testruns']:>9} {row['crashed_runners']:>8}  ok")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every threading demo strategy, and write the results as JSON.")
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS),
+                        help=f"which strategies to run: {', '.join(SCENARIOS)} (default: all of them)")
+    parser.add_argument("--runners", type=int, default=4, help="test runners per scenario (default: 4)")
+    parser.add_argument("--tests", type=int, default=3, help="tests per runner (default: 3)")
+    parser.add_argument("--tick", type=float, default=0.01,
+                        help="how long a simulated second really takes, in seconds (default: 0.01)")
+    parser.add_argument("--initialize-time", type=int, default=4,
+                        help="simulated seconds to create a test run (default: 4)")
+    parser.add_argument("--transmit-time", type=float,
+                        help="simulated seconds to transmit a result (default: the logger's own, 1, or 4 for semaphor)")
+    parser.add_argument("--test-time", type=int,
+                        help="simulated seconds per test (default: the runner's own, 3, or 1 for semaphor)")
+    parser.add_argument("--timeout", type=float, default=10,
+                        help="real seconds before a scenario counts as deadlocked (default: 10)")
+    parser.add_argument("--json", default="benchmark_results.jsonl",
+                        help="JSON lines file to add this run to (default: benchmark_results.jsonl)")
+    config = vars(parser.parse_args())
+    scenarios, path = config.pop("scenarios"), config.pop("json")
+    for scenario in scenarios:
+        if scenario not in SCENARIOS:
+            parser.error(f"unknown scenario {scenario!r}; choose from {', '.join(SCENARIOS)}")
+
+    rows = [benchmark(scenario, config) for scenario in scenarios]
+    print_table(rows)
+
+    with open(path, "a") as file:
+        file.write(json.dumps({"when": time.strftime("%Y-%m-%dT%H:%M:%S"), "config": config, "rows": rows}) + "\n")
+    print(f"Written to {path}")
+
+
+if __name__ == '__main__':
+    main()
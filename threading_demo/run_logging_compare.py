@@ -0,0 +1,67 @@
+from classes_simple import TestLogger, TestRunner, local_log_setup, queued_log_setup
+import logging
+import subprocess
+import sys
+import threading
+import time
+
+THREADS = 500
+TESTS = 20
+
+# Nothing sleeps: we're measuring what the logging costs the runners
+TestLogger.results_transmit_time = 0
+TestRunner.tick = 0
+TestRunner.test_time = 5
+
+
+def threaded_tests(name: str, logger: TestLogger, start: threading.Event):
+    testrun = TestRunner(name)
+    testrun.results_logger = logger     # skip making a test run; every thread would be racing to make one
+    start.wait()
+    testrun.run_tests(TESTS)
+
+
+def measure(mode: str):
+    """ Runs in its own process (with stderr thrown away): tests per second across THREADS runner threads """
+
+    listener = None
+    if mode == "off":
+        logging.disable(logging.INFO)
+    elif mode == "direct":
+        local_log_setup()
+    elif mode == "queued":
+        listener = queued_log_setup()
+    elif mode == "queued, every line":
+        listener = queued_log_setup(progress_interval=0)
+
+    logger = TestLogger()
+    start = threading.Event()
+    threads = [threading.Thread(target=threaded_tests, args=(f"Runner{n}", logger, start)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+
+    began = time.perf_counter()
+    start.set()
+    for thread in threads:
+        thread.join()
+    runners_done = time.perf_counter() - began
+    if listener:
+        listener.stop()     # wait for the writer thread to catch up
+    all_written = time.perf_counter() - began
+    print(f"{THREADS * TESTS / runners_done:.0f} {runners_done:.2f} {all_written:.2f}")
+
+
+def compare():
+    print(f"{THREADS} threads x {TESTS} tests, {TestRunner.test_time} progress lines per test")
+    print(f"{'logging':<20} {'tests/sec':>10} {'runners s':>10} {'written s':>10}")
+    for mode in ("off", "direct", "queued", "queued, every line"):
+        result = subprocess.run([sys.executable, __file__, mode], capture_output=True, text=True, check=True)
+        rate, runners_done, all_written = result.stdout.split()
+        print(f"{mode:<20} {int(rate):>10,} {runners_done:>10} {all_written:>10}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 2:
+        measure(sys.argv[1])
+    else:
+        compare()
@@ -0,0 +1,25 @@
+from classes_simple import local_log_setup
+from classes_async import AsyncSafeMutexLogger, AsyncTestRunner
+import asyncio
+import sys
+
+
+async def async_tests(name: str, logger: AsyncSafeMutexLogger):
+    """ Every Test Runner gets its own task to initialize & run tests; they all share one thread """
+
+    testrun = AsyncTestRunner(name)         # Start a new test run
+    await testrun.initialize_log(logger)    # connect to logger object
+    await testrun.run_tests(2)              # run tests
+
+
+async def many_async_tests(runners: int):
+    """ Run all our test runners at the same time, on one event loop """
+
+    logger = AsyncSafeMutexLogger()         # make our asyncio-safe logger object
+    await asyncio.gather(*(async_tests(f"Runner{n}", logger) for n in range(runners)))
+    logger.report_results()                 # how did it end?
+
+
+if __name__ == '__main__':
+    local_log_setup()                       # Our logs need to look pretty
+    asyncio.run(many_async_tests(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
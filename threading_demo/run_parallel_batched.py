@@ -0,0 +1,50 @@
+from classes_simple import TestLogger, TestRunner, local_log_setup
+from classes_mutex import SafeMutexLogger
+from classes_batched import BatchedLogger
+import time
+import threading
+
+
+def threaded_tests(name: str, logger: TestLogger):
+    """ Every Test Runner gets it own thread to initialize & run tests """
+
+    testrun = TestRunner(name)      # Start a new test run
+    testrun.initialize_log(logger)  # connect to logger object
+    testrun.run_tests(3)            # run tests
+
+
+def time_parallel_tests(logger: TestLogger):
+    """ How long 4 test runners take to run their tests and get every result reported """
+
+    names = ["Alpha   ", "Beta", "Delta", "Gamma"]
+    threads = [threading.Thread(target=threaded_tests, name=f"Thread-{name[0]}", args=(name, logger))
+               for name in names]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:          # Wait until all our tests finish running.
+        thread.join()
+    logger.report_results()         # how did it end?  (a BatchedLogger finishes transmitting first)
+    return time.perf_counter() - start
+
+
+def batched_parallel_tests():
+    """ Runners waiting on every result transmit, against runners handing results to a batching uploader """
+
+    local_log_setup()                       # Our logs need to look pretty
+
+    TestLogger.testrun_initialize_time = 1  # We're here to watch results, not test run creation
+    blocking_logger = SafeMutexLogger()
+    blocking_time = time_parallel_tests(blocking_logger)
+
+    logger = BatchedLogger(batch_size=4, linger=0.5)
+    batched_time = time_parallel_tests(logger)
+
+    print(f"4 runners x 3 tests, {TestLogger.results_transmit_time}s per transmit:")
+    print(f"  SafeMutexLogger:  {blocking_time:.2f}s, {blocking_logger.transmits} transmits")
+    print(f"  BatchedLogger:    {batched_time:.2f}s, {logger.transmits} transmits")
+
+
+if __name__ == '__main__':
+    batched_parallel_tests()
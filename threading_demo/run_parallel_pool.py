@@ -0,0 +1,42 @@
+from classes_simple import TestRunner, local_log_setup
+from classes_pool import PooledLogger, SessionPool, StandInServer
+import time
+import threading
+
+
+def threaded_tests(name: str, logger: PooledLogger):
+    """ Every Test Runner gets it own thread to initialize & run tests """
+
+    testrun = TestRunner(name)      # Start a new test run
+    testrun.test_time = 1           # We can run tests really fast now
+    testrun.initialize_log(logger)  # connect to logger object
+    testrun.run_tests(5)            # run tests
+
+
+def pooled_parallel_tests():
+    """ Like run_parallel_semaphor, but the 2 results at a time come from a pool of 2 sessions to a stand-in server """
+
+    local_log_setup()                                   # Our logs need to look pretty
+    server = StandInServer(transmit_time=4, drop_chance=0.1).start()   # it takes a long time to transmit, and
+                                                                       # sometimes the server hangs up on us
+    pool = SessionPool(server.address, size=2, acquire_timeout=60)
+    logger = PooledLogger(pool)                         # make our pooled logger object
+
+    threads = [threading.Thread(target=threaded_tests, name=f"Thread-{name[0]}", args=(name, logger))
+               for name in ("Alpha   ", "Beta", "Delta", "Gamma")]
+    for thread in threads:
+        thread.start()
+        time.sleep(2)                                   # ... start the runs slowly ...
+    for thread in threads:                              # Wait until all our tests finish running.
+        thread.join()
+
+    logger.report_results()                             # how did it end?
+    for name, value in pool.metrics().items():          # how busy were our sessions?
+        print(f"{name:>12}: {round(value, 3)}")
+
+    pool.close()
+    server.stop()
+
+
+if __name__ == '__main__':
+    pooled_parallel_tests()
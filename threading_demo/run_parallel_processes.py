@@ -0,0 +1,33 @@
+from classes_simple import local_log_setup
+from classes_batched import BatchedLogger
+from classes_process import collect_results, run_runner, start_worker
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import threading
+
+
+def process_tests(names: list, number_of_tests: int, workers: int = None):
+    """ Every Test Runner runs in a worker process; all their results come back to one logger in this process """
+
+    logger = BatchedLogger()                        # the only real logger: results get transmitted in batches
+    logger.get_testrun("Parent")                    # one test run, made before any worker starts, for everybody
+
+    results_queue = multiprocessing.Queue()
+    collector = threading.Thread(target=collect_results, name="Collector", args=(results_queue, logger))
+    collector.start()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=start_worker,
+                                 initargs=(results_queue, logger.testrun_id)) as pool:
+            for name in pool.map(run_runner, names, [number_of_tests] * len(names)):
+                print(f"{name} has finished its tests")
+    finally:
+        results_queue.put(None)                     # the workers are done (or crashed); so is the collector, once
+        collector.join()                            # it's caught up
+    logger.report_results()                         # how did it end?  (after every result is transmitted)
+
+
+if __name__ == '__main__':
+    local_log_setup()                               # Our logs need to look pretty
+    process_tests(["Alpha", "Beta", "Delta", "Gamma"], 4)
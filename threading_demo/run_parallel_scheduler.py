@@ -0,0 +1,40 @@
+from classes_simple import local_log_setup
+from classes_mutex import SafeMutexLogger
+from classes_scheduler import DurationHistory, StealingRunner, WorkStealingScheduler
+import random
+import threading
+
+
+def threaded_tests(name: str, scheduler: WorkStealingScheduler, durations: dict, logger: SafeMutexLogger):
+    """ Every Test Runner gets it own thread, and asks the scheduler for tests until there are none left """
+
+    testrun = StealingRunner(name)                  # Start a new test run
+    testrun.initialize_log(logger)                  # connect to logger object
+    testrun.run_scheduled(scheduler, durations)     # run tests
+
+
+def scheduled_parallel_tests():
+    """ 4 test runners sharing 12 tests of very different lengths; run it again and the schedule gets better """
+
+    local_log_setup()                               # Our logs need to look pretty
+    logger = SafeMutexLogger()                      # make our threadsafe logger object
+    history = DurationHistory()                     # how long the tests took last time (test_durations.json)
+
+    rng = random.Random(2023)
+    durations = {f"test_{n:02}": rng.choice([1, 1, 2, 3, 8]) for n in range(12)}   # how long they really take
+    scheduler = WorkStealingScheduler(list(durations), ["Alpha", "Beta", "Delta", "Gamma"], history)
+
+    threads = [threading.Thread(target=threaded_tests, name=f"Thread-{name[0]}",
+                                args=(name, scheduler, durations, logger))
+               for name in ("Alpha", "Beta", "Delta", "Gamma")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:                          # Wait until all our tests finish running.
+        thread.join()
+
+    history.save()                                  # remember how long everything took, for next time
+    logger.report_results()                         # how did it end?
+
+
+if __name__ == '__main__':
+    scheduled_parallel_tests()
@@ -0,0 +1,58 @@
+from classes_simple import TestLogger, TestRunner, local_log_setup
+from classes_mutex import SafeMutexLogger
+from classes_singleflight import SingleFlightLogger, CrashingSingleFlightLogger
+import logging
+import time
+import threading
+
+RUNNERS = 100
+
+
+def threaded_init(name: str, logger: SingleFlightLogger, failures: list):
+    """ Every Test Runner gets it own thread, and they all ask for the test run at once """
+
+    testrun = TestRunner(name)          # Start a new test run
+    try:
+        testrun.initialize_log(logger)  # connect to logger object
+    except Exception as error:
+        logging.info("I couldn't get a test run: %s", error, extra=testrun.d)
+        failures.append(name)
+
+
+def time_parallel_init(logger: SingleFlightLogger, names: list):
+    """ How long it takes every runner in `names` to get its test run, all asking at the same time,
+        and how many of them failed to get one
+    """
+
+    failures = []
+    threads = [threading.Thread(target=threaded_init, name=f"Thread-{n}", args=(name, logger, failures))
+               for n, name in enumerate(names)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:              # Wait until every runner has its test run (or an error)
+        thread.join()
+    return time.perf_counter() - start, len(failures)
+
+
+def singleflight_tests():
+    """ 100 test runners all initializing at once: the mutex makes them queue, single-flight makes them share """
+
+    local_log_setup()                   # Our logs need to look pretty
+    names = [f"Runner{n}" for n in range(RUNNERS)]
+
+    results = {
+        "SafeMutexLogger": time_parallel_init(SafeMutexLogger(), names),
+        "SingleFlightLogger": time_parallel_init(SingleFlightLogger(), names),
+        # A crash while making the test run fails everyone waiting for it, and nobody deadlocks
+        "CrashingSingleFlightLogger": time_parallel_init(CrashingSingleFlightLogger(), ["Alpha   "] + names[1:]),
+    }
+
+    print(f"{RUNNERS} runners initializing at once, a test run takes {TestLogger.testrun_initialize_time}s to make:")
+    for name, (seconds, failed) in results.items():
+        print(f"  {name:<28} {seconds:.2f}s, {failed} runners failed")
+
+
+if __name__ == '__main__':
+    singleflight_tests()
@@ -0,0 +1,62 @@
+from classes_simple import TestLogger
+from classes_mutex import SafeMutexLogger
+from classes_process import CpuTestRunner
+from run_parallel_processes import process_tests
+import contextlib
+import io
+import logging
+import os
+import threading
+import time
+
+RUNNERS = 8
+TESTS = 4
+
+# We're timing the busy tests, so getting the test run and transmitting results are quick
+TestLogger.testrun_initialize_time = 1
+TestLogger.results_transmit_time = 0
+
+
+def threaded_tests(name: str, logger: SafeMutexLogger):
+    testrun = CpuTestRunner(name)
+    testrun.initialize_log(logger)
+    testrun.run_tests(TESTS)
+
+
+def thread_tests(names: list):
+    """ One thread per test runner, like run_parallel_mutex_safe (but nobody crashes) """
+
+    logger = SafeMutexLogger()
+    threads = [threading.Thread(target=threaded_tests, args=(name, logger)) for name in names]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.report_results()
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        function(*args)
+    return time.perf_counter() - start
+
+
+def compare():
+    """ The same busy tests in threads, and in 1 worker process up to one per core """
+
+    logging.disable(logging.INFO)   # we're here for the timing
+    names = [f"Runner{n}" for n in range(RUNNERS)]
+
+    print(f"{RUNNERS} runners x {TESTS} busy tests, {os.cpu_count()} cores")
+    threads_time = timed(thread_tests, names)
+    print(f"  {'threads':<12} {threads_time:6.2f}s")
+    for workers in sorted({1, 2, 4, os.cpu_count()}):
+        if workers <= os.cpu_count():
+            seconds = timed(process_tests, names, TESTS, workers)
+            label = f"{workers} process" + ("es" if workers > 1 else "")
+            print(f"  {label:<12} {seconds:6.2f}s  ({threads_time / seconds:.1f}x threads)")
+
+
+if __name__ == '__main__':
+    compare()
@@ -0,0 +1,67 @@
+from classes_results import STATUSES, ResultsStore
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+RESULTS = 1_000_000
+RUNNERS = [f"Runner{n}" for n in range(100)]
+
+
+def make_results(seed: int = 2023):
+    rng = random.Random(seed)
+    return [(rng.choice(RUNNERS), rng.randrange(1, 500), rng.choice(STATUSES)) for _ in range(RESULTS)]
+
+
+def peak_kib(function, *args):
+    """ What `function` leaves allocated, in KiB, and what it returned """
+
+    tracemalloc.start()
+    kept = function(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / 1024, kept
+
+
+def as_strings(rows):
+    """ The old way: one formatted string per result """
+
+    return [f"{testrunner.rjust(7)} {test_id}: {result}" for testrunner, test_id, result in rows]
+
+
+def as_store(rows):
+    store = ResultsStore()
+    store.extend(rows)
+    return store
+
+
+def compare():
+    rows = make_results()
+    print(f"{RESULTS:,} results from {len(RUNNERS)} runners")
+
+    strings_kib, strings = peak_kib(as_strings, rows)
+    store_kib, store = peak_kib(as_store, rows)
+    print(f"  {'list of strings':<16} {strings_kib / 1024:8.1f} MiB")
+    print(f"  {'ResultsStore':<16} {store_kib / 1024:8.1f} MiB")
+
+    start = time.perf_counter()
+    counts = {status: sum(line.endswith(": " + status) for line in strings) for status in STATUSES}
+    print(f"  counting the strings: {(time.perf_counter() - start) * 1000:9.3f} ms  {counts}")
+    start = time.perf_counter()
+    counts = store.counts()
+    print(f"  store.counts():       {(time.perf_counter() - start) * 1000:9.3f} ms  {counts}")
+
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        with open(os.path.join(folder, "results.jsonl"), "w") as file:
+            written = store.export_jsonl(file)
+        print(f"  export_jsonl:  {written:,} results in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        written = store.export_sqlite(os.path.join(folder, "results.sqlite"))
+        print(f"  export_sqlite: {written:,} results in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    compare()
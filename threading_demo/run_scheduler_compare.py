@@ -0,0 +1,93 @@
+from classes_simple import TestLogger, TestRunner
+from classes_mutex import SafeMutexLogger
+from classes_scheduler import DurationHistory, StealingRunner, WorkStealingScheduler
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+
+RUNNERS = ["Alpha", "Beta", "Delta", "Gamma"]
+TESTS = 40
+TICK = 0.01     # One simulated second is this many real seconds
+
+TestLogger.testrun_initialize_time = 0
+TestLogger.results_transmit_time = 0
+TestRunner.tick = TICK
+
+
+def make_tests(seed: int = 2023):
+    """ Test name: how many seconds it really takes.  Most are quick, a few are very slow """
+
+    rng = random.Random(seed)
+    return {f"test_{n:02}": round(rng.lognormvariate(1.5, 0.9), 1) for n in range(TESTS)}
+
+
+def static_runner(name: str, tests: list, durations: dict, logger: TestLogger):
+    """ Like run_parallel_semaphor: every runner gets its own fixed share of the tests """
+
+    testrun = TestRunner(name)
+    testrun.initialize_log(logger)
+    for test in tests:
+        time.sleep(durations[test] * TICK)
+        testrun.send_results_to_logger(name, test, "pass")
+
+
+def static_split(durations: dict):
+    """ Every runner gets the same number of tests, in order """
+
+    logger = SafeMutexLogger()
+    tests = list(durations)
+    share = len(tests) // len(RUNNERS)
+    threads = [threading.Thread(target=static_runner, args=(name, tests[n * share:(n + 1) * share], durations, logger))
+               for n, name in enumerate(RUNNERS)]
+    return run_threads(threads)
+
+
+def stealing_runner(name: str, scheduler: WorkStealingScheduler, durations: dict, logger: TestLogger):
+    testrun = StealingRunner(name)
+    testrun.initialize_log(logger)
+    testrun.run_scheduled(scheduler, durations)
+
+
+def work_stealing(durations: dict, history: DurationHistory):
+    """ The scheduler hands out the tests; returns (seconds, steals) """
+
+    logger = SafeMutexLogger()
+    scheduler = WorkStealingScheduler(list(durations), RUNNERS, history)
+    threads = [threading.Thread(target=stealing_runner, args=(name, scheduler, durations, logger))
+               for name in RUNNERS]
+    seconds = run_threads(threads)
+    history.save()
+    return seconds, scheduler.steals
+
+
+def run_threads(threads: list):
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return (time.perf_counter() - start) / TICK     # in simulated seconds
+
+
+def compare():
+    logging.disable(logging.INFO)   # we're here for the timing
+    durations = make_tests()
+    ideal = max(sum(durations.values()) / len(RUNNERS), max(durations.values()))
+
+    print(f"{len(RUNNERS)} runners, {TESTS} tests totalling {sum(durations.values()):.0f}s, "
+          f"longest {max(durations.values()):.0f}s; ideal makespan {ideal:.1f}s")
+    print(f"  {'static split':<34} {static_split(durations):6.1f}s")
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "test_durations.json")
+        for run in range(1, 4):     # each run starts from the durations the last one saved
+            seconds, steals = work_stealing(durations, DurationHistory(path))
+            label = f"work stealing, run {run}" + (" (no history)" if run == 1 else "")
+            print(f"  {label:<34} {seconds:6.1f}s, {steals} steals")
+
+
+if __name__ == '__main__':
+    compare()
@@ -0,0 +1,63 @@
+from classes_simulated import (SimulatedBatchedLogger, SimulatedMutexLogger, SimulatedRunner, SimulatedSemaphoreLogger,
+                               simulate)
+import asyncio
+import logging
+import sys
+import time
+
+STRATEGIES = {
+    "mutex": SimulatedMutexLogger,
+    "semaphore": SimulatedSemaphoreLogger,
+    "batched": SimulatedBatchedLogger,
+}
+
+
+async def simulated_tests(name: str, logger, start: float, tests: int):
+    """ Every Test Runner gets its own task, starting `start` (simulated) seconds in """
+
+    await asyncio.sleep(start)              # start the runs slowly, like run_parallel_semaphor
+    testrun = SimulatedRunner(name)         # Start a new test run
+    await testrun.initialize_log(logger)    # connect to logger object
+    await testrun.run_tests(tests)          # run tests
+    return testrun.testing_seconds / (asyncio.get_running_loop().time() - start)
+
+
+async def simulated_run(strategy: str, runners: int, tests: int, stagger: float):
+    """ One strategy, on simulated time: how long it took, and how busy everything was """
+
+    logger = STRATEGIES[strategy]()
+    logger.results_transmit_time = 4        # The same slow server for every strategy
+    testing = await asyncio.gather(*(simulated_tests(f"Runner{n}", logger, n * stagger, tests)
+                                      for n in range(runners)))
+    if strategy == "batched":
+        await logger.close()                # finish transmitting
+    makespan = asyncio.get_running_loop().time()
+
+    return {
+        "makespan": makespan,
+        "runners": sum(testing) / runners,     # how much of its time the average runner spent testing
+        "resources": {resource.name: resource.metrics(makespan) for resource in logger.resources},
+        "counts": logger.results.counts(),
+        "testrun_id": logger.testrun_id,
+    }
+
+
+def compare_strategies(runners: int, tests: int = 5, stagger: float = 2, seed: int = 0):
+    print(f"{runners} runners x {tests} tests, started {stagger}s apart, 4s per transmit, seed {seed}:")
+    for strategy in STRATEGIES:
+        start = time.perf_counter()
+        run = simulate(simulated_run(strategy, runners, tests, stagger), seed)
+        real = time.perf_counter() - start
+        again = simulate(simulated_run(strategy, runners, tests, stagger), seed)
+
+        busy = ", ".join(f"{name} {metrics['utilization']:.0%} (mean wait {metrics['mean_wait_s']:.1f}s)"
+                         for name, metrics in run["resources"].items())
+        print(f"  {strategy:>9}: {run['makespan']:>9.1f}s simulated in {real * 1000:>6.0f} ms real;  "
+              f"runners testing {run['runners']:.0%}, {busy};  same again: {run == again}")
+
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)   # thousands of runners make a lot of log lines
+    compare_strategies(4)           # like run_parallel_semaphor
+    for runners in map(int, sys.argv[1:]) if len(sys.argv) > 1 else (1000, 10000):
+        compare_strategies(runners, stagger=0)
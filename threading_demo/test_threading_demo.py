@@ -0,0 +1,598 @@
+import asyncio
+import io
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+
+import pytest
+
+import classes_async
+import classes_batched
+import classes_instrumented
+import classes_pool
+import classes_results
+import classes_process
+import classes_scheduler
+import classes_simple
+import classes_simulated
+import classes_singleflight
+import run_benchmark
+import run_parallel_processes
+import run_simulated
+
+
+@pytest.fixture
+def fast(monkeypatch):
+    """ A simulated second lasts a millisecond """
+
+    monkeypatch.setattr(classes_simple.TestLogger, "tick", 0.001)
+    monkeypatch.setattr(classes_simple.TestRunner, "tick", 0.001)
+    monkeypatch.setattr(classes_simple.TestLogger, "results_transmit_time", 0.001)
+
+
+def run_threads(target, args_list):
+    threads = [threading.Thread(target=target, args=args) for args in args_list]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_singleflight_makes_one_testrun(fast):
+    made = []
+
+    class Logger(classes_singleflight.SingleFlightLogger):
+        def make_testrun(self, testrunner):
+            made.append(testrunner)
+            super().make_testrun(testrunner)
+
+    logger = Logger()
+    ids = []
+    run_threads(lambda name: ids.append(logger.get_testrun(name)), [(f"Runner{n}",) for n in range(20)])
+    assert len(made) == 1
+    assert ids == [logger.testrun_id] * 20
+
+
+def test_singleflight_failure_reaches_every_waiter(fast):
+    release = threading.Event()
+
+    class Logger(classes_singleflight.SingleFlightLogger):
+        def make_testrun(self, testrunner):
+            if testrunner == "Alpha":
+                release.wait()
+                raise RuntimeError("boom")
+            super().make_testrun(testrunner)
+
+    logger = Logger()
+    outcomes = {}
+
+    def ask(name):
+        try:
+            outcomes[name] = logger.get_testrun(name)
+        except RuntimeError as error:
+            outcomes[name] = error
+
+    maker = threading.Thread(target=ask, args=("Alpha",))
+    maker.start()
+    while logger.flight is None:
+        pass
+    waiters = [threading.Thread(target=ask, args=(f"Runner{n}",)) for n in range(5)]
+    for waiter in waiters:
+        waiter.start()
+    release.set()
+    maker.join()
+    for waiter in waiters:
+        waiter.join()
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes.values())
+    assert len(outcomes) == 6
+    # The failed flight is forgotten, so the next runner to ask can make the test run
+    assert logger.get_testrun("Beta").startswith("Beta_")
+
+
+def test_batched_flush_and_close_transmit_everything(fast):
+    logger = classes_batched.BatchedLogger(batch_size=4, linger=0.01)
+    for test_id in range(10):
+        logger.log_results("Alpha", test_id, "pass")
+    logger.flush()
+    assert len(logger.results) == 10
+    assert 3 <= logger.transmits < 10      # batched, not one transmit per result
+
+    logger.log_results("Alpha", 10, "fail")
+    logger.close()
+    assert len(logger.results) == 11
+    assert not logger.uploader.is_alive()
+    with pytest.raises(RuntimeError, match="closed"):
+        logger.log_results("Alpha", 11, "pass")
+    logger.close()                          # closing twice is harmless
+
+
+def test_batched_uploader_failure_is_raised(fast):
+    class Logger(classes_batched.BatchedLogger):
+        def transmit(self, results):
+            raise ConnectionError("server gone")
+
+    logger = Logger(batch_size=2, linger=0.01, max_queue=2)
+    for test_id in range(6):                # more than the queue holds, so this would hang on a dead uploader
+        logger.log_results("Alpha", test_id, "pass")
+        if logger.error is not None:
+            break
+    with pytest.raises(ConnectionError):
+        logger.flush()
+    with pytest.raises(RuntimeError, match="failed"):
+        logger.log_results("Alpha", 99, "pass")
+    with pytest.raises(ConnectionError):
+        logger.close()
+    assert not logger.uploader.is_alive()
+    assert len(logger.results) == 0
+
+
+async def async_runs(logger, runners: int, tests: int):
+    async def run(name):
+        testrun = classes_async.AsyncTestRunner(name)
+        await testrun.initialize_log(logger)
+        await testrun.run_tests(tests)
+
+    await asyncio.gather(*(run(f"Runner{n}") for n in range(runners)))
+    if isinstance(logger, classes_async.AsyncBatchedLogger):
+        await logger.close()
+
+
+def test_async_batched_uploader_failure_is_raised(fast):
+    class Logger(classes_async.AsyncBatchedLogger):
+        async def transmit(self, results):
+            raise ConnectionError("server gone")
+
+    async def run(logger):
+        for test_id in range(6):            # more than the queue holds, so this would hang on a dead uploader
+            await logger.log_results("Alpha", test_id, "pass")
+            if logger.error is not None:
+                break
+        with pytest.raises(RuntimeError, match="failed"):
+            await logger.log_results("Alpha", 99, "pass")
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(logger.close(), 5)
+        with pytest.raises(ConnectionError):
+            await logger.close()            # closing again still reports why
+
+    logger = Logger(batch_size=2, linger=0.01, max_queue=2)
+    asyncio.run(run(logger))
+    assert logger.uploader.done()
+    assert len(logger.results) == 0
+
+
+def test_async_loggers_log_every_result_once(fast):
+    for logger_class in (classes_async.AsyncSafeMutexLogger, classes_async.AsyncBatchedLogger):
+        logger = logger_class()
+        logger.results_transmit_time = 0.001
+        asyncio.run(async_runs(logger, 5, 2))
+        assert len(logger.results) == 10
+        assert logger.testrun_id.startswith("Runner0_")
+
+
+def test_async_semaphore_limits_transmits(fast):
+    transmitting = [0, 0]   # now, most at once
+
+    class Counting(classes_async.AsyncTestLogger):
+        async def log_results(self, testrunner, test_id, result):
+            transmitting[0] += 1
+            transmitting[1] = max(transmitting)
+            await super().log_results(testrunner, test_id, result)
+            transmitting[0] -= 1
+
+    class Logger(classes_async.AsyncSemaphoreLogger, Counting):
+        pass
+
+    logger = Logger()
+    logger.results_transmit_time = 0.001
+    asyncio.run(async_runs(logger, 5, 2))
+    assert len(logger.results) == 10
+    assert transmitting[1] == 2
+
+
+def test_async_progress_lines_are_lazy(fast, caplog):
+    caplog.set_level(logging.INFO)
+    asyncio.run(async_runs(classes_async.AsyncTestLogger(), 1, 1))
+    progress = [record for record in caplog.records if record.msg is classes_simple.TESTING]
+    assert [record.getMessage() for record in progress] == \
+        ["Test 1 testing...", "Test 1 testing... testing...", "Test 1 testing... testing... testing..."]
+    assert all(isinstance(record.args[1], classes_simple.ProgressDots) for record in progress)
+
+
+def test_queue_logger_hands_results_to_the_parent(fast, monkeypatch):
+    results_queue = queue.Queue()
+    monkeypatch.setattr(classes_process, "worker_logger", classes_process.QueueLogger(results_queue, "Parent_1"))
+    monkeypatch.setattr(classes_process.CpuTestRunner, "test_work", 10)
+    assert classes_process.run_runner("Alpha", 3) == "Alpha"
+    results_queue.put(None)
+
+    logger = classes_simple.TestLogger()
+    classes_process.collect_results(results_queue, logger)
+    assert [test_id for _, test_id, _ in logger.results] == [1, 2, 3]
+
+
+def test_process_tests_collects_every_result(fast, monkeypatch, capsys):
+    monkeypatch.setattr(classes_process.CpuTestRunner, "test_work", 10)
+    loggers = []
+    monkeypatch.setattr(classes_batched.BatchedLogger, "report_results",
+                        lambda self: loggers.append(self.close() or self))
+    run_parallel_processes.process_tests(["Alpha", "Beta"], 3, workers=2)
+    assert "Beta has finished its tests" in capsys.readouterr().out
+    assert sorted((runner, test_id) for runner, test_id, _ in loggers[0].results) == \
+        [("Alpha", 1), ("Alpha", 2), ("Alpha", 3), ("Beta", 1), ("Beta", 2), ("Beta", 3)]
+
+
+def crashing_runner(name: str, number_of_tests: int):
+    raise RuntimeError(f"{name} crashed")
+
+
+def test_process_tests_crashed_worker_stops_the_collector(fast, monkeypatch):
+    monkeypatch.setattr(run_parallel_processes, "run_runner", crashing_runner)
+    with pytest.raises(RuntimeError, match="crashed"):
+        run_parallel_processes.process_tests(["Alpha"], 1, workers=1)
+    assert "Collector" not in [thread.name for thread in threading.enumerate()]
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = classes_pool.StandInServer(transmit_time=0.001).start()
+    yield server
+    server.stop()
+
+
+def test_pool_never_opens_more_than_its_size(fast, server):
+    pool = classes_pool.SessionPool(server.address, size=2, acquire_timeout=10)
+    logger = classes_pool.PooledLogger(pool)
+    opened = []
+
+    def log(name):
+        for test_id in range(1, 6):
+            logger.log_results(name, test_id, "pass")
+            opened.append(pool.opened)
+
+    run_threads(log, [(f"Runner{n}",) for n in range(6)])
+    metrics = pool.metrics()
+    pool.close()
+    assert len(logger.results) == logger.transmits == 30
+    assert max(opened) <= 2 and pool.made == 2
+    assert metrics["checkouts"] == 30 and metrics["in_use"] == 0 and metrics["timeouts"] == 0
+
+
+def test_pool_times_out_and_always_gets_sessions_back(server):
+    pool = classes_pool.SessionPool(server.address, size=1)
+    with pool.checkout():
+        with pytest.raises(classes_pool.PoolTimeout):
+            pool.acquire(timeout=0.01)
+    with pytest.raises(ZeroDivisionError):
+        with pool.checkout() as session:
+            1 / 0
+    with pool.checkout(timeout=0.01) as again:      # the session came back, crash and all
+        assert again is session
+    assert pool.metrics()["timeouts"] == 1
+    pool.close()
+
+
+def test_pool_retires_sessions_that_get_errors(server):
+    pool = classes_pool.SessionPool(server.address, size=1)
+    with pytest.raises(ConnectionError, match="error back for 'HELLO'"):
+        with pool.checkout() as session:
+            session.request("HELLO")
+    assert session.broken and pool.replaced == 1
+    with pool.checkout() as again:
+        assert again is not session and again.request("PING") == "PONG"
+    pool.close()
+
+
+def test_pool_replaces_broken_sessions(fast, server, monkeypatch):
+    monkeypatch.setattr(server, "drop_chance", 1)
+    pool = classes_pool.SessionPool(server.address, size=2, acquire_timeout=10, check_health=True)
+    logger = classes_pool.PooledLogger(pool)
+    with pytest.raises(ConnectionError, match="hung up"):
+        logger.log_results("Alpha", 1, "pass")
+    server.drop_chance = 0
+    logger.log_results("Alpha", 2, "pass")
+    assert len(logger.results) == 1
+    assert pool.replaced == logger.attempts and pool.made == logger.attempts + 1
+    assert pool.metrics()["in_use"] == 0
+    pool.close()
+
+
+def test_instrumented_semaphore_waits_like_a_semaphore():
+    semaphore = classes_instrumented.InstrumentedSemaphore("slots", 1)
+    assert semaphore.acquire()
+    assert not semaphore.acquire(blocking=False)
+    assert not semaphore.acquire(timeout=0.01)
+
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(semaphore.acquire()), name="Waiter")
+    waiter.start()
+    waiter.join(0.05)
+    assert waiter.is_alive()                # the default timeout of -1 means "wait", as it does for a Lock
+    semaphore.release()
+    waiter.join()
+    assert got == [True]
+
+    name, acquires, contended, wait_ns, hold_ns = semaphore.threads[waiter]
+    assert (name, acquires, contended) == ("Waiter", 1, 1) and wait_ns >= 0.04e9
+    assert semaphore.threads[threading.current_thread()][1:3] == [1, 2]
+    assert semaphore.longest_holder == "MainThread"
+
+
+def test_instrumented_lock_timeouts():
+    lock = classes_instrumented.InstrumentedLock("lock")
+    assert lock.acquire(timeout=None)
+    assert not lock.acquire(timeout=0.01) and not lock.acquire(blocking=False)
+    threading.Timer(0.02, lock.release).start()
+    assert lock.acquire()                   # -1, as for a Lock: wait as long as it takes
+    lock.release()
+
+
+def test_instrumented_lock_counts_every_thread_separately():
+    lock = classes_instrumented.InstrumentedLock("lock")
+
+    def hold():
+        with lock:
+            pass
+
+    threads = []
+    for n in range(5):                      # one after another, so finished threads' idents get reused
+        thread = threading.Thread(target=hold, name=f"Runner{n}")
+        thread.start()
+        thread.join()
+        threads.append(thread)
+    assert [lock.threads[thread][:3] for thread in threads] == [[f"Runner{n}", 1, 0] for n in range(5)]
+    assert all(not starts for starts in lock.held_since.values())
+
+
+def test_instrumented_lock_released_by_another_thread():
+    lock = classes_instrumented.InstrumentedLock("lock")
+    lock.acquire()
+    releaser = threading.Thread(target=lock.release)
+    releaser.start()
+    releaser.join()
+    assert lock.threads[threading.current_thread()][4] > 0
+    assert releaser not in lock.threads
+    assert lock.acquire(blocking=False)
+    lock.release()
+
+
+def test_instrumented_lock_report(caplog):
+    caplog.set_level(logging.INFO)
+    lock = classes_instrumented.InstrumentedLock("reported")
+    with lock:
+        pass
+    lock.report()
+    assert caplog.records[0].getMessage() == "Contention on reported:"
+    assert caplog.records[2].getMessage().split()[:3] == ["MainThread", "1", "0"]
+
+
+def progress_record(src: str, created: float, msg=classes_simple.TESTING):
+    dots = classes_simple.ProgressDots(" testing...", 2)
+    record = logging.LogRecord("root", logging.INFO, __file__, 1, msg, (1, dots), None)
+    record.src, record.created = src, created
+    return record
+
+
+def test_progress_sampler_lets_one_line_per_interval_through():
+    sampler = classes_simple.ProgressSampler(5)
+    passed = [sampler.filter(progress_record("Alpha", when)) for when in (100, 101, 104.9, 105, 106)]
+    assert passed == [True, False, False, True, False]
+    assert sampler.filter(progress_record("Beta", 106))                             # every object on its own
+    assert sampler.filter(progress_record("Alpha", 106, "I have a test result of %s"))  # not a progress line
+    assert progress_record("Alpha", 0).getMessage() == "Test 1 testing... testing..."
+
+
+def test_tick_scales_every_wait(monkeypatch):
+    monkeypatch.setattr(classes_simple.TestLogger, "tick", 0)
+    monkeypatch.setattr(classes_simple.TestRunner, "tick", 0)
+    logger = classes_singleflight.CrashingSingleFlightLogger()
+    logger.results_transmit_time = 1000
+    start = time.monotonic()
+    with pytest.raises(Exception):
+        logger.get_testrun("Alpha")
+    runner = classes_simple.TestRunner("Beta")
+    runner.initialize_log(logger)
+    runner.run_tests(3)
+    assert time.monotonic() - start < 1 and len(logger.results) == logger.transmits == 3
+
+
+def test_queued_log_setup_formats_in_the_writer(monkeypatch, capsys):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", logging.WARNING)
+    formatted = []
+
+    class Dots(classes_simple.ProgressDots):
+        def __str__(self):
+            formatted.append(threading.current_thread().name)
+            return super().__str__()
+
+    listener = classes_simple.queued_log_setup(progress_interval=60)
+    try:
+        for tick in range(1, 4):
+            logging.info(classes_simple.TESTING, 1, Dots(" testing...", tick), extra={"src": "Alpha"})
+        logging.info("I have a test result of %s", "pass", extra={"src": "Alpha"})
+    finally:
+        listener.stop()
+        root.handlers[0].close()
+
+    lines = capsys.readouterr().err.splitlines()
+    assert [line.split("] ")[1] for line in lines] == ["Test 1 testing...", "I have a test result of pass"]
+    assert formatted and threading.current_thread().name not in formatted
+
+
+def test_duration_history_estimates_from_a_running_mean(tmp_path):
+    path = str(tmp_path / "durations.json")
+    history = classes_scheduler.DurationHistory(path)
+    assert history.estimate("test_a") == 1.0
+    history.record("test_a", 4)
+    history.record("test_b", 2)
+    history.record("test_a", 8)             # a moving average: halfway from 4 to 8
+    assert history.estimate("test_a") == 6
+    assert history.estimate("test_new") == 4 == sum(history.durations.values()) / 2
+
+    history.save()
+    loaded = classes_scheduler.DurationHistory(path)
+    assert loaded.durations == history.durations and loaded.estimate("test_new") == 4
+
+
+def test_scheduler_deals_longest_first_and_steals_the_shortest(tmp_path):
+    history = classes_scheduler.DurationHistory(str(tmp_path / "durations.json"))
+    for test, seconds in {"t1": 8, "t2": 5, "t3": 4, "t4": 2, "t5": 1}.items():
+        history.record(test, seconds)
+    scheduler = classes_scheduler.WorkStealingScheduler(["t1", "t2", "t3", "t4", "t5"], ["Alpha", "Beta"], history)
+    assert scheduler.queues == {"Alpha": deque(["t1", "t4"]), "Beta": deque(["t2", "t3", "t5"])}
+
+    assert [scheduler.next_test("Alpha") for _ in range(3)] == ["t1", "t4", "t5"]   # t5 stolen from Beta
+    assert scheduler.steals == 1 and scheduler.remaining["Beta"] == 9
+    assert [scheduler.next_test("Beta") for _ in range(3)] == ["t2", "t3", None]
+    assert scheduler.next_test("Alpha") is None
+
+
+def test_stealing_runners_run_every_test_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(classes_simple.TestRunner, "tick", 0)   # nothing sleeps, and nothing divides by it
+    durations = {f"t{n}": n % 5 + 1 for n in range(40)}
+    history = classes_scheduler.DurationHistory(str(tmp_path / "durations.json"))
+    scheduler = classes_scheduler.WorkStealingScheduler(list(durations), ["Alpha", "Beta", "Gamma"], history)
+    logger = classes_simple.TestLogger()
+    logger.results_transmit_time = 0
+
+    def run(name):
+        runner = classes_scheduler.StealingRunner(name)
+        runner.results_logger = logger
+        runner.run_scheduled(scheduler, durations)
+
+    run_threads(run, [("Alpha",), ("Beta",), ("Gamma",)])
+    assert sorted(test for _, test, _ in logger.results) == sorted(durations)
+    assert history.durations == durations
+
+
+def test_results_store_counts_and_iterates():
+    store = classes_results.ResultsStore()
+    store.append("Alpha", 1, "pass")
+    store.extend([("Beta", 1, "fail"), ("Alpha", 2, "pass"), ("Beta", "t2", "timeout")])
+    assert len(store) == 4
+    assert store.counts() == {"pass": 2, "fail": 1, "skip": 0, "xfail": 0, "timeout": 1}
+    assert list(store) == [("Alpha", 1, "pass"), ("Beta", 1, "fail"), ("Alpha", 2, "pass"), ("Beta", "t2", "timeout")]
+    assert store.runner_names == ["Alpha", "Beta"] and store.test_ids == [1, 2, "t2"]
+    assert next(store.lines()) == "  Alpha 1: pass"
+    with pytest.raises(KeyError):
+        store.append("Alpha", 3, "passed")
+    assert len(store) == 4
+
+
+def test_results_store_appends_from_many_threads():
+    store = classes_results.ResultsStore()
+    run_threads(lambda name: [store.append(name, test, "skip") for test in range(200)],
+                [(f"Runner{n}",) for n in range(8)])
+    assert len(store) == 1600 and store.counts()["skip"] == 1600
+    assert sorted(store) == sorted((f"Runner{n}", test, "skip") for n in range(8) for test in range(200))
+
+
+def test_results_store_exports(tmp_path):
+    store = classes_results.ResultsStore()
+    store.extend([("Alpha", 1, "pass"), ("Beta", 2, "xfail")])
+
+    file = io.StringIO()
+    assert store.export_jsonl(file) == 2
+    assert [json.loads(line) for line in file.getvalue().splitlines()] == \
+        [{"runner": "Alpha", "test": 1, "result": "pass"}, {"runner": "Beta", "test": 2, "result": "xfail"}]
+
+    path = str(tmp_path / "results.db")
+    assert store.export_sqlite(path, "run_1") == 2
+    assert store.export_sqlite(path, "run_1") == 2      # adds to the table
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*), MIN(test) FROM run_1").fetchone() == (4, "1")
+    for table in ("results; DROP TABLE run_1", "1st", "run-1", ""):
+        with pytest.raises(ValueError):
+            store.export_sqlite(path, table)
+
+
+def test_simulated_time_jumps_to_the_next_timer():
+    async def sleepy():
+        await asyncio.gather(asyncio.sleep(3600), asyncio.sleep(86400))
+        return asyncio.get_running_loop().time()
+
+    assert classes_simulated.simulate(sleepy()) == 86400
+
+
+def test_simulated_deadlock_is_reported():
+    async def stuck():
+        await asyncio.get_running_loop().create_future()
+
+    with pytest.raises(RuntimeError, match="deadlocked"):
+        classes_simulated.simulate(stuck())
+
+
+def test_metered_semaphore_metrics():
+    async def hold(semaphore, seconds):
+        async with semaphore:
+            await asyncio.sleep(seconds)
+
+    async def main():
+        semaphore = classes_simulated.MeteredSemaphore("slot")
+        await asyncio.gather(hold(semaphore, 2), hold(semaphore, 2), hold(semaphore, 1))
+        return semaphore.metrics(asyncio.get_running_loop().time() + 5)
+
+    assert classes_simulated.simulate(main()) == {
+        "acquires": 3, "contended": 2, "mean_wait_s": 2.0, "max_wait_s": 4.0, "utilization": 0.5,
+    }
+
+
+def test_simulated_runs_repeat_exactly():
+    for strategy in run_simulated.STRATEGIES:
+        run = classes_simulated.simulate(run_simulated.simulated_run(strategy, 20, 3, 0.5), seed=7)
+        assert run == classes_simulated.simulate(run_simulated.simulated_run(strategy, 20, 3, 0.5), seed=7)
+        assert sum(run["counts"].values()) == 60
+    assert run != classes_simulated.simulate(run_simulated.simulated_run(strategy, 20, 3, 0.5), seed=8)
+
+
+BENCHMARK = {"runners": 3, "tests": 2, "tick": 0.001, "initialize_time": 4, "transmit_time": None, "test_time": None,
+             "timeout": 30}
+
+
+class ExplodingLogger(classes_simple.TestLogger):
+    def __init__(self):
+        raise RuntimeError("no logger for you")
+
+
+def test_benchmark_scenarios_report_back():
+    rows = [run_benchmark.benchmark(scenario, BENCHMARK) for scenario in ("sequential", "parallel", "mutex_safe")]
+    assert [row["status"] for row in rows] == ["ok"] * 3
+    sequential, parallel, safe = rows
+    assert sequential["results"] == parallel["results"] == 6 and sequential["duplicate_testruns"] == 0
+    assert parallel["duplicate_testruns"] == 2      # every runner made its own test run
+    assert safe["crashed_runners"] == 1 and safe["results"] == 4
+
+
+def test_benchmark_semaphore_runner_keeps_its_test_time(monkeypatch):
+    seen = []
+    monkeypatch.setattr(run_benchmark.SemaphoreRunner, "initialize_log",
+                        lambda self, logger: seen.append(self.test_time))
+    monkeypatch.setattr(run_benchmark.SemaphoreRunner, "run_tests", lambda self, tests: None)
+    run_benchmark.runner_tests("Alpha", None, run_benchmark.SemaphoreRunner, BENCHMARK)
+    run_benchmark.runner_tests("Alpha", None, run_benchmark.SemaphoreRunner, {**BENCHMARK, "test_time": 5})
+    assert seen == [1, 5]
+
+
+def test_benchmark_semaphore_logger_keeps_its_transmit_time():
+    logger = run_benchmark.new_logger(run_benchmark.SemaphoreLogger, BENCHMARK)
+    assert logger.results_transmit_time == 4
+    logger = run_benchmark.new_logger(run_benchmark.SemaphoreLogger, {**BENCHMARK, "transmit_time": 2})
+    assert logger.results_transmit_time == 2
+    assert run_benchmark.new_logger(classes_simple.TestLogger, BENCHMARK).results_transmit_time == 1
+
+
+def test_benchmark_tells_a_crash_from_a_timeout(monkeypatch):
+    monkeypatch.setitem(run_benchmark.SCENARIOS, "exploding", (ExplodingLogger, classes_simple.TestRunner, True))
+    start = time.monotonic()
+    row = run_benchmark.benchmark("exploding", BENCHMARK)
+    assert row == {"scenario": "exploding", "status": "crashed with exit code 1"}
+    assert time.monotonic() - start < 10                    # not after the whole timeout
+
+    row = run_benchmark.benchmark("mutex_deadlock", {**BENCHMARK, "timeout": 0.5})
+    assert row == {"scenario": "mutex_deadlock", "status": "timed out after 0.5s"}
@@ -0,0 +1,86 @@
+# wordify package
+#
+# Turns a numeric currency string into english words, e.g. "$207.32" is converted to
+# "two hundred seven dollars and thirty-two cents"
+#
+# Run "python -m wordify --help" to convert whole files from the command line.
+#
+# Importing the package only loads the converter in wordify.core, which needs nothing but the standard
+# library.  Everything else (the cache, the buffer writers, other currencies, unwordify, the
+# Decimal reference implementation) is imported the first time one of its names is used.
+from wordify.core import (
+    amount_error,
+    amountPieces,
+    amountToWord,
+    centsToWord,
+    cent_limit,
+    cent_words,
+    dollar_words,
+    int_words,
+    intToWord,
+    ParseError,
+    parse_amount,
+    scales,
+    words_dicts,
+    wordify,
+    wordify_many,
+)
+
+# name: the module it is imported from on first use
+_lazy = {
+    "CacheStats": "wordify.cache",
+    "WordifyCache": "wordify.cache",
+    "unwordify": "wordify.unwordify",
+    "ranges": "wordify.reference",
+    "wordify_reference": "wordify.reference",
+    "wordify_into": "wordify.writer",
+    "wordify_bytes_into": "wordify.writer",
+    "register_currency": "wordify.currency",
+    "wordify_currency": "wordify.currency",
+    "wordify_many_currency": "wordify.currency",
+}
+
+
+def __getattr__(name):
+    module = _lazy.get(name)
+    if module is None:
+        raise AttributeError(f"module 'wordify' has no attribute '{name}'")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
+
+
+__all__ = [
+    "amount_error",
+    "amountPieces",
+    "amountToWord",
+    "CacheStats",
+    "centsToWord",
+    "cent_limit",
+    "cent_words",
+    "dollar_words",
+    "int_words",
+    "intToWord",
+    "ParseError",
+    "parse_amount",
+    "ranges",
+    "register_currency",
+    "scales",
+    "unwordify",
+    "WordifyCache",
+    "words_dicts",
+    "wordify",
+    "wordify_bytes_into",
+    "wordify_currency",
+    "wordify_into",
+    "wordify_many",
+    "wordify_many_currency",
+    "wordify_reference",
+]
@@ -0,0 +1,85 @@
+# wordify cache
+#
+# Real payment data repeats itself: the same few thousand amounts make up most rows.  WordifyCache is
+# an opt-in, bounded LRU cache in front of wordify(), keyed by the amount after the "$" / "," stripping,
+# so "$1,000" and "1000" share one entry.
+#
+#   convert = WordifyCache(maxsize=10000)
+#   convert("$9.99")        # same answer as wordify("$9.99")
+#   convert.stats()         # CacheStats(hits=..., misses=..., evictions=..., size=..., maxsize=10000)
+#
+# Only successful conversions are cached.  An amount wordify() refuses raises every single time.
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple
+
+from wordify.core import wordify
+
+
+class CacheStats(NamedTuple):
+    """ A snapshot of a WordifyCache's counters """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class WordifyCache:
+    """ A thread-safe, least-recently-used cache of wordify() results """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError(f"A cache needs room for at least 1 amount, not {maxsize}!")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()   # normalized amount -> words, least recently used first
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def wordify(self, numberstring: str) -> str:
+        """ Same as wordify(), but remembers the answer for next time """
+
+        key = numberstring.replace('$', '').replace(',', '').strip()
+
+        with self._lock:
+            words = self._entries.get(key)
+            if words is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return words
+            self._misses += 1
+
+        # Convert outside the lock so one slow conversion never holds up other threads.
+        # If this raises, nothing gets cached and the caller sees the error as usual.
+        words = wordify(key)
+
+        with self._lock:
+            self._entries[key] = words
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return words
+
+    __call__ = wordify
+
+    def stats(self) -> CacheStats:
+        """ Hits, misses and evictions so far, plus how full the cache is """
+
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self.maxsize)
+
+    def clear(self):
+        """ Forget every cached amount and reset the counters """
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
@@ -0,0 +1,296 @@
+# wordify command line
+#
+# Streams amounts from a file (or stdin) and writes their english words out as it goes:
+#
+#   python -m wordify amounts.txt -o words.txt
+#   python -m wordify payments.csv --csv-column amount -o payments_words.csv
+#   cat amounts.txt | python -m wordify > words.txt
+#
+# Input is read, converted and written one chunk of rows at a time, so memory stays flat no matter
+# how big the input is.  Rows that can't be converted go to a separate reject stream (stderr, unless
+# --rejects is given) as "<line number><tab><input><tab><reason>" lines.
+#
+# Lines end at "\n" only (a "\r" right before it is dropped), whichever way the input is read: a bare "\r"
+# or any other character str.splitlines() would break on stays part of its row.  CSV input is handed to the
+# csv module with its line endings still on, so a quoted field can hold line breaks of its own.
+import argparse
+import contextlib
+import csv
+import itertools
+import mmap
+import sys
+import time
+from decimal import InvalidOperation
+
+from wordify.core import wordify_many
+
+CHUNK_ROWS = 65536          # How many rows get converted (and written) at a time
+BUFFER_BYTES = 1 << 20      # Read/write buffer size for files
+MAP_BLOCK_BYTES = 1 << 22   # How much of a memory-mapped file gets decoded at a time
+CHUNK_BYTES = 1 << 23       # How much of the input file each worker converts at a time with --workers
+
+
+def reject_reason(error):
+    """ A short, readable reason for a row wordify() refused """
+
+    if isinstance(error, InvalidOperation):
+        return "not a number"
+    return str(error)
+
+
+def chunked(iterable, size):
+    """ Yield lists of up to `size` items from `iterable` """
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def rejects_text(rejects, offset=0):
+    """ Reject lines for a list of (line number, input, reason), with `offset` added to every line number """
+
+    return "".join(f"{line_number + offset}\t{line}\t{reason}\n" for line_number, line, reason in rejects)
+
+
+def split_lines(text):
+    """ The lines of a block of text, split at "\n" only, without their line endings """
+
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return [line.rstrip("\r") for line in lines]
+
+
+def stream_lines(stream, keepends=False):
+    """ Yield every line of a text stream, without its line ending (unless `keepends`) """
+
+    if keepends:
+        yield from stream
+        return
+    for line in stream:
+        yield line.rstrip("\r\n")
+
+
+def mapped_lines(path, block_bytes=MAP_BLOCK_BYTES, keepends=False):
+    """ Yield every line of a file through a memory map, decoding one block of whole lines at a time
+
+        Lines come without their line endings, unless `keepends`.
+    """
+
+    with open(path, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            return
+        with mapped:
+            start, size = 0, len(mapped)
+            while start < size:
+                # Every block ends on a whole line
+                end = start + block_bytes
+                if end < size:
+                    newline = mapped.find(b"\n", end)
+                    end = size if newline < 0 else newline + 1
+                else:
+                    end = size
+
+                lines = mapped[start:end].decode("utf-8").split("\n")
+                last = lines.pop()  # "" unless the file doesn't end with a line ending
+                for line in lines:
+                    yield line + "\n" if keepends else line.rstrip("\r")
+                if last:
+                    yield last if keepends else last.rstrip("\r")
+                start = end
+
+
+def convert_lines(lines, first_line):
+    """ Convert one chunk of plain lines
+
+        Returns (words text, rejects, converted count, rejected count); rejects are (line number, input, reason)
+    """
+
+    words, rejects = [], []
+    for line_number, line, result in zip(itertools.count(first_line), lines, wordify_many(lines)):
+        if isinstance(result, str):
+            words.append(result)
+        else:
+            rejects.append((line_number, line, reject_reason(result)))
+
+    words_text = "\n".join(words) + "\n" if words else ""
+    return words_text, rejects, len(words), len(rejects)
+
+
+def convert_rows(numbered_rows, column, writer):
+    """ Convert one chunk of CSV rows, writing each converted row (plus a words column) to `writer`
+
+        Returns (rejects, converted count, rejected count); rejects are (line number, input, reason)
+    """
+
+    amounts = [row[column] if column < len(row) else "" for _, row in numbered_rows]
+    converted, rejects = [], []
+    for (line_number, row), amount, result in zip(numbered_rows, amounts, wordify_many(amounts)):
+        if isinstance(result, str):
+            row.append(result)
+            converted.append(row)
+        else:
+            rejects.append((line_number, amount, reject_reason(result)))
+
+    writer.writerows(converted)
+    return rejects, len(converted), len(rejects)
+
+
+def numbered_rows(reader):
+    """ Yield (line number, row) for every row a csv.reader reads; a row spanning lines gets its first one """
+
+    line_number = reader.line_num
+    for row in reader:
+        yield line_number + 1, row
+        line_number = reader.line_num
+
+
+def input_lines(path, use_mmap=False, keepends=False):
+    """ Yield every line of the input file (or stdin, for "-"), without its line ending (unless `keepends`) """
+
+    if use_mmap:
+        yield from mapped_lines(path, keepends=keepends)
+    elif path == "-":
+        if hasattr(sys.stdin, "reconfigure"):
+            sys.stdin.reconfigure(newline="\n")
+        yield from stream_lines(sys.stdin, keepends)
+    else:
+        with open(path, encoding="utf-8", newline="\n", buffering=BUFFER_BYTES) as stream:
+            yield from stream_lines(stream, keepends)
+
+
+def open_output(path, default):
+    """ Open a file to write to, or hand back `default` (stdout/stderr) for "-" """
+
+    if path == "-":
+        return contextlib.nullcontext(default)
+    return open(path, "w", encoding="utf-8", newline="", buffering=BUFFER_BYTES)
+
+
+def convert_plain(args, output, rejects):
+    """ One amount per line """
+
+    lines = input_lines(args.input, args.mmap)
+    converted = rejected = 0
+    first_line = 1
+    for chunk in chunked(lines, args.chunk_rows):
+        words_text, chunk_rejects, chunk_converted, chunk_rejected = convert_lines(chunk, first_line)
+        output.write(words_text)
+        rejects.write(rejects_text(chunk_rejects))
+        converted += chunk_converted
+        rejected += chunk_rejected
+        first_line += len(chunk)
+    return converted, rejected
+
+
+def find_column(args, reader, writer):
+    """ Work out which CSV column holds the amounts
+
+        A numbered column means there is no header row.  A named column is looked up in the header row
+        read from `reader`, and the header is written back out to `writer` with a words column added.
+        Returns the 0-based column, or None if the input is empty.
+    """
+
+    if args.csv_column.isdigit():
+        return int(args.csv_column) - 1
+
+    header = next(reader, None)
+    if header is None:
+        return None
+    if args.csv_column not in header:
+        raise SystemExit(f"Column '{args.csv_column}' is not in the CSV header: {', '.join(header)}")
+    writer.writerow(header + [f"{args.csv_column}_words"])
+    return header.index(args.csv_column)
+
+
+def convert_csv(args, output, rejects):
+    """ Amounts in one column of a CSV file; every converted row is written back out with its words appended """
+
+    reader = csv.reader(input_lines(args.input, args.mmap, keepends=True), delimiter=args.csv_delimiter)
+    writer = csv.writer(output, delimiter=args.csv_delimiter, lineterminator="\n")
+
+    column = find_column(args, reader, writer)
+    if column is None:
+        return 0, 0
+
+    converted = rejected = 0
+    for chunk in chunked(numbered_rows(reader), args.chunk_rows):
+        chunk_rejects, chunk_converted, chunk_rejected = convert_rows(chunk, column, writer)
+        rejects.write(rejects_text(chunk_rejects))
+        converted += chunk_converted
+        rejected += chunk_rejected
+    return converted, rejected
+
+
+def convert_parallel(args, output, rejects):
+    """ Split the input file into byte ranges and convert them across several processes """
+
+    from wordify.parallel import convert_file
+
+    return convert_file(args.input, output, rejects, workers=args.workers, chunk_bytes=args.chunk_bytes)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m wordify",
+        description="Convert currency amounts into english words, one amount per line or from a CSV column.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="file to read amounts from (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="file to write words to (default: stdout)")
+    parser.add_argument("--rejects", default="-",
+                        help="file to write rows that could not be converted to (default: stderr)")
+    parser.add_argument("--csv-column", default=None,
+                        help="read amounts from this CSV column: a header name, or a 1-based column number "
+                             "for files without a header row")
+    parser.add_argument("--csv-delimiter", default=",", help="CSV field delimiter (default: ',')")
+    parser.add_argument("--mmap", action="store_true", help="memory-map the input file instead of reading it")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS,
+                        help=f"rows converted per chunk (default: {CHUNK_ROWS})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="convert the input file across this many processes; 0 means one per core; "
+                             "plain input only (default: 1)")
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES,
+                        help=f"bytes of input each worker converts at a time with --workers (default: {CHUNK_BYTES})")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't report rows/sec when finished")
+    args = parser.parse_args(argv)
+
+    if args.mmap and args.input == "-":
+        parser.error("--mmap needs an input file, not stdin")
+    if args.workers != 1 and args.input == "-":
+        parser.error("--workers needs an input file, not stdin")
+    if args.workers != 1 and args.csv_column is not None:
+        parser.error("--workers only works on plain input, not with --csv-column: a quoted CSV field can hold "
+                     "a line break, so the file can't be split between workers at any line")
+    if args.workers < 0:
+        parser.error("--workers can't be negative")
+    if args.chunk_bytes < 1:
+        parser.error("--chunk-bytes must be at least 1")
+    if args.chunk_rows < 1:
+        parser.error("--chunk-rows must be at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    start = time.perf_counter()
+    with open_output(args.output, sys.stdout) as output, open_output(args.rejects, sys.stderr) as rejects:
+        if args.workers != 1:
+            converted, rejected = convert_parallel(args, output, rejects)
+        elif args.csv_column is None:
+            converted, rejected = convert_plain(args, output, rejects)
+        else:
+            converted, rejected = convert_csv(args, output, rejects)
+        output.flush()
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        rows = converted + rejected
+        print(f"{rows} rows in {elapsed:.2f}s ({rows / elapsed if elapsed else 0:,.0f} rows/sec): "
+              f"{converted} converted, {rejected} rejected", file=sys.stderr)
+    return 1 if rejected else 0
@@ -0,0 +1,147 @@
+# wordify in other currencies
+#
+# A currency profile says what the units and subunits are called (singular and plural, since not every
+# plural is just an "s": "penny" / "pence", "yen" / "yen"), how many decimal places the subunit has, and
+# the currency's symbol.  Each profile is compiled once, when it is registered, into a plan holding every
+# label already attached to its words, so converting an amount only looks words up; nothing is concatenated.
+#
+#   wordify_currency("£1.01", "GBP")                         # "one pound and one penny"
+#   wordify_many_currency([("5", "JPY"), ("$2.50", "USD")])  # mixed batches, one plan lookup per row
+#   register_currency("CHF", "franc", "francs", "centime", "centimes", symbol="CHF")
+from types import MappingProxyType
+
+from wordify.core import (
+    amount_error,
+    amountToWord,
+    int_words,
+    ParseError,
+    parse_amount,
+)
+
+# code: MappingProxyType of the profile, as given to register_currency()
+profiles = {}
+
+# code: (precision, subunits per unit, unit words, unit label, subunit words, symbol)
+plans = {}
+
+
+# Accepts a label's singular and plural
+#
+# Returns the words for every piece from 0 - 999 with the right label attached
+def named_words(singular, plural):
+    return tuple(f"{words} {singular if piece == 1 else plural}" for piece, words in enumerate(int_words))
+
+
+def register_currency(code, unit, units, subunit=None, subunits=None, precision=2, symbol=None):
+    """ Compile a currency profile into a plan, and make it available to wordify_currency() as `code`
+
+        `unit` / `units` are the singular and plural names of the unit, `subunit` / `subunits` the same for
+        the subunit.  `precision` is how many decimal places the subunit takes (0 - 3; 0 means there is no
+        subunit at all).  `symbol` (say, "€") is ignored in amounts of this currency, like "$" always is.
+    """
+
+    if not 0 <= precision <= 3:
+        raise ValueError(f"A subunit can have 0 - 3 decimal places, not {precision}!")
+    if precision and not (subunit and subunits):
+        raise ValueError(f"{code} has {precision} decimal places, so it needs subunit names!")
+
+    profiles[code] = MappingProxyType({
+        "unit": unit, "units": units, "subunit": subunit, "subunits": subunits, "precision": precision,
+        "symbol": symbol,
+    })
+    subunit_words = named_words(subunit, subunits)[:10 ** precision] if precision else ()
+    plans[code] = (precision, 10 ** precision, named_words(unit, units), units, subunit_words, symbol)
+
+
+register_currency("EUR", "euro", "euros", "cent", "cents", symbol="€")
+register_currency("GBP", "pound", "pounds", "penny", "pence", symbol="£")
+register_currency("JPY", "yen", "yen", precision=0, symbol="¥")
+register_currency("KWD", "dinar", "dinars", "fils", "fils", precision=3, symbol="KD")
+register_currency("USD", "dollar", "dollars", "cent", "cents", symbol="$")
+
+
+def currency_error(error, numberstring, currency, precision):
+    """ The exception for a ParseError in an amount of `currency`; like amount_error(), but what counts as a
+        number, and too much precision, are measured against the currency's own symbol and decimal places
+        (dollars keep wordify()'s messages)
+    """
+
+    if currency == "USD" or error is ParseError.TOO_LARGE or error is ParseError.NEGATIVE:
+        return amount_error(error, numberstring)
+    if error is ParseError.NOT_A_NUMBER:
+        from decimal import InvalidOperation  # only paid for once something goes wrong
+
+        symbol = plans[currency][5]
+        allowed = f"one '.', ',' and '{symbol}'" if symbol else "one '.' and ','"
+        return InvalidOperation(f"{numberstring.strip()} is not an amount in {currency}; only digits, {allowed} "
+                                f"are allowed!")
+    cleaned = numberstring.replace('$', '').replace(',', '').strip()
+    if not precision:
+        units = profiles[currency]["units"]
+        return ValueError(f"{cleaned} has too much precision; {currency} amounts are whole {units}!")
+    return ValueError(f"{cleaned} has too much precision; {currency} only has {precision} decimal places!")
+
+
+def convert(numberstring, currency, plan):
+    """ The words for an amount of `currency`, or the exception wordify_currency() raises for it """
+
+    precision, scale, unit_words, unit_label, subunit_words, symbol = plan
+    if symbol != "$" and "$" in numberstring:
+        # parse_amount() lets "$" through in any amount; only dollars may have one
+        return currency_error(ParseError.NOT_A_NUMBER, numberstring, currency, precision)
+    if symbol:
+        numberstring = numberstring.replace(symbol, "")
+    number = parse_amount(numberstring, precision)
+    if number.__class__ is ParseError:
+        return currency_error(number, numberstring, currency, precision)
+    units, subunits = divmod(number, scale)
+    return amountToWord(units, subunits, unit_words, unit_label, subunit_words)
+
+
+def wordify_currency(numberstring, currency="USD"):
+    """ Convert an amount of `currency` to english words
+
+        Input is restricted exactly as for wordify(), with the currency's own number of decimal places and
+        its symbol allowed.  Raises KeyError for a currency that isn't registered, and what wordify() raises
+        for a bad amount.
+    """
+
+    words = convert(numberstring, currency, plans[currency])
+    if words.__class__ is not str:
+        raise words
+    return words
+
+
+def wordify_many_currency(rows, memo=4096):
+    """ Convert an iterable of (amount, currency) pairs (tuples or lists), in any mix of currencies
+
+        Returns a list with one entry per row, in the same order: the words, or the exception
+        wordify_currency() would have raised for that row (TypeError for a row that isn't a pair of
+        strings).  Nothing is raised.  The words for the first `memo` distinct rows are remembered, as
+        wordify_many() does.
+    """
+
+    results = []
+    append = results.append
+    seen = {}
+
+    for row in rows:
+        if row.__class__ is list:
+            row = tuple(row)
+        if row.__class__ is not tuple or len(row) != 2 or not isinstance(row[0], str) \
+                or not isinstance(row[1], str):
+            append(TypeError(f"{row!r} is not an (amount, currency) pair of strings"))
+            continue
+
+        words = seen.get(row)
+        if words is None:
+            numberstring, currency = row
+            plan = plans.get(currency)
+            if plan is None:
+                append(KeyError(f"{currency} is not a registered currency"))
+                continue
+            words = convert(numberstring, currency, plan)
+            if words.__class__ is str and len(seen) < memo:
+                seen[row] = words
+        append(words)
+    return results
@@ -0,0 +1,89 @@
+# wordify multi-core conversion
+#
+# Splits an input file into byte ranges that each start and end on a whole line, converts every range
+# in a ProcessPoolExecutor worker, and hands the results back in the original order.  Plain input only: a
+# quoted CSV field can hold a line break, so a CSV file can't be cut at just any line.
+#
+# Tasks only carry (path, start, end): every worker builds the word tables once when it imports
+# wordify.core at startup, and reads its own slice of the file, so no amounts or tables get pickled.
+import concurrent.futures
+import os
+from collections import deque
+
+from wordify.cli import CHUNK_BYTES, convert_lines, rejects_text, split_lines
+
+
+def byte_ranges(path, chunk_bytes=CHUNK_BYTES, start=0):
+    """ Split a file into (start, end) byte ranges of roughly `chunk_bytes`, each ending on a whole line """
+
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        while start < size:
+            file.seek(min(start + chunk_bytes, size))
+            file.readline()
+            end = min(file.tell(), size)
+            yield start, end
+            start = end
+
+
+def read_range(path, start, end):
+    """ The lines between two byte offsets of a file, without their line endings """
+
+    with open(path, "rb") as file:
+        file.seek(start)
+        return split_lines(file.read(end - start).decode("utf-8"))
+
+
+def start_worker():
+    """ Runs once in every worker process; importing the converter builds its word tables """
+
+    import wordify.core  # noqa: F401
+
+
+def convert_range(path, start, end):
+    """ Convert one byte range of the input file
+
+        Returns (words text, rejects, converted count, rejected count, line count).  Rejects are
+        (line number, input, reason), numbered from the start of the range; the parent process renumbers them.
+    """
+
+    lines = read_range(path, start, end)
+    return convert_lines(lines, 1) + (len(lines),)
+
+
+def convert_file(path, output, rejects, workers=None, chunk_bytes=CHUNK_BYTES, start=0, first_line=1):
+    """ Convert a whole file across `workers` processes (default: one per core)
+
+        Output and rejects are written in input order.  Only a couple of chunks per worker are ever in
+        flight, so memory stays flat however large the file is.
+
+        Returns (converted count, rejected count)
+    """
+
+    workers = workers or os.cpu_count() or 1
+    converted = rejected = 0
+    line_offset = first_line - 1
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=start_worker) as executor:
+        in_flight = deque()
+        ranges = byte_ranges(path, chunk_bytes, start)
+
+        def submit_next():
+            for range_start, range_end in ranges:
+                in_flight.append(executor.submit(convert_range, path, range_start, range_end))
+                return
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        while in_flight:
+            words_text, chunk_rejects, chunk_converted, chunk_rejected, lines = in_flight.popleft().result()
+            submit_next()
+
+            output.write(words_text)
+            rejects.write(rejects_text(chunk_rejects, line_offset))
+            converted += chunk_converted
+            rejected += chunk_rejected
+            line_offset += lines
+
+    return converted, rejected
@@ -0,0 +1,107 @@
+# wordify reference implementation
+#
+# The original Decimal implementation of wordify(), kept so the fast converter in wordify.core always has
+# something to be checked against.  It is only imported when asked for, so plain "import wordify" never
+# pays for the decimal module.
+
+# Let's give our money the respect of a proper Decimal, instead of stinky fluctuating floats
+from decimal import Decimal
+
+from wordify.core import intToWord
+
+# Ranges define how large a number we can convert, and how each portion of the number is treated during conversion
+#   Name = what these are called
+#   Upper = the maximum value
+#   Lower = the minimum value
+#   Plural = is the name pluralized when not "1"?
+#   Mandatory = is this name mandatory even when value is 0?
+ranges = [
+    {
+        "name": "million",
+        "upper": Decimal("1000000000"),
+        "lower": Decimal("1000000"),
+        "plural": False,
+        "mandatory": False,
+    },
+    {
+        "name": "thousand",
+        "upper": Decimal("1000000"),
+        "lower": Decimal("1000"),
+        "plural": False,
+        "mandatory": False,
+    },
+    {
+        "name": "dollar",
+        "upper": Decimal("1000"),
+        "lower": Decimal("1"),
+        "plural": True,
+        "mandatory": True,
+    },
+    {
+        "name": "cent",
+        "upper": Decimal("1"),
+        "lower": Decimal("0.01"),
+        "plural": True,
+        "mandatory": False,
+    },
+]
+
+# Accepts a string representing a positive number, up to 2 decimal precision, and no larger than the largest range.
+# Input is restricted as:
+# - Number must be positive
+# - Number must be smaller than the largest defined Range
+# - Optional "." denotes fractional dollars
+# - Cents precision of 0 to 2 places is permitted
+# - No non-numeric characters besides "$" and "," characters are permitted
+#
+# Returns a string describing the entire number
+#
+# This is the original Decimal implementation; wordify() must always agree with it below a billion.
+def wordify_reference(numberstring):
+    # Turn the string into a malleable decimal
+    numberstring = numberstring.replace('$', '')
+    numberstring = numberstring.replace(',', '')
+    numberstring = numberstring.strip()
+
+    num = Decimal(numberstring)
+    if num >= ranges[0]["upper"]:
+        raise ValueError(f"{numberstring} is too large for me to handle, sorry!")
+    if num < 0:
+        raise ValueError(f"{numberstring} must be positive, sorry!")
+    if num.as_tuple().exponent < -2:
+        raise ValueError(f"{numberstring} has too much precision; in 'Murka we only use 2-decimal place cents!")
+
+    # prep wordstring
+    wordstring = ""
+
+    for r in ranges:
+        # find the piece for this range
+        piece = (num % r["upper"])//r["lower"]
+
+        # If this piece is nothing, and it's not mandatory, ignore it and go to the next
+        if not (piece or r["mandatory"]):
+            continue
+
+        # Include "and" if:
+        # - we already have at least 1 piece,
+        # - the amount is > 0
+        # - and this is the last piece
+        if (len(wordstring)>0) and (num % r["lower"] == 0) and (piece):
+            wordstring = " ".join([wordstring, "and"])
+
+        # prepare the piece name
+        if r["plural"] and piece != 1:
+            piece_label = r["name"] + "s"
+        else:
+            piece_label = r["name"]
+
+        # add the piece if:
+        # - The value is >0, or
+        # - this is the first piece
+        if piece or (len(wordstring) < 1):
+            words = intToWord(piece)
+            wordstring = " ".join([wordstring, words, piece_label]).strip()
+        # Otherwise, we only need the label
+        else:
+            wordstring = " ".join([wordstring, piece_label]).strip()
+    return wordstring
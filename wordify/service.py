@@ -0,0 +1,294 @@
+# wordify as a local service
+#
+# A small asyncio HTTP/1.1 server, so services can share one converter instead of each importing its own:
+#
+#   python -m wordify.service --port 8080
+#
+#   GET  /wordify?amount=$1,234.56      200 "one thousand two hundred thirty-four dollars and fifty-six cents"
+#                                       400 with the reason, for an amount wordify() refuses
+#   POST /wordify                       one amount per line in the body (lines end at "\n", as for the
+#                                       command line); a JSON list back with {"words": ...} or
+#                                       {"error": ...} per line
+#   GET  /stats                         JSON counters (requests, errors, busy, rps, p50/p99 ms) per endpoint
+#
+# Requests aren't converted one at a time: they wait in a queue, and a single batcher converts everything
+# that arrived within --batch-delay (or up to --batch-size amounts, whichever comes first) with one
+# wordify_many() call.  When the queue is full, requests get "503 Service Unavailable" straight away
+# instead of piling up.  Connections are kept alive unless the client asks otherwise.
+#
+# Everything is standard library and the server only listens locally by default; nothing goes off the machine.
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from urllib.parse import parse_qs
+
+from wordify.cli import reject_reason, split_lines
+from wordify.core import wordify_many
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error",
+           503: "Service Unavailable"}
+
+
+class MicroBatcher:
+    """ Collects amounts from many requests and converts them together """
+
+    def __init__(self, max_batch=256, max_delay=0.002, max_queue=4096):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue = asyncio.Queue(max_queue)
+        self.batches = 0
+        self.amounts = 0
+
+    def submit(self, amounts):
+        """ Queue a list of amounts for conversion
+
+            Returns a future for the wordify_many() results of `amounts`.
+            Raises asyncio.QueueFull, without queueing anything, when the queue is full.
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((amounts, future))
+        return future
+
+    async def next_batch(self):
+        """ Wait for a request, then take everything else that arrives before the batch is full or due """
+
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        size = len(batch[0][0])
+        deadline = loop.time() + self.max_delay
+
+        while size < self.max_batch:
+            try:
+                item = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def run(self):
+        """ Convert batches until cancelled """
+
+        while True:
+            batch = await self.next_batch()
+            try:
+                results = wordify_many([amount for amounts, _ in batch for amount in amounts])
+            except Exception as error:
+                # Every request in the batch gets the error; the batcher carries on with the next one
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            self.batches += 1
+            self.amounts += len(results)
+
+            start = 0
+            for amounts, future in batch:
+                end = start + len(amounts)
+                if not future.done():
+                    future.set_result(results[start:end])
+                start = end
+
+
+class EndpointStats:
+    """ Request counters and recent latencies for one endpoint """
+
+    def __init__(self, window=10000):
+        self.requests = 0
+        self.errors = 0   # answered with a 4xx
+        self.busy = 0     # turned away with a 503
+        self.seconds = 0.0
+        self.latencies = deque(maxlen=window)
+
+    def record(self, status, seconds):
+        self.requests += 1
+        if status == 503:
+            self.busy += 1
+        elif status >= 400:
+            self.errors += 1
+        self.seconds += seconds
+        self.latencies.append(seconds)
+
+    def snapshot(self, uptime):
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000, 3)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "busy": self.busy,
+            "rps": round(self.requests / uptime, 1) if uptime else 0.0,
+            "mean_ms": round(self.seconds / self.requests * 1000, 3) if self.requests else 0.0,
+            "p50_ms": percentile(0.50) if latencies else 0.0,
+            "p99_ms": percentile(0.99) if latencies else 0.0,
+        }
+
+
+class WordifyService:
+    """ The HTTP side: parses requests, hands amounts to the batcher and keeps the counters """
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+        self.started = time.monotonic()
+        self.stats = {}
+        self.routes = {
+            ("GET", "/wordify"): self.get_wordify,
+            ("POST", "/wordify"): self.post_wordify,
+            ("GET", "/stats"): self.get_stats,
+        }
+
+    async def get_wordify(self, query, body):
+        amounts = parse_qs(query).get("amount")
+        if not amounts:
+            return 400, "text/plain", "missing ?amount="
+        words = (await self.batcher.submit(amounts[:1]))[0]
+        if isinstance(words, str):
+            return 200, "text/plain", words
+        return 400, "text/plain", reject_reason(words)
+
+    async def post_wordify(self, query, body):
+        amounts = split_lines(body.decode("utf-8"))
+        results = await self.batcher.submit(amounts) if amounts else []
+        return 200, "application/json", json.dumps([
+            {"words": words} if isinstance(words, str) else {"error": reject_reason(words)} for words in results
+        ])
+
+    async def get_stats(self, query, body):
+        uptime = time.monotonic() - self.started
+        return 200, "application/json", json.dumps({
+            "uptime_s": round(uptime, 3),
+            "batches": self.batcher.batches,
+            "amounts": self.batcher.amounts,
+            "queued": self.batcher.queue.qsize(),
+            "endpoints": {endpoint: stats.snapshot(uptime) for endpoint, stats in self.stats.items()},
+        })
+
+    async def respond(self, method, target, body):
+        """ (status, content type, text, endpoint) for one request; endpoint is None for unknown routes """
+
+        path, _, query = target.partition("?")
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.routes):
+                return 405, "text/plain", f"{method} is not allowed on {path}", None
+            return 404, "text/plain", f"{path} not found", None
+
+        endpoint = f"{method} {path}"
+        try:
+            return (*await handler(query, body), endpoint)
+        except asyncio.QueueFull:
+            return 503, "text/plain", "too busy, try again", endpoint
+        except UnicodeDecodeError:
+            return 400, "text/plain", "body is not UTF-8", endpoint
+        except Exception as error:
+            return 500, "text/plain", f"conversion failed: {error}", endpoint
+
+    async def handle(self, reader, writer):
+        """ Serve one connection, request after request, until either side closes it """
+
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                start = time.perf_counter()
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                parts = request_line.split(" ")
+                if len(parts) != 3:
+                    writer.write(response(400, "text/plain", "bad request line", False))
+                    return
+                method, target, version = parts
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    body = await reader.readexactly(int(headers.get("content-length") or 0))
+                except (ValueError, asyncio.IncompleteReadError):
+                    writer.write(response(400, "text/plain", "bad content-length", False))
+                    return
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                status, content_type, text, endpoint = await self.respond(method, target, body)
+                writer.write(response(status, content_type, text, keep_alive))
+                await writer.drain()
+                if endpoint:
+                    self.stats.setdefault(endpoint, EndpointStats()).record(status, time.perf_counter() - start)
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+
+def response(status, content_type, text, keep_alive):
+    """ The bytes of a whole HTTP/1.1 response """
+
+    body = text.encode("utf-8")
+    extra = "Retry-After: 1\r\n" if status == 503 else ""
+    return (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        f"Content-Type: {content_type}; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        f"{extra}\r\n"
+    ).encode("latin-1") + body
+
+
+async def serve(host="127.0.0.1", port=8080, batch_size=256, batch_delay=0.002, queue_size=4096, ready=None):
+    """ Run the service until cancelled; `ready` (if given) is called with the port once it is listening """
+
+    batcher = MicroBatcher(batch_size, batch_delay, queue_size)
+    service = WordifyService(batcher)
+    server = await asyncio.start_server(service.handle, host, port)
+    batching = asyncio.ensure_future(batcher.run())
+    try:
+        async with server:
+            if ready is not None:
+                ready(server.sockets[0].getsockname()[1])
+            await server.serve_forever()
+    finally:
+        batching.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m wordify.service",
+                                     description="Serve wordify() over HTTP, converting requests in micro-batches.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on; 0 picks a free one (default: 8080)")
+    parser.add_argument("--batch-size", type=int, default=256,
+                        help="convert a batch once it has this many amounts (default: 256)")
+    parser.add_argument("--batch-delay", type=float, default=0.002,
+                        help="or once its first request has waited this many seconds (default: 0.002)")
+    parser.add_argument("--queue-size", type=int, default=4096,
+                        help="requests allowed to wait for a batch before answering 503 (default: 4096)")
+    args = parser.parse_args(argv)
+
+    def ready(port):
+        print(f"wordify service listening on {args.host}:{port}", file=sys.stderr, flush=True)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.batch_size, args.batch_delay, args.queue_size, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
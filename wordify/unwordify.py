@@ -0,0 +1,184 @@
+# unwordify: english words back to an amount
+#
+# The reverse of wordify(), for checking that printed cheque text matches the stored amount:
+#
+#   unwordify("one thousand two hundred thirty-four dollars and fifty-six cents")   # 123456 (cents)
+#
+# Every word wordify() can write is put into one dictionary up front, built from the same words_dicts,
+# scales and dollar/cent definitions, so the text is tokenized in a single split with one lookup per word.
+#
+# Run "python -m wordify.unwordify --help" to convert files of words, or to round-trip check wordify().
+import random
+import sys
+import time
+
+from wordify.core import cent_range, centsToWord, dollar_range, parse_amount, scales, words_dicts, wordify
+
+# What kind of word each token is
+NUMBER, HUNDRED, SCALE, DOLLAR, CENT, AND = range(6)
+
+
+def build_vocabulary():
+    """ Every word wordify() can write, mapped to (kind, value) """
+
+    vocabulary = {"hundred": (HUNDRED, 100), "and": (AND, None)}
+    for number, word in words_dicts["singles"].items():
+        vocabulary[word] = (NUMBER, number)
+    for number, word in words_dicts["teens"].items():
+        vocabulary[word] = (NUMBER, 10 + number)
+    for tens, word in words_dicts["tens"].items():
+        vocabulary[word] = (NUMBER, tens * 10)
+        for number in range(1, 10):
+            vocabulary[f"{word}-{words_dicts['singles'][number]}"] = (NUMBER, tens * 10 + number)
+    for group, scale in enumerate(scales, start=1):
+        vocabulary[scale] = (SCALE, group)
+
+    # Labels remember whether they are the plural one
+    for kind, r in ((DOLLAR, dollar_range), (CENT, cent_range)):
+        vocabulary[r["name"]] = (kind, False)
+        if r["plural"]:
+            vocabulary[r["name"] + "s"] = (kind, True)
+    return vocabulary
+
+
+vocabulary = build_vocabulary()
+
+
+# Where unwordify() is in an amount
+DOLLARS, LABELLED, CENTS, CENTS_LABEL, DONE = range(5)
+
+
+def unwordify(text, strict=False):
+    """ Turn english words, as written by wordify(), back into a whole number of cents
+
+        "and" is accepted anywhere wordify() could put one.  With `strict`, the text must also be exactly what
+        wordify() would write for that amount (ignoring extra whitespace).
+
+        Raises ValueError for unknown words, or words in an order wordify() would never write them.
+    """
+
+    dollars = cents = 0
+    group = None            # the three-digit group being read, if any
+    after_hundred = False   # has the current group had its "hundred" yet?
+    smallest_scale = len(scales) + 1
+    anded = False
+    stage = DOLLARS
+
+    for word in text.split():
+        kind, value = vocabulary.get(word, (None, None))
+        if kind is None:
+            raise ValueError(f"'{word}' is not a word I know, in '{text}'")
+
+        if stage == DOLLARS:
+            if kind == NUMBER and group is None:
+                group, after_hundred = value, False
+            elif kind == NUMBER and after_hundred and group % 100 == 0 and value:
+                group += value
+            elif kind == HUNDRED and group is not None and 1 <= group <= 9 and not after_hundred:
+                group, after_hundred = group * 100, True
+            elif kind == SCALE and group and value < smallest_scale:
+                dollars += group * 1000 ** value
+                smallest_scale, group, anded = value, None, False
+            elif kind == AND and group is None and dollars and not anded:
+                anded = True
+            elif kind == DOLLAR and (group or (group == 0 and not dollars) or (group is None and dollars and not anded)):
+                # Like wordify(), the label follows the last group only: "one thousand and one dollar"
+                if dollar_range["plural"] and value != (group != 1):
+                    raise ValueError(f"'{word}' has the wrong plural in '{text}'")
+                dollars += group or 0
+                stage = LABELLED
+            else:
+                raise ValueError(f"'{word}' is out of place in '{text}'")
+        elif stage == LABELLED and kind == AND:
+            stage = CENTS
+        elif stage == CENTS and kind == NUMBER and 0 < value < 100:
+            cents, stage = value, CENTS_LABEL
+        elif stage == CENTS_LABEL and kind == CENT:
+            if cent_range["plural"] and value != (cents != 1):
+                raise ValueError(f"'{word}' has the wrong plural in '{text}'")
+            stage = DONE
+        else:
+            raise ValueError(f"'{word}' is out of place in '{text}'")
+
+    if stage not in (LABELLED, DONE):
+        raise ValueError(f"'{text}' is not a complete amount")
+
+    number = dollars * 100 + cents
+    if strict and centsToWord(number) != " ".join(text.split()):
+        raise ValueError(f"'{text}' is not how wordify() writes {number // 100}.{number % 100:02}")
+    return number
+
+
+def roundtrip(count, seed=2023, max_digits=30):
+    """ Check that unwordify(wordify(amount)) gives back the amount, for `count` random amounts
+
+        Amounts have 1 to `max_digits` digits of dollars, and always carry cents.
+        Returns (failed amounts, seconds spent converting both ways)
+    """
+
+    rng = random.Random(seed)
+    amounts = [f"${rng.randrange(10 ** rng.randint(1, max_digits)):,}.{rng.randrange(100):02}" for _ in range(count)]
+
+    failures = []
+    start = time.perf_counter()
+    for amount in amounts:
+        try:
+            if unwordify(wordify(amount)) != parse_amount(amount):
+                failures.append(amount)
+        except ValueError:
+            failures.append(amount)
+    return failures, time.perf_counter() - start
+
+
+def main(argv=None):
+    import argparse
+
+    from wordify.cli import input_lines, open_output
+
+    parser = argparse.ArgumentParser(
+        prog="python -m wordify.unwordify",
+        description="Turn english words (one amount per line) back into amounts, or round-trip check wordify().",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="file to read words from (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="file to write amounts to (default: stdout)")
+    parser.add_argument("--rejects", default="-",
+                        help="file to write lines that could not be converted to (default: stderr)")
+    parser.add_argument("--strict", action="store_true", help="only accept text exactly as wordify() writes it")
+    parser.add_argument("--roundtrip", type=int, metavar="COUNT",
+                        help="instead of reading input, check unwordify(wordify(x)) == x for COUNT random amounts")
+    parser.add_argument("--seed", type=int, default=2023, help="random seed for --roundtrip (default: 2023)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't report rows/sec when finished")
+    args = parser.parse_args(argv)
+
+    if args.roundtrip is not None:
+        failures, elapsed = roundtrip(args.roundtrip, args.seed)
+        for amount in failures:
+            print(f"round trip failed for {amount}", file=sys.stderr)
+        print(f"{args.roundtrip} amounts round-tripped in {elapsed:.2f}s "
+              f"({args.roundtrip / elapsed if elapsed else 0:,.0f} amounts/sec): {len(failures)} failed",
+              file=sys.stderr)
+        return 1 if failures else 0
+
+    converted = rejected = 0
+    start = time.perf_counter()
+    with open_output(args.output, sys.stdout) as output, open_output(args.rejects, sys.stderr) as rejects:
+        for line_number, line in enumerate(input_lines(args.input), start=1):
+            try:
+                cents = unwordify(line, args.strict)
+            except ValueError as error:
+                rejects.write(f"{line_number}\t{line}\t{error}\n")
+                rejected += 1
+                continue
+            output.write(f"{cents // 100}.{cents % 100:02}\n")
+            converted += 1
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        rows = converted + rejected
+        print(f"{rows} rows in {elapsed:.2f}s ({rows / elapsed if elapsed else 0:,.0f} rows/sec): "
+              f"{converted} converted, {rejected} rejected", file=sys.stderr)
+    return 1 if rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
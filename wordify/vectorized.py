@@ -0,0 +1,102 @@
+# wordify for NumPy arrays
+#
+# Upstream data often arrives as NumPy int64 arrays of cents.  wordify_cents() converts a whole array
+# without turning each element into a string first: the range pieces are split out with vectorized
+# integer math over the whole array, every piece's words are looked up from the precomputed word tables
+# with a single gather per range, and each element's pieces are joined with one str.join.
+#
+# NumPy is optional; without it (or for plain Python sequences) wordify_cents() just loops over centsToWord().
+from wordify.core import cent_label, cent_limit, cent_words, centsToWord, dollar_label, dollar_words, int_words, scales
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy is optional
+    numpy = None
+
+# Arrays hold int64 cents, so only the three-digit groups of dollars that fit in one take part
+array_groups = 1
+while 100 * 1000 ** (array_groups + 1) <= 2 ** 63:
+    array_groups += 1
+array_limit = 100 * 1000 ** array_groups
+
+# The word tables as object arrays, built the first time an array is converted:
+# one (upper, lower, words, " words", " and words", words for an empty piece, " label") row per range, largest first
+_array_ranges = None
+
+
+def _build_array_ranges():
+    global _array_ranges
+
+    if _array_ranges is None:
+        # (upper, lower, words for every piece with its label attached, label on its own, mandatory)
+        cent_ranges = [
+            (100 * 1000 ** (group + 1), 100 * 1000 ** group,
+             tuple(f"{words} {scales[group - 1]}" for words in int_words), scales[group - 1], False)
+            for group in range(array_groups - 1, 0, -1)
+        ]
+        cent_ranges.append((100_000, 100, dollar_words, dollar_label, True))
+        cent_ranges.append((100, 1, cent_words, cent_label, False))
+
+        array_ranges = []
+        for upper, lower, piece_words, label, mandatory in cent_ranges:
+            plain = numpy.array(piece_words, dtype=object)
+            array_ranges.append((
+                upper,
+                lower,
+                plain,
+                numpy.array([" " + words for words in piece_words], dtype=object),
+                numpy.array([" and " + words for words in piece_words], dtype=object),
+                piece_words[0] if mandatory else "",
+                " " + label if mandatory else "",
+            ))
+        _array_ranges = tuple(array_ranges)
+    return _array_ranges
+
+
+def wordify_cents(cents):
+    """ Convert whole numbers of cents to english words
+
+        Accepts a NumPy integer array (any shape; converted flat, below array_limit) or any sequence of ints
+        (below cent_limit).
+        Returns a list of strings, exactly as centsToWord() would give for each element.
+    """
+
+    if numpy is None or not isinstance(cents, numpy.ndarray):
+        limit = cent_limit
+        for index, number in enumerate(cents):
+            if not 0 <= number < limit:
+                raise ValueError(f"cents[{index}] = {number} is out of range; only 0 - {limit - 1} is allowed!")
+        return [centsToWord(int(number)) for number in cents]
+
+    if cents.dtype.kind not in "iu":
+        raise TypeError(f"Expected an array of whole cents, not {cents.dtype}!")
+    cents = cents.ravel().astype(numpy.int64, copy=False)
+    limit = array_limit
+    bad = numpy.flatnonzero((cents < 0) | (cents >= limit))
+    if bad.size:
+        raise ValueError(f"cents[{bad[0]}] = {cents[bad[0]]} is out of range; only 0 - {limit - 1} is allowed!")
+
+    segments = []
+    before = None
+    for upper, lower, plain, spaced, anded, empty_first, empty_after in _build_array_ranges():
+        piece = (cents % upper) // lower
+        has_piece = piece != 0
+
+        if before is None:
+            # Nothing comes before the first range
+            segments.append(numpy.where(has_piece, plain[piece], empty_first))
+            before = has_piece
+        else:
+            # "and" goes before the last non-zero piece, same as centsToWord()
+            joined = numpy.where(cents % lower == 0, anded[piece], spaced[piece])
+            segments.append(numpy.where(
+                has_piece,
+                numpy.where(before, joined, plain[piece]),
+                numpy.where(before, empty_after, empty_first),
+            ))
+            before = before | has_piece
+        if empty_first:
+            before = numpy.ones(cents.shape, dtype=bool)
+
+    # One C-level join per element; no Python code runs per element
+    return list(map("".join, zip(*(segment.tolist() for segment in segments))))
@@ -0,0 +1,86 @@
+# wordify straight into a buffer
+#
+# wordify_into() writes the words for an amount straight into a text file, io.StringIO or bytearray, in one
+# write, instead of handing back a string for the caller to copy again.  The words come from the same
+# amountPieces() walk as wordify(); wordify_bytes_into() walks tables that are already ASCII bytes, so
+# nothing gets encoded per amount.
+#
+#   buffer = io.StringIO()
+#   wordify_into(buffer, "$1,001")            # buffer now holds "one thousand and one dollar"
+#
+#   out = bytearray()
+#   wordify_bytes_into(out, "$9.99")          # pre-encoded ASCII, no .encode() needed
+#   out += b"\n"
+from wordify.core import (
+    amount_error,
+    amountPieces,
+    cent_words,
+    dollar_label,
+    dollar_words,
+    int_words,
+    ParseError,
+    parse_amount,
+    scales,
+)
+
+
+def build_tables(encode):
+    """ amountPieces()' word tables for dollars and cents, each entry passed through `encode` once
+
+        Returns (unit words, unit label, subunit words, number words, scale words, "and"), in the order
+        amountPieces() takes them.
+    """
+
+    return (
+        tuple(encode(words) for words in dollar_words),
+        encode(dollar_label),
+        tuple(encode(words) for words in cent_words),
+        tuple(encode(words) for words in int_words),
+        tuple(encode(scale) for scale in scales),
+        encode("and"),
+    )
+
+
+text_tables = build_tables(str)
+ascii_tables = build_tables(lambda words: words.encode("ascii"))
+
+
+def write_cents(write, cents, tables, separator):
+    """ Call `write` once with the words for a whole number of cents, from `tables`, joined by `separator`
+
+        Writes exactly what centsToWord() returns.
+    """
+
+    dollars, cents = divmod(cents, 100)
+    pieces = []
+    amountPieces(dollars, cents, pieces, *tables)
+    write(separator.join(pieces))
+
+
+def wordify_into(buffer, numberstring):
+    """ Write the words for an amount into `buffer`, restricted exactly as for wordify()
+
+        `buffer` is anything with a text write() (a text file, io.StringIO), or a bytearray, which gets
+        the ASCII bytes.  Raises what wordify() raises, before writing anything.
+    """
+
+    cents = parse_amount(numberstring)
+    if cents.__class__ is ParseError:
+        raise amount_error(cents, numberstring)
+    if buffer.__class__ is bytearray:
+        write_cents(buffer.extend, cents, ascii_tables, b" ")
+    else:
+        write_cents(buffer.write, cents, text_tables, " ")
+
+
+def wordify_bytes_into(buffer, numberstring):
+    """ Write the words for an amount, as ASCII bytes, into `buffer`, restricted exactly as for wordify()
+
+        `buffer` is a bytearray, or anything with a binary write() (a file opened "wb", io.BytesIO).
+        Raises what wordify() raises, before writing anything.
+    """
+
+    cents = parse_amount(numberstring)
+    if cents.__class__ is ParseError:
+        raise amount_error(cents, numberstring)
+    write_cents(buffer.extend if buffer.__class__ is bytearray else buffer.write, cents, ascii_tables, b" ")